@@ -1,3 +1,4 @@
+import sys
 import asyncio
 from socket import AF_INET, SOCK_STREAM, SOL_SOCKET, SO_REUSEADDR, IPPROTO_TCP, TCP_NODELAY, \
                    socket
@@ -34,9 +35,15 @@ async def echo_client(loop, client):
 
 
 if __name__ == '__main__':
+    if '--shakti' in sys.argv:  # same code, `io_uring` backed event loop
+        from shakti import EventLoopPolicy
+        asyncio.set_event_loop_policy(EventLoopPolicy())
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     loop.set_debug(False)
-    loop.create_task(echo_server(loop, ('127.0.0.1', 12345)))
+    port = int(args[0]) if (args := [i for i in sys.argv[1:] if i[:2] != '--']) else 12345
+    loop.create_task(echo_server(loop, ('127.0.0.1', port)))
     loop.run_forever()
     # e.g: `siege -b -c100 -r100 --delay=1 http://127.0.0.1:12345/`
+    #      `python asyncio_bench.py --shakti`
+    #      `python asyncio_bench.py 8080 --shakti`  # port
@@ -0,0 +1,314 @@
+'''
+    End-to-End Benchmark - starts each server variant in its own process & drives it with
+    Shakti based load generator over loopback.
+
+    Example
+        python example/bench/bench.py                          # all servers, modes & loads
+        python example/bench/bench.py --server shakti asyncio --mode keep-alive -o new.json
+        python example/bench/bench.py --compare old.json new.json
+
+    Load
+        closed  # `concurrency` clients, each sends next request once previous is answered.
+        open    # requests are sent at fixed `rate`, latency is measured from time request was
+                # scheduled, so server that falls behind is not hidden (coordinated omission).
+
+    Mode
+        keep-alive  # connection is reused for every request
+        close       # new connection per request, latency includes `connect()`
+
+    Note
+        - Result is printed as JSON, keys are sorted so two runs can be diffed.
+        - Latency is in millisecond, throughput is answered requests per second.
+        - Failed or timed out request is counted in `errors`, not in latency.
+        - Sync Python server handles single connection at a time, with `keep-alive` others wait
+        till it's closed & time out.
+'''
+import os
+import sys
+import json
+import math
+import time
+import platform
+import argparse
+import subprocess
+import socket as _socket
+from shakti import ConnectionPool, run, task, sleep, socket, connect, close, recv, sendall, \
+                   __version__
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SERVERS = {
+    'shakti':           ['shakti_bench.py'],
+    'shakti-http':      ['shakti_http_bench.py'],
+    'asyncio':          ['asyncio_bench.py'],
+    'asyncio-shakti':   ['asyncio_bench.py', '--shakti'],
+    'sync':             ['python_bench.py'],
+}
+MODES = ('keep-alive', 'close')
+LOADS = ('closed', 'open')
+REQUEST = b'GET / HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n'
+
+
+class Result:
+
+    def __init__(self):
+        self.latency = []  # second
+        self.errors = 0
+        self.pending = 0
+
+    def report(self, elapsed):
+        latency = sorted(self.latency)
+        return {
+            'requests': len(latency),
+            'errors': self.errors,
+            'throughput': round(len(latency) / elapsed, 1),
+            'latency': {
+                'mean': round(sum(latency) / len(latency) * 1000, 3) if latency else None,
+                'p50': percentile(latency, .5),
+                'p99': percentile(latency, .99),
+                'p999': percentile(latency, .999),
+                'max': percentile(latency, 1),
+            },
+        }
+
+
+def percentile(latency, q):
+    # nearest-rank, in millisecond
+    if not latency:
+        return None
+    return round(latency[max(math.ceil(q * len(latency)) - 1, 0)] * 1000, 3)
+
+
+async def exchange(sockfd, timeout):
+    ''' Send `REQUEST` & receive whole response '''
+    await sendall(sockfd, REQUEST, timeout=timeout)
+    data = b''
+    while (end := data.find(b'\r\n\r\n')) < 0:
+        data += await receive(sockfd, timeout)
+    length = 0
+    for line in data[:end].lower().split(b'\r\n'):
+        if line.startswith(b'content-length:'):
+            length = int(line[15:])
+    while len(data) < end + 4 + length:
+        data += await receive(sockfd, timeout)
+
+
+async def receive(sockfd, timeout):
+    if not (data := await recv(sockfd, 65536, timeout=timeout)):
+        raise ConnectionResetError('server closed connection')
+    return data
+
+
+async def open_connection(port, timeout):
+    sockfd = await socket()
+    try:
+        await connect(sockfd, '127.0.0.1', port, timeout=timeout)
+    except BaseException:
+        await close(sockfd)
+        raise
+    return sockfd
+
+
+async def closed_client(result, port, keep_alive, deadline, timeout):
+    sockfd = -1
+    try:
+        while (start := time.perf_counter()) < deadline:
+            try:
+                if sockfd < 0:
+                    sockfd = await open_connection(port, timeout)
+                await exchange(sockfd, timeout)
+            except OSError:  # includes `TimeoutError`
+                result.errors += 1
+                if sockfd > -1:
+                    await close(sockfd)
+                    sockfd = -1
+                continue
+            result.latency.append(time.perf_counter() - start)
+            if not keep_alive:
+                await close(sockfd)
+                sockfd = -1
+    finally:
+        if sockfd > -1:
+            await close(sockfd)
+        result.pending -= 1
+
+
+async def closed_loop(port, keep_alive, duration, concurrency, timeout, **_):
+    result = Result()
+    result.pending = concurrency
+    start = time.perf_counter()
+    for _ in range(concurrency):
+        await task(closed_client(result, port, keep_alive, start + duration, timeout))
+    while result.pending:
+        await sleep(.001)
+    return result, time.perf_counter() - start
+
+
+async def open_request(result, pool, port, keep_alive, scheduled, timeout):
+    try:
+        sockfd = await pool.acquire('127.0.0.1', port)
+        try:
+            await exchange(sockfd, timeout)
+        except BaseException:
+            await pool.release(sockfd, False)
+            raise
+        await pool.release(sockfd, keep_alive)
+        result.latency.append(time.perf_counter() - scheduled)
+    except OSError:
+        result.errors += 1
+    finally:
+        result.pending -= 1
+
+
+async def open_loop(port, keep_alive, duration, concurrency, timeout, rate, **_):
+    # note: `concurrency` caps open connections, requests beyond it queue in `pool` & their
+    #       wait counts as latency.
+    result = Result()
+    pool = ConnectionPool(concurrency, timeout=timeout, connect_timeout=timeout)
+    total = int(rate * duration)
+    index = 0
+    start = time.perf_counter()
+    while index < total:
+        current = time.perf_counter()
+        while index < total and (scheduled := start + index / rate) <= current:
+            result.pending += 1
+            await task(open_request(result, pool, port, keep_alive, scheduled, timeout))
+            index += 1
+        if index < total:
+            await sleep(max(start + index / rate - time.perf_counter(), 0))
+    while result.pending:
+        await sleep(.001)
+    elapsed = time.perf_counter() - start
+    await pool.close()
+    return result, elapsed
+
+
+def load(port, mode, kind, options):
+    report = {}
+
+    async def main():
+        # note: warm-up result is dropped, lets server & client reach steady state.
+        keep_alive = mode == 'keep-alive'
+        generator = closed_loop if kind == 'closed' else open_loop
+        if options['warmup']:
+            await generator(port, keep_alive, **dict(options, duration=options['warmup']))
+        result, elapsed = await generator(port, keep_alive, **options)
+        report.update(result.report(elapsed))
+
+    run(main(), entries=max(1024, options['concurrency'] * 4))
+    return report
+
+
+def start_server(name, port, timeout=10):
+    script, *args = SERVERS[name]
+    process = subprocess.Popen([sys.executable, os.path.join(HERE, script), str(port), *args],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _socket.create_connection(('127.0.0.1', port), .1).close()
+            return process
+        except OSError:
+            if process.poll() is not None or time.monotonic() > deadline:
+                stop_server(process)
+                raise RuntimeError(f'server {name!r} did not start on port {port}') from None
+            time.sleep(.05)
+
+
+def stop_server(process):
+    process.terminate()
+    try:
+        process.wait(5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def free_port():
+    with _socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'commit': commit,
+        'cpu': os.cpu_count(),
+        'kernel': platform.release(),
+        'python': platform.python_version(),
+        'shakti': __version__,
+    }
+
+
+def bench(servers, modes, loads, options):
+    results = []
+    for name in servers:
+        for mode in modes:
+            port = free_port()
+            process = start_server(name, port)
+            try:
+                for kind in loads:
+                    report = load(port, mode, kind, options)
+                    results.append({'server': name, 'mode': mode, 'load': kind, **report})
+                    print(f'{name:>15} {mode:>10} {kind:>6}: {report["throughput"]:>10} req/s  '
+                          f'p99 {report["latency"]["p99"]} ms  errors {report["errors"]}',
+                          file=sys.stderr)
+            finally:
+                stop_server(process)
+    return {'environment': environment(), 'options': options, 'results': results}
+
+
+def compare(old, new):
+    ''' Print change of throughput & p99 latency between two JSON reports '''
+    def key(i):
+        return i['server'], i['mode'], i['load']
+    before = {key(i): i for i in old['results']}
+    for after in new['results']:
+        if (base := before.get(key(after))) is None:
+            continue
+        line = ' '.join(f'{i:>15}' for i in key(after))
+        for name, value, previous in (
+            ('req/s', after['throughput'], base['throughput']),
+            ('p99', after['latency']['p99'], base['latency']['p99']),
+        ):
+            if value is not None and previous:
+                line += f'  {name} {previous} -> {value} ({(value - previous) / previous:+.1%})'
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1].strip())
+    parser.add_argument('--server', nargs='+', choices=SERVERS, default=list(SERVERS))
+    parser.add_argument('--mode', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--load', nargs='+', choices=LOADS, default=list(LOADS))
+    parser.add_argument('--duration', type=float, default=5, help='second, per run')
+    parser.add_argument('--warmup', type=float, default=1, help='second, before each run')
+    parser.add_argument('--concurrency', type=int, default=50, help='max open connections')
+    parser.add_argument('--rate', type=float, default=5000, help='request/second, open load')
+    parser.add_argument('--timeout', type=float, default=5, help='second, per request')
+    parser.add_argument('-o', '--output', help='write JSON to file instead of stdout')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='compare two JSON reports & exit')
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as old, open(args.compare[1]) as new:
+            return compare(json.load(old), json.load(new))
+    options = {'duration': args.duration, 'warmup': args.warmup,
+               'concurrency': args.concurrency, 'rate': args.rate, 'timeout': args.timeout}
+    report = json.dumps(bench(args.server, args.mode, args.load, options), indent=4,
+                        sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(report + '\n')
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
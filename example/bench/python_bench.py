@@ -1,3 +1,4 @@
+import sys
 import socket
 
 
@@ -32,5 +33,6 @@ def client_handler(client):
 
 
 if __name__ == '__main__':
-    echo_server('127.0.0.1', 12345)
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 12345
+    echo_server('127.0.0.1', port)
     # e.g: `siege -b -c100 -r100 --delay=1 http://127.0.0.1:12345/`
@@ -1,5 +1,6 @@
+import sys
 from shakti import SOL_SOCKET, SO_REUSEADDR, \
-                   run, task, socket, setsockopt, bind, listen, accept, close, recv, sendall
+                   run, task, socket, setsockopt, bind, listen, accept_many, close, recv, sendall
 
 
 LISTEN = 1024
@@ -20,7 +21,7 @@ async def echo_server(host, port):
         await setsockopt(server_fd, SOL_SOCKET, SO_REUSEADDR, True)
         await bind(server_fd, host, port)
         await listen(server_fd, LISTEN)
-        while client_fd := await accept(server_fd):
+        async for client_fd in accept_many(server_fd):
             await task(client_handler(client_fd))
     finally:
         await close(server_fd)
@@ -34,5 +35,6 @@ async def client_handler(client_fd):
 
 
 if __name__ == '__main__':
-    run(echo_server('127.0.0.1', 12345))
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 12345
+    run(echo_server('127.0.0.1', port), mode='throughput')
     # e.g: `siege -b -c100 -r100 --delay=1 http://127.0.0.1:12345/`
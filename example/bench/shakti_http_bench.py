@@ -0,0 +1,26 @@
+import sys
+from shakti import HTTPServer, HTTPResponse, run
+
+
+BODY = b'<!DOCTYPE html><html><head><title>Hello</title></head>'
+BODY += b'<body style="background-color:#151515;color:#ccc;">'
+BODY += b'Hello world!</body></html>'
+HEADERS = [('Content-Type', 'text/html')]
+
+
+async def hello(request):
+    return HTTPResponse(BODY, headers=HEADERS)
+
+
+async def http_server(host, port):
+    print('Starting Shakti HTTP Server')
+    try:
+        await HTTPServer(hello).serve(host, port)
+    finally:
+        print('Closed Shakti HTTP Server')
+
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 12345
+    run(http_server('127.0.0.1', port), mode='throughput')
+    # e.g: `siege -b -c100 -r100 --delay=1 http://127.0.0.1:12345/`
@@ -0,0 +1,66 @@
+from cpython.object cimport PyObject
+from cpython.ref cimport Py_XINCREF, Py_XDECREF
+from libc.errno cimport ETIME, EINTR
+from libc.string cimport strerror
+from liburing.lib.type cimport __s32, __u64, uintptr_t, __iovec
+from liburing.lib.socket cimport __AF_INET, __AF_INET6, __AF_UNIX, __INET6_ADDRSTRLEN, \
+                                 __sockaddr_storage, __sockaddr_in, __sockaddr_in6, \
+                                 __sockaddr_un, __msghdr, __inet_ntop, __ntohs, __ntohl
+from liburing.lib.uring cimport __io_uring_prep_recvmsg
+from liburing.lib.uring cimport __io_uring_params
+from liburing.common cimport IORING_ASYNC_CANCEL_ANY
+from liburing.queue cimport io_uring, io_uring_params, io_uring_queue_init_params, \
+                            io_uring_queue_exit, io_uring_submit, io_uring_cqe, \
+                            io_uring_submit_and_wait, io_uring_submit_and_wait_timeout, sigset, \
+                            io_uring_cq_ready, io_uring_cq_advance, io_uring_for_each_cqe, \
+                            io_uring_sqe_set_data64, io_uring_prep_cancel64, io_uring_sqe
+from liburing.time cimport timespec
+from liburing.socket cimport sockaddr, io_uring_prep_recv, io_uring_prep_send, \
+                             io_uring_prep_sendto, io_uring_prep_accept, io_uring_prep_connect
+from liburing.helper cimport io_uring_put_sqe
+from ..event.entry cimport ECANCELED, SQE
+from ..event.run cimport __setup
+
+
+cpdef enum OPERATION:
+    OP_RECV = 1
+    OP_RECV_INTO
+    OP_SEND
+    OP_SENDTO
+    OP_ACCEPT
+    OP_CONNECT
+    OP_RECVFROM
+    OP_RECVFROM_INTO
+
+
+cdef class Message:
+    cdef:
+        __msghdr            msg
+        __iovec             iov
+        __sockaddr_storage  name
+
+    cdef object address(self)
+
+
+cdef class Operation(SQE):
+    cdef:
+        Proactor        proactor
+        object          future, sock, buffer
+        memoryview      view
+        unsigned int    offset
+        OPERATION       op
+
+    cdef void complete(self, __s32 result)
+
+
+cdef class Proactor:
+    cdef:
+        io_uring            ring
+        object              loop
+        io_uring_cqe        cqe
+        sigset              sigmask
+        timespec            ts
+        readonly unsigned int   inflight
+
+    cdef object submit(self, Operation op)
+    cdef unsigned int process(self)
@@ -0,0 +1,373 @@
+from os import fsdecode as _fsdecode
+from socket import socket as _socket, AF_INET as _AF_INET, AF_INET6 as _AF_INET6, \
+                   AF_UNIX as _AF_UNIX, SOCK_NONBLOCK as _SOCK_NONBLOCK, \
+                   SOCK_CLOEXEC as _SOCK_CLOEXEC, MSG_WAITALL as _MSG_WAITALL
+from asyncio import Future as _Future
+from asyncio.events import BaseDefaultEventLoopPolicy as _BaseDefaultEventLoopPolicy
+from asyncio.exceptions import SendfileNotAvailableError as _SendfileNotAvailableError
+from asyncio.proactor_events import BaseProactorEventLoop as _BaseProactorEventLoop, \
+                                    _ProactorDatagramTransport
+
+
+class OperationFuture(_Future):
+    ''' Future of in-flight ring entry, cancelling it also cancels the entry. '''
+
+    def __init__(self, Operation op, *, loop):
+        super().__init__(loop=loop)
+        self._op = op
+
+    def cancel(self, msg=None):
+        cdef Operation op = self._op
+        if not self.done() and op.proactor is not None and op.proactor.ring is not None:
+            op.cancel(op.proactor.ring)
+        return super().cancel(msg)
+
+
+cdef class Operation(SQE):
+    ''' Proactor Entry
+
+        Note
+            - Holds `future`, socket and buffer alive while entry is in ring.
+    '''
+    def __init__(self):
+        super().__init__(1, False)
+
+    cdef void complete(self, __s32 result):
+        cdef object future = self.future
+
+        self.proactor.inflight -= 1
+        if future.done():  # cancelled
+            if self.op == OP_ACCEPT and result > -1:
+                _socket(fileno=result).close()  # accepted while being cancelled, don't leak.
+        elif result < 0:
+            if result != -ECANCELED:
+                future.set_exception(OSError(-result, strerror(-result).decode()))
+            elif not future.cancelled():
+                future.cancel()
+        elif self.op == OP_RECV:
+            future.set_result(bytes(self.view[:result] if result != len(self.view) else self.view))
+        elif self.op == OP_RECV_INTO:
+            future.set_result(result)
+        elif self.op == OP_RECVFROM:
+            future.set_result((bytes(self.view[:result] if result != len(self.view) else self.view),
+                               (<Message>self.buffer).address()))
+        elif self.op == OP_RECVFROM_INTO:
+            future.set_result((result, (<Message>self.buffer).address()))
+        elif self.op == OP_SEND:
+            self.offset += result
+            if self.offset < len(self.view):
+                # partial send, put rest of data back into ring.
+                io_uring_prep_send(self, self.sock.fileno(), self.view[self.offset:],
+                                   len(self.view) - self.offset, _MSG_WAITALL)
+                self.proactor.submit(self)
+                return
+            future.set_result(self.offset)
+        elif self.op == OP_SENDTO:
+            future.set_result(result)
+        elif self.op == OP_ACCEPT:
+            conn = _socket(fileno=result)
+            try:
+                address = conn.getpeername()
+            except OSError as e:  # note: peer can disconnect right after being accepted.
+                conn.close()
+                future.set_exception(e)
+            else:
+                future.set_result((conn, address))
+        else:  # OP_CONNECT
+            future.set_result(None)
+        self.future = self.sock = self.buffer = self.view = None
+
+
+cdef class Message:
+    ''' Receive Message Header, `msghdr` with room for single buffer & source address '''
+
+    def __init__(self, unsigned char[::1] buffer not None):
+        # note: memory of `buffer` is kept alive by entry, e.g. `Operation.view`.
+        self.iov.iov_base = &buffer[0] if len(buffer) else NULL
+        self.iov.iov_len = len(buffer)
+        self.msg.msg_iov = &self.iov
+        self.msg.msg_iovlen = 1
+        self.msg.msg_name = &self.name
+        self.msg.msg_namelen = sizeof(__sockaddr_storage)
+        self.name.ss_family = 0
+
+    cdef object address(self):
+        # note: same form as `socket.recvfrom()` returns, `None` if sender has no address.
+        cdef:
+            char            ip[__INET6_ADDRSTRLEN]
+            __sockaddr_in*  sin = <__sockaddr_in*>&self.name
+            __sockaddr_in6* sin6 = <__sockaddr_in6*>&self.name
+            __sockaddr_un*  sun = <__sockaddr_un*>&self.name
+            size_t          length
+        if not self.msg.msg_namelen:
+            return None
+        elif self.name.ss_family == __AF_INET:
+            __inet_ntop(__AF_INET, &sin.sin_addr, ip, __INET6_ADDRSTRLEN)
+            return ip.decode(), __ntohs(sin.sin_port)
+        elif self.name.ss_family == __AF_INET6:
+            __inet_ntop(__AF_INET6, &sin6.sin6_addr, ip, __INET6_ADDRSTRLEN)
+            return ip.decode(), __ntohs(sin6.sin6_port), __ntohl(sin6.sin6_flowinfo), \
+                sin6.sin6_scope_id
+        elif self.name.ss_family == __AF_UNIX:
+            length = self.msg.msg_namelen - (<size_t>&sun.sun_path - <size_t>sun)
+            if length and not sun.sun_path[0]:
+                return sun.sun_path[:length]  # abstract namespace, `bytes`
+            return _fsdecode(sun.sun_path[:length].split(b'\0', 1)[0])
+        return None
+
+
+cdef sockaddr __sockaddr(int family, object address):
+    if family == _AF_UNIX:
+        return sockaddr(family, address.encode() if isinstance(address, str) else address)
+    return sockaddr(family, address[0].encode(), address[1])
+
+
+cdef class Proactor:
+
+    def __init__(self, unsigned int entries=1024, *, unicode mode=None, unsigned int flags=0):
+        ''' Proactor - completion based I/O for asyncio backed by `io_uring`
+
+            Type
+                entries:    int
+                mode:       str     # same ring setup profile as `run(mode)`
+                flags:      int     # extra `IORING_SETUP_*` flags
+                return:     None
+
+            Note
+                - Used by `EventLoop`, each operation returns `OperationFuture`.
+        '''
+        cdef:
+            io_uring_params     params = io_uring_params()
+            __io_uring_params   _params
+
+        __setup(&_params, mode, entries, flags, 1, -1, (), 0)
+        self.ring = io_uring()
+        params.ptr = &_params
+        try:
+            io_uring_queue_init_params(entries, self.ring, params)
+        finally:
+            params.ptr = NULL
+        self.cqe = io_uring_cqe()
+        self.sigmask = sigset()
+        self.ts = timespec()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} inflight={self.inflight}>'
+
+    def set_loop(self, loop):
+        self.loop = loop
+
+    cdef object submit(self, Operation op):
+        if op.future is None:
+            op.proactor = self
+            op.future = OperationFuture(op, loop=self.loop)
+        io_uring_sqe_set_data64(op, <__u64><void*>op)
+        if not io_uring_put_sqe(self.ring, op):
+            io_uring_submit(self.ring)
+            io_uring_put_sqe(self.ring, op)
+        Py_XINCREF(<PyObject*>op)  # note: ring holds reference while entry is in-flight.
+        self.inflight += 1
+        return op.future
+
+    def recv(self, sock, unsigned int nbytes, int flags=0):
+        cdef Operation op = Operation()
+        op.op = OP_RECV
+        op.sock = sock
+        op.view = memoryview(bytearray(nbytes))
+        io_uring_prep_recv(op, sock.fileno(), op.view, nbytes, flags)
+        return self.submit(op)
+
+    def recv_into(self, sock, buffer, int flags=0):
+        cdef Operation op = Operation()
+        op.op = OP_RECV_INTO
+        op.sock = sock
+        op.view = memoryview(buffer).cast('B')
+        io_uring_prep_recv(op, sock.fileno(), op.view, len(op.view), flags)
+        return self.submit(op)
+
+    def recvfrom(self, sock, unsigned int nbytes, int flags=0):
+        cdef Operation op = Operation()
+        op.op = OP_RECVFROM
+        op.sock = sock
+        op.view = memoryview(bytearray(nbytes))
+        op.buffer = Message(op.view)
+        __io_uring_prep_recvmsg(op.ptr, sock.fileno(), &(<Message>op.buffer).msg, flags)
+        return self.submit(op)
+
+    def recvfrom_into(self, sock, buffer, unsigned int nbytes=0, int flags=0):
+        cdef Operation op = Operation()
+        op.op = OP_RECVFROM_INTO
+        op.sock = sock
+        op.view = memoryview(buffer).cast('B')
+        if nbytes:
+            op.view = op.view[:nbytes]
+        op.buffer = Message(op.view)
+        __io_uring_prep_recvmsg(op.ptr, sock.fileno(), &(<Message>op.buffer).msg, flags)
+        return self.submit(op)
+
+    def send(self, sock, data, int flags=0):
+        cdef Operation op = Operation()
+        op.op = OP_SEND
+        op.sock = sock
+        op.view = memoryview(data).cast('B')
+        # note: `MSG_WAITALL` lets kernel retry short send, anything left is re-submitted.
+        io_uring_prep_send(op, sock.fileno(), op.view, len(op.view), flags | _MSG_WAITALL)
+        return self.submit(op)
+
+    def sendto(self, sock, data, int flags=0, addr=None):
+        # note: `addr` is keyword used by `asyncio` datagram transport.
+        cdef Operation op = Operation()
+        op.op = OP_SENDTO
+        op.sock = sock
+        op.view = memoryview(data).cast('B')
+        if addr is None:
+            io_uring_prep_send(op, sock.fileno(), op.view, len(op.view), flags)
+        else:
+            op.buffer = __sockaddr(sock.family, addr)
+            io_uring_prep_sendto(op, sock.fileno(), op.view, len(op.view), op.buffer, flags)
+        return self.submit(op)
+
+    def accept(self, listener):
+        cdef Operation op = Operation()
+        op.op = OP_ACCEPT
+        op.sock = listener
+        io_uring_prep_accept(op, listener.fileno(), None, _SOCK_NONBLOCK | _SOCK_CLOEXEC)
+        return self.submit(op)
+
+    def connect(self, sock, address):
+        cdef Operation op = Operation()
+        op.op = OP_CONNECT
+        op.sock = sock
+        op.buffer = __sockaddr(sock.family, address)
+        io_uring_prep_connect(op, sock.fileno(), op.buffer)
+        return self.submit(op)
+
+    def sendfile(self, sock, file, offset, count):
+        raise _SendfileNotAvailableError('`Proactor.sendfile()` is not supported')
+
+    def _stop_serving(self, sock):
+        pass  # note: `EventLoop` cancels pending `accept` future, which cancels its entry.
+
+    def select(self, timeout=None):
+        ''' Submit & wait for completions, up to `timeout` second.
+
+            Note
+                - Futures are resolved here, its callbacks are scheduled with `loop.call_soon`.
+        '''
+        if self.ring is None:
+            return []
+        cdef bint ready = self.ring.ptr.sq.sqe_tail != self.ring.ptr.sq.sqe_head
+        try:
+            if io_uring_cq_ready(self.ring) or (timeout is not None and timeout <= 0):
+                if ready:
+                    io_uring_submit(self.ring)
+            elif timeout is None:
+                with nogil:
+                    io_uring_submit_and_wait(self.ring, 1)
+            else:
+                self.ts.ptr.tv_sec = <long long>timeout
+                self.ts.ptr.tv_nsec = <long long>((timeout - <long long>timeout) * 1_000_000_000)
+                with nogil:
+                    io_uring_submit_and_wait_timeout(self.ring, self.cqe, 1, self.ts, self.sigmask)
+        except OSError as e:
+            if e.errno not in (ETIME, EINTR):
+                raise
+        self.process()
+        return []
+
+    cdef unsigned int process(self):
+        cdef:
+            __s32           res
+            __u64           user_data
+            PyObject*       ptr
+            Operation       op
+            unsigned int    index, cq_ready
+
+        if cq_ready := io_uring_for_each_cqe(self.ring, self.cqe):
+            for index in range(cq_ready):
+                res, user_data = self.cqe.get_index(index)
+                if not user_data:
+                    continue  # cancel entry
+                ptr = <PyObject*><uintptr_t>user_data
+                op = <Operation>ptr
+                Py_XDECREF(ptr)
+                op.complete(res)
+            io_uring_cq_advance(self.ring, cq_ready)
+        return cq_ready
+
+    def close(self):
+        ''' Cancel all in-flight entries, wait for them to complete & close ring '''
+        cdef io_uring_sqe sqe
+        if self.ring is None:
+            return
+        if self.inflight:
+            sqe = io_uring_sqe()
+            io_uring_prep_cancel64(sqe, 0, IORING_ASYNC_CANCEL_ANY)
+            io_uring_sqe_set_data64(sqe, 0)
+            io_uring_put_sqe(self.ring, sqe)
+            while self.inflight:
+                self.select(1)
+        io_uring_queue_exit(self.ring)
+        self.ring = None
+
+
+class _DatagramTransport(_ProactorDatagramTransport):
+
+    def _call_connection_lost(self, exc):
+        # note: `shutdown()` of unconnected datagram socket raises `ENOTCONN` on Linux, closed
+        #       socket is skipped by it.
+        if self._address is None and self._sock is not None:
+            self._sock.close()
+        super()._call_connection_lost(exc)
+
+
+class EventLoop(_BaseProactorEventLoop):
+    ''' asyncio Event Loop backed by `io_uring`
+
+        Example
+            >>> import asyncio
+            >>> from shakti import EventLoopPolicy
+            ...
+            >>> asyncio.set_event_loop_policy(EventLoopPolicy())
+            >>> asyncio.run(main())
+
+            # or
+            >>> loop = EventLoop(mode='latency')
+            >>> loop.run_until_complete(main())
+
+        Note
+            - `call_soon`, `call_later`, `run_in_executor`, ... are from `asyncio` itself.
+            - `sock_*`, `create_server`, `open_connection`, ... I/O is done through `io_uring`.
+            - `sendfile` is not supported yet.
+    '''
+    def __init__(self, unsigned int entries=1024, *, unicode mode=None, unsigned int flags=0):
+        super().__init__(Proactor(entries, mode=mode, flags=flags))
+
+    def run_forever(self):
+        try:  # note: self-pipe read wakes up loop for `call_soon_threadsafe`, signal, ...
+            self.call_soon(self._loop_self_reading)
+            super().run_forever()
+        finally:
+            if self._self_reading_future is not None:
+                self._self_reading_future.cancel()  # also cancels its entry
+                self._self_reading_future = None
+
+    def _make_datagram_transport(self, sock, protocol, address=None, waiter=None, extra=None):
+        return _DatagramTransport(self, sock, protocol, address, waiter, extra)
+
+    async def sock_connect(self, sock, address):
+        if sock.family in (_AF_INET, _AF_INET6):
+            resolved = await self._ensure_resolved(address, family=sock.family, type=sock.type,
+                                                   proto=sock.proto, loop=self)
+            address = resolved[0][4]
+        return await self._proactor.connect(sock, address)
+
+
+class EventLoopPolicy(_BaseDefaultEventLoopPolicy):
+    ''' asyncio Event Loop Policy
+
+        Example
+            >>> asyncio.set_event_loop_policy(EventLoopPolicy())
+            >>> asyncio.run(main())  # runs on `EventLoop`
+    '''
+    _loop_factory = EventLoop
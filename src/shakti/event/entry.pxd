@@ -1,11 +1,20 @@
 from cpython.object cimport PyObject
 from cpython.ref cimport Py_XINCREF
-from liburing.lib.type cimport __u8, __u16, __s32, __u64
+from libc.string cimport memset, memcpy
+from libc.errno cimport ETIMEDOUT, errno
+from liburing.lib.type cimport int64_t
+from liburing.lib.uring cimport __io_uring_sqe
+from liburing.lib.type cimport __u8, __u16, __s32, __u32, __u64
 from liburing.queue cimport IOSQE_ASYNC, IOSQE_IO_HARDLINK, IOSQE_IO_LINK, \
                             io_uring_sqe_set_flags, io_uring_sqe_set_data64, io_uring_sqe, \
-                            io_uring_prep_nop
+                            io_uring_prep_nop, io_uring_prep_cancel64, io_uring
 from liburing.helper cimport io_uring_put_sqe
 from liburing.error cimport trap_error, index_error
+from liburing.time cimport timespec, io_uring_prep_link_timeout
+
+
+cdef extern from '<errno.h>' nogil:
+    enum: ECANCELED  # note: not defined in `libc.errno`
 
 
 cpdef enum JOBS:
@@ -14,6 +23,8 @@ cpdef enum JOBS:
     RING    = 1U << 1   # 2
     ENTRY   = 1U << 2   # 3
     ENTRIES = 1U << 3   # 4
+    MULTI   = 1U << 4   # 5
+    TIMER   = 1U << 5   # 6
 
 
 cdef class SQE(io_uring_sqe):
@@ -24,6 +35,32 @@ cdef class SQE(io_uring_sqe):
         tuple           _coro
         unsigned int    flags, link_flag
         readonly __s32  result
+        readonly __u32  cqe_flags
+        # multishot
+        readonly bint   multishot, armed
+        object          pending, discard
+        # free-list
+        bint            pooled
+        # deadline
+        bint            timed
+        timespec        deadline
+        # stats
+        __u64           start
+
+    cdef bint cancel(self, io_uring ring) noexcept
+    cdef int drop(self, io_uring ring, object discard) except -1
+    cdef bint put(self, io_uring ring) noexcept
+
+
+cdef class FreeList:
+    cdef:
+        list                    entries
+        readonly unsigned int   maxsize, hit, miss
+
+
+cdef FreeList swap_free_list(FreeList free_list)
+cdef SQE new_sqe(__u16 num=?, bint error=?, double timeout=?)
+cdef void free_sqe(SQE sqe) noexcept
 
 
 # cpdef enum __entry_define__:
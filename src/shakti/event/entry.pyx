@@ -1,18 +1,21 @@
 from types import CoroutineType
+from collections import deque
 
 
 cdef class SQE(io_uring_sqe):
 
     # note: `num` is used by `io_uring_sqe`
     def __init__(self, __u16 num=1, bint error=True,
-                 *, unsigned int flags=0, unsigned int link_flag=IOSQE_IO_HARDLINK):
+                 *, unsigned int flags=0, unsigned int link_flag=IOSQE_IO_HARDLINK,
+                 bint multishot=False):
         ''' Shakti Queue Entry
 
             Type
                 num:        int  - number of entries to create
                 error:      bool - automatically raise error
                 flags:      int
-                link_flag: int
+                link_flag:  int
+                multishot:  bool - entry produces multiple results
                 return:     None
 
             Example
@@ -43,17 +46,35 @@ cdef class SQE(io_uring_sqe):
                 >>> SQE(123, False)  # or
                 >>> SQE(123, error=False)
 
+                # multishot
+                >>> sqe = SQE(multishot=True)
+                >>> io_uring_prep_multishot_accept(sqe, server_fd)
+                >>> while True:
+                ...     await sqe   # first `await` arms entry, rest collect next result.
+                ...     sqe.result  # client fd
+                5
+
             Note
                 - `SQE.user_data` is automatically set by `SQE()`.
                 - Multiple sqe's e.g: `SQE(2)` are linked using `IOSQE_IO_HARDLINK`
+                - `flags` of first entry applies to all linked entries, `sqe[i].flags` can be set
+                to add flags only to that entry e.g. `sqe[1].flags = IOSQE_FIXED_FILE`
                 - context manger runs await in `__aexit__` thus need to check result
                 outside of `aysnc with` block
+                - `multishot` entry stays armed in the ring after first `await`, results that
+                arrive while nothing is awaiting are queued for next `await`. If kernel stops
+                the multishot request, next `await` will re-arm it.
         '''
         self.error = error
         self.flags = flags
         if link_flag and not (link_flag & (IOSQE_IO_LINK | IOSQE_IO_HARDLINK)):
             raise ValueError('SQE(link_flag) must be `IOSQE_IO_HARDLINK` or `IOSQE_IO_LINK`')
         self.link_flag = link_flag
+        if multishot:
+            if num != 1:
+                raise ValueError('SQE(multishot) can only be used with single entry `num=1`')
+            self.pending = deque()
+        self.multishot = multishot
 
     def __getitem__(self, unsigned int index):
         cdef SQE sqe
@@ -76,13 +97,36 @@ cdef class SQE(io_uring_sqe):
             __u16   i
             object  r
 
-        if self.len:
-            if self.len == 1:  # single
+        if self.multishot:
+            if self.pending:  # result already arrived
+                self.result, self.cqe_flags = self.pending.popleft()
+                if self.error:
+                    trap_error(self.result)
+                return
+            self.coro = None
+            self.result = 0
+            if self.armed:
+                self.job = MULTI  # already in ring, wait for next result.
+            else:
+                self.job = ENTRY | MULTI
+                io_uring_sqe_set_flags(self, self.flags)
+                io_uring_sqe_set_data64(self, <__u64><void*>self)
+                Py_XINCREF(<PyObject*>self)  # note: ring holds reference while armed.
+                self.armed = True
+        elif self.len:
+            if self.len == 1 or self.timed:  # single
                 self.job = ENTRY
                 self.coro = None
                 self.result = 0
-                io_uring_sqe_set_flags(self, self.flags)
+                self.cqe_flags = 0
                 io_uring_sqe_set_data64(self, <__u64><void*>self)
+                if self.timed:  # linked timeout, submitted together with entry.
+                    io_uring_sqe_set_flags(self, self.flags | IOSQE_IO_LINK)
+                    sqe = self[1]
+                    io_uring_prep_link_timeout(sqe, self.deadline, 0)
+                    io_uring_sqe_set_data64(sqe, 0)  # note: `user_data=0` result is ignored.
+                else:
+                    io_uring_sqe_set_flags(self, self.flags)
             elif 1025 > self.len > 1:  # multiple
                 for i in range(self.len):
                     if not i:  # first
@@ -98,15 +142,19 @@ cdef class SQE(io_uring_sqe):
                         io_uring_sqe_set_data64(sqe, <__u64><void*>sqe)
                         if i < self.len-1:  # middle
                             sqe.job = NOJOB
-                            io_uring_sqe_set_flags(sqe, self.flags | self.link_flag)
+                            io_uring_sqe_set_flags(sqe, sqe.flags | self.flags | self.link_flag)
                         else:  # last
                             sqe.job = ENTRIES
-                            io_uring_sqe_set_flags(sqe, self.flags)
+                            io_uring_sqe_set_flags(sqe, sqe.flags | self.flags)
             else:
                 raise NotImplementedError('num > 1024')
         r = yield self
+        if self.timed and self.result == -ECANCELED:
+            self.result = -ETIMEDOUT  # note: raised as `TimeoutError`
         if self.len and self.error:
-            if self.len == 1:
+            global errno
+            errno = 0  # note: `trap_error` prefers `errno` over result, clear stale value.
+            if self.len == 1 or self.timed:
                 trap_error(self.result)
             else:
                 for i in range(self.len):
@@ -114,6 +162,55 @@ cdef class SQE(io_uring_sqe):
         # else: don't catch error
         return r
 
+    cdef bint cancel(self, io_uring ring) noexcept:
+        ''' Cancel In-Flight Entry
+
+            Note
+                - Puts cancel request directly into `ring` without `await`, so it can be used
+                inside `finally` of async generator that is being closed.
+                - Returns `False` if `ring` is full.
+        '''
+        cdef io_uring_sqe sqe = io_uring_sqe()
+        io_uring_prep_cancel64(sqe, <__u64><void*>self, 0)
+        io_uring_sqe_set_data64(sqe, 0)  # note: `user_data=0` result is ignored by event loop.
+        return io_uring_put_sqe(ring, sqe)
+
+    cdef int drop(self, io_uring ring, object discard) except -1:
+        ''' Cancel Multishot Entry Nobody Awaits Anymore
+
+            Note
+                - Results already `pending` & those that still arrive till kernel disarms entry
+                are passed into `discard(result, cqe_flags)`, e.g. to close accepted `fd`.
+                - Like `cancel()` it does not `await`, event loop calls `discard` for late results.
+        '''
+        if self.armed:
+            self.discard = discard
+            self.cancel(ring)
+        while self.pending:
+            discard(*self.pending.popleft())
+        return 0
+
+    cdef bint put(self, io_uring ring) noexcept:
+        ''' Put Multishot Entry into Ring without `await`
+
+            Note
+                - Lets single coroutine keep many entries in-flight, result of each is held in
+                `pending` till its `await`.
+                - Entry is submitted together with whatever the coroutine awaits next.
+                - Returns `False` if `ring` is full or entry is already armed.
+        '''
+        if not self.multishot or self.armed:
+            return False
+        self.coro = None
+        self.result = 0
+        io_uring_sqe_set_flags(self, self.flags)
+        io_uring_sqe_set_data64(self, <__u64><void*>self)
+        if not io_uring_put_sqe(ring, self):
+            return False
+        Py_XINCREF(<PyObject*>self)  # note: ring holds reference while armed.
+        self.armed = True
+        return True
+
     # midsync
     def __aexit__(self, *errors):
         if any(errors):
@@ -122,3 +219,170 @@ cdef class SQE(io_uring_sqe):
 
     async def __aenter__(self):
         return self
+
+
+async def with_deadline(SQE sqe not None, double second):
+    ''' Await Entry with Deadline
+
+        Type
+            sqe:    SQE
+            second: float
+            return: int     # `sqe.result`
+
+        Example
+            >>> sqe = SQE()
+            >>> io_uring_prep_recv(sqe, client_fd, buffer, len(buffer))
+            >>> await with_deadline(sqe, 5)
+            13
+
+        Note
+            - Linked timeout is submitted together with `sqe` in same syscall.
+            - If `second` passes before `sqe` completes, its cancelled & `TimeoutError` is raised,
+            or `-ETIMEDOUT` is set as `sqe.result` for `SQE(error=False)`.
+    '''
+    if sqe.multishot or sqe.len != 1:
+        raise ValueError('`with_deadline(sqe)` - only single entry is supported')
+    cdef SQE _sqe = new_sqe(1, sqe.error, second)
+    memcpy(_sqe.ptr, sqe.ptr, sizeof(__io_uring_sqe))
+    _sqe.flags = sqe.flags
+    try:
+        await _sqe
+    finally:
+        sqe.result = _sqe.result
+        sqe.cqe_flags = _sqe.cqe_flags
+    free_sqe(_sqe)
+    return sqe.result
+
+
+cdef class FreeList:
+
+    def __init__(self, unsigned int maxsize=1024):
+        ''' Free-List of Reusable `SQE`
+
+            Type
+                maxsize:    int     # max number of entries kept per `SQE(num)` size
+                return:     None
+
+            Example
+                >>> fl = free_list()
+                >>> fl.hit, fl.miss
+                (1024, 12)
+                >>> len(fl)
+                12
+
+            Note
+                - `run()` creates new `FreeList(entries)` for each event loop.
+                - Only `SQE(num)` with `num <= 8` are kept, multishot entries are never reused.
+        '''
+        self.entries = [[] for _ in range(8)]
+        self.maxsize = maxsize
+
+    def __len__(self):
+        return sum(len(i) for i in self.entries)
+
+    def clear(self):
+        for i in self.entries:
+            i.clear()
+
+
+cdef extern from * nogil:
+    '''
+    static __thread void* __shakti_free_list = NULL;
+    '''
+    # note: each thread runs its own event loop, so free-list is per thread.
+    void* _current '__shakti_free_list'
+
+
+cdef FreeList _free_list = FreeList()  # used outside of event loop
+
+
+cdef inline FreeList __free_list():
+    return _free_list if _current is NULL else <FreeList>_current
+
+
+def free_list() -> FreeList:
+    ''' Current Event Loop `FreeList`
+
+        Example
+            >>> free_list().hit
+            1024
+    '''
+    return __free_list()
+
+
+cdef FreeList swap_free_list(FreeList free_list):
+    ''' Replace current thread free-list and return previous one.
+
+        Note
+            - caller must hold reference to `free_list` while its in use.
+    '''
+    global _current
+    cdef FreeList previous = None if _current is NULL else <FreeList>_current
+    _current = NULL if free_list is None else <void*>free_list
+    return previous
+
+
+cdef SQE new_sqe(__u16 num=1, bint error=True, double timeout=0):
+    ''' Reuse `SQE(num, error)` from free-list or create new one.
+
+        Note
+            - reused entry is reset, so it behaves same as newly created `SQE`.
+            - `timeout` (second) links timeout entry to single entry, if it expires entry is
+            cancelled and `TimeoutError` is raised.
+    '''
+    cdef:
+        SQE         sqe
+        list        entries
+        FreeList    free_list = __free_list()
+
+    if timeout > 0:
+        if num != 1:
+            raise ValueError('`timeout` can only be used with single entry')
+        sqe = new_sqe(2, error)
+        sqe.timed = True
+        if sqe.deadline is None:
+            sqe.deadline = timespec()
+        sqe.deadline.ptr.tv_sec = <int64_t>timeout
+        sqe.deadline.ptr.tv_nsec = <long long>((timeout - <int64_t>timeout) * 1_000_000_000)
+        return sqe
+    elif 0 < num <= 8 and (entries := free_list.entries[num-1]):
+        sqe = entries.pop()
+        sqe.pooled = False
+        memset(sqe.ptr, 0, num * sizeof(__io_uring_sqe))
+        sqe.job = NOJOB
+        sqe.result = 0
+        sqe.cqe_flags = 0
+        sqe.flags = 0
+        sqe.link_flag = IOSQE_IO_HARDLINK
+        sqe.error = error
+        sqe.timed = False
+        sqe.start = 0
+        free_list.hit += 1
+        return sqe
+    free_list.miss += 1
+    return SQE(num, error)
+
+
+cdef void free_sqe(SQE sqe) noexcept:
+    ''' Return `SQE` back to free-list once its done.
+
+        Note
+            - `sqe` must not be used after being freed.
+    '''
+    cdef:
+        SQE         _sqe
+        list        entries
+        FreeList    free_list = __free_list()
+
+    if sqe.pooled or sqe.multishot or not 0 < sqe.len <= 8:
+        return
+    sqe.coro = None
+    sqe.sub_coro = False
+    if sqe.len > 1:
+        for _sqe in sqe.ref:
+            if _sqe is not None:
+                _sqe.coro = None
+                _sqe.flags = 0
+    if len(entries := free_list.entries[sqe.len-1]) < free_list.maxsize:
+        sqe.pooled = True
+        entries.append(sqe)
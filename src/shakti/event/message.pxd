@@ -0,0 +1,25 @@
+from liburing.lib.type cimport __u64
+from liburing.error cimport trap_error
+from liburing.queue cimport io_uring
+from liburing.time cimport timespec, io_uring_prep_timeout
+from liburing.other cimport io_uring_prep_msg_ring, io_uring_prep_msg_ring_fd_alloc
+from .entry cimport RING, SQE, new_sqe, free_sqe
+
+
+cpdef enum MESSAGE:
+    # note: tags `user_data` of `msg_ring` entry, so event loop can tell its a message
+    #       from another ring & not one of its own completions.
+    MESSAGE_DATA    = 1U << 0   # 1
+    MESSAGE_FD      = 1U << 1   # 2
+
+
+cdef class Mailbox(SQE):
+    cdef:
+        io_uring        ring
+        timespec        ts
+        object          inbox
+        readonly int    id
+
+
+cdef Mailbox open_mailbox(io_uring ring)
+cdef void close_mailbox(Mailbox mailbox) noexcept
@@ -0,0 +1,147 @@
+from collections import deque
+
+
+cdef dict _mailboxes = {}  # {ring_id: Mailbox}
+cdef double KEEPALIVE = 3600  # second
+
+
+cdef class Mailbox(SQE):
+    ''' Ring Mailbox
+
+        Note
+            - Each event loop has single `Mailbox`, created & removed by `run()`.
+            - Messages sent by other rings arrive as completions tagged with `MESSAGE_*` and are
+            queued same as multishot results.
+            - While `receive()` is waiting, a long timeout entry keeps event loop alive.
+    '''
+    def __init__(self):
+        super().__init__(1, False, multishot=True)
+        self.inbox = deque()  # note: `deque.append` is thread safe.
+
+
+cdef Mailbox open_mailbox(io_uring ring):
+    cdef Mailbox mailbox = Mailbox()
+    mailbox.ring = ring
+    mailbox.id = ring.ptr.ring_fd
+    mailbox.ts = timespec(KEEPALIVE)
+    io_uring_prep_timeout(mailbox, mailbox.ts, 0, 0)
+    _mailboxes[mailbox.id] = mailbox
+    return mailbox
+
+
+cdef void close_mailbox(Mailbox mailbox) noexcept:
+    _mailboxes.pop(mailbox.id, None)
+
+
+async def ring_id()-> int:
+    ''' Current Ring ID
+
+        Example
+            >>> await ring_id()
+            3
+    '''
+    cdef:
+        SQE         sqe = SQE(0, error=False)
+        io_uring    ring
+    sqe.job = RING
+    ring = await sqe
+    return ring.ptr.ring_fd
+
+
+cdef Mailbox __mailbox(int ring_id, unicode name):
+    cdef Mailbox mailbox
+    if (mailbox := _mailboxes.get(ring_id)) is None:
+        raise ValueError(f'`{name}()` - ring {ring_id!r} is not running')
+    return mailbox
+
+
+async def send_to(int ring_id, object payload):
+    ''' Send Payload to Another Ring
+
+        Example
+            >>> await send_to(worker_id, {'job': 1})
+
+        Note
+            - `payload` is handed over as is, no serialization.
+            - Uses `io_uring_prep_msg_ring` so target ring is woken up by kernel, no lock or pipe.
+    '''
+    cdef:
+        SQE     sqe = new_sqe()
+        Mailbox mailbox = __mailbox(ring_id, 'send_to')
+    mailbox.inbox.append(payload)  # note: must be queued before message is posted.
+    io_uring_prep_msg_ring(sqe, ring_id, 0, <__u64><void*>mailbox | MESSAGE_DATA, 0)
+    try:
+        await sqe
+    except OSError:
+        __discard(mailbox.inbox, payload)
+        raise
+    free_sqe(sqe)
+
+
+cdef void __discard(object inbox, object payload) except *:
+    # note: by identity, `deque.remove()` compares by `==` & could take equal payload queued by
+    #       another sender, newest is checked first as it's most likely ours.
+    cdef Py_ssize_t index
+    for index in range(len(inbox) - 1, -1, -1):
+        if inbox[index] is payload:
+            del inbox[index]
+            return
+
+
+async def pass_fd(int ring_id, int fd, bint direct=False):
+    ''' Pass File Descriptor to Another Ring
+
+        Example
+            >>> async for client_fd in accept_many(server_fd):
+            ...     await pass_fd(worker_id, client_fd)
+
+            >>> await pass_fd(worker_id, index, True)  # direct descriptor
+
+        Note
+            - Normal `fd` is shared by all threads, so its number is posted as is.
+            - `direct=True` moves direct descriptor from this ring's file table into target
+            ring's file table using `io_uring_prep_msg_ring_fd_alloc`, receiver gets new index.
+            Target ring must have registered file table.
+    '''
+    cdef:
+        SQE     sqe = new_sqe()
+        Mailbox mailbox = __mailbox(ring_id, 'pass_fd')
+        __u64   data = <__u64><void*>mailbox | MESSAGE_FD
+    if direct:
+        io_uring_prep_msg_ring_fd_alloc(sqe, ring_id, fd, data, 0)
+    else:
+        io_uring_prep_msg_ring(sqe, ring_id, fd, data, 0)
+    await sqe
+    free_sqe(sqe)
+
+
+async def receive():
+    ''' Receive Messages from Other Rings
+
+        Example
+            >>> async for message in receive():
+            ...     message
+            {'job': 1}
+            5  # fd from `pass_fd`
+
+        Note
+            - Yields `payload` of `send_to()` and `fd` (or direct index) of `pass_fd()`.
+            - Event loop stays alive while `receive()` is being iterated.
+    '''
+    cdef:
+        SQE         sqe = SQE(0, error=False)
+        Mailbox     mailbox
+
+    sqe.job = RING
+    mailbox = __mailbox((<io_uring>(await sqe)).ptr.ring_fd, 'receive')
+    try:
+        while True:
+            await mailbox
+            if mailbox.cqe_flags & MESSAGE_DATA:
+                yield mailbox.inbox.popleft()
+            elif mailbox.cqe_flags & MESSAGE_FD:
+                yield trap_error(mailbox.result)
+            # else: keepalive timeout ended, next `await` re-arms it.
+    finally:
+        if mailbox.armed:
+            mailbox.cancel(mailbox.ring)
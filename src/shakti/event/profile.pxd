@@ -0,0 +1,21 @@
+from liburing.lib.type cimport __u64
+from .entry cimport ENTRY, ENTRIES, SQE
+from .stats cimport now
+
+
+cdef class TaskProfile:
+    cdef readonly __u64 steps, time, max, sqes, done
+
+
+cdef class Profiler:
+    cdef:
+        readonly double         threshold
+        readonly unsigned int   sample
+        readonly str            path
+        readonly __u64          steps
+        readonly object         slow
+        __u64                   _threshold
+        dict                    _tasks, _stacks
+
+    cdef void step(self, object coro, __u64 start, SQE sqe) except *
+    cdef void record(self, object coro, __u64 elapsed, bint sampled, bint done) except *
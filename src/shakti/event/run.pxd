@@ -1,15 +1,38 @@
 from cpython.object cimport PyObject
 from cpython.ref cimport Py_XINCREF, Py_XDECREF
-from liburing.lib.type cimport __s32, __u64, uintptr_t
-from liburing.queue cimport io_uring, io_uring_queue_init, io_uring_queue_exit, \
-                            io_uring_prep_nop, io_uring_submit, io_uring_cqe, io_uring_sq_ready, \
-                            io_uring_cq_advance, io_uring_wait_cqe, io_uring_for_each_cqe, \
+from cpython.exc cimport PyErr_CheckSignals
+from liburing.lib.type cimport __s32, __u32, __u64, uintptr_t
+from libc.errno cimport ETIME, EINTR
+from libc.string cimport memset
+from liburing.lib.uring cimport __io_uring_params
+from liburing.queue cimport io_uring, io_uring_params, io_uring_queue_init_params, \
+                            io_uring_queue_exit, io_uring_prep_nop, io_uring_submit, io_uring_cqe, \
+                            io_uring_submit_and_wait, io_uring_submit_and_wait_timeout, sigset, \
+                            io_uring_cq_ready, io_uring_cq_advance, io_uring_for_each_cqe, \
                             io_uring_sqe_set_flags, io_uring_sqe_set_data64, \
                             io_uring_sq_space_left
+from liburing.time cimport timespec
+from liburing.syscall cimport IORING_SETUP_SQPOLL, IORING_SETUP_CQSIZE, IORING_SETUP_CLAMP, \
+                              IORING_SETUP_COOP_TASKRUN, IORING_SETUP_SINGLE_ISSUER, \
+                              IORING_SETUP_DEFER_TASKRUN, IORING_SETUP_ATTACH_WQ
+from liburing.common cimport IORING_CQE_F_MORE
 from liburing.helper cimport io_uring_put_sqe
-from .entry cimport NOJOB, CORO, RING, ENTRY, ENTRIES, SQE
+from .entry cimport NOJOB, CORO, RING, ENTRY, ENTRIES, MULTI, TIMER, SQE, FreeList, swap_free_list, \
+                    new_sqe, free_sqe
+from .timer cimport Timer, TimerWheel, swap_timer_wheel
+from .stats cimport LoopStats, now, open_loop_stats, close_loop_stats
+from .profile cimport Profiler
+from .message cimport MESSAGE_DATA, MESSAGE_FD, Mailbox, open_mailbox, close_mailbox
 
 
+cdef unsigned int __setup(__io_uring_params* params,
+                          unicode mode,
+                          unsigned int entries,
+                          unsigned int flags,
+                          unsigned int batch,
+                          int wq_fd,
+                          tuple coroutine,
+                          unsigned int coro_len) except 0
 cdef void __check_coroutine(tuple coroutine, unsigned int coro_len, unicode msg)
 cdef void __prep_coroutine(io_uring ring,
                            tuple coroutine,
@@ -2,13 +2,30 @@ from types import CoroutineType
 from .entry import JOBS
 
 
-def run(*coroutine: tuple, unsigned int entries=1024, unsigned int flags=0) -> list:
+cdef double BATCH_WAIT = 0.00005  # 50 microsecond
+
+
+def run(*coroutine: tuple, unsigned int entries=1024, unsigned int flags=0,
+        unicode mode=None, unsigned int batch=0, int wq_fd=-1, bint stats=False,
+        Profiler profile=None) -> list:
     '''
         Type
             coroutine:  CoroutineType
             entries:    int
-            flags:      int
-            return:     None
+            flags:      int     # extra `IORING_SETUP_*` flags
+            mode:       str     # ring setup profile
+            batch:      int     # min completions to wait for, `0` uses `mode` default
+            wq_fd:      int     # ring fd to share async worker pool with
+            stats:      bool    # collect event loop statistics, see `loop_stats()`
+            profile:    Profiler | None  # time each coroutine step, see `Profiler`
+            return:     list
+
+        Mode
+            None            # plain ring, only `flags` are used (default)
+            'latency'       # single issuer + cooperative task run, wake up on every completion.
+            'throughput'    # single issuer + deferred task run, 4x completion queue,
+                            # waits for up to `batch=16` completions (max 50 microsecond).
+            'sqpoll'        # kernel thread submits entries, idle after 2 second, 4x completion queue.
 
         Example
             >>> from shakti import Timeit, run, sleep
@@ -26,18 +43,56 @@ def run(*coroutine: tuple, unsigned int entries=1024, unsigned int flags=0) -> l
             >>> if __name__ == '__main__':
             ...     with Timeit():
             ...         run(main())
+
+            # setup profile
+            >>> run(main(), mode='throughput')
+
+        Note
+            - Submitting & waiting is done in single `io_uring_enter` syscall.
+            - `mode` requires Linux 6.1+
+            - `wq_fd` sets `IORING_SETUP_ATTACH_WQ`, used by `run_workers()`.
+            - `stats` & `profile` are off by default, event loop does no extra work unless
+            enabled.
     '''
     cdef:
-        unicode         msg
-        io_uring        ring = io_uring()
-        unsigned int    coro_len = __checkup(entries, coroutine)
+        unicode             msg
+        Mailbox             mailbox
+        LoopStats           loop = None
+        TimerWheel          wheel = TimerWheel(), previous_wheel
+        FreeList            free_list = FreeList(entries), previous
+        timespec            ts = None
+        io_uring            ring = io_uring()
+        io_uring_params     params = io_uring_params()
+        __io_uring_params   _params
+        unsigned int        coro_len = __checkup(entries, coroutine)
 
-    io_uring_queue_init(entries, ring, flags)
+    batch = __setup(&_params, mode, entries, flags, batch, wq_fd, coroutine, coro_len)
+    if batch > 1:
+        ts = timespec(BATCH_WAIT)
+    params.ptr = &_params
+    try:
+        io_uring_queue_init_params(entries, ring, params)
+    finally:
+        params.ptr = NULL
+    previous = swap_free_list(free_list)  # note: each event loop has its own free-list
+    previous_wheel = swap_timer_wheel(wheel)
+    mailbox = open_mailbox(ring)
+    if stats:
+        open_loop_stats(loop := LoopStats(ring.ptr.ring_fd))
     try:
         __prep_coroutine(ring, coroutine, coro_len)
-        return __event_loop(ring, entries)
+        return __event_loop(ring, batch, ts, wheel, loop, profile)
     finally:
-        io_uring_queue_exit(ring)
+        try:
+            if loop is not None:
+                close_loop_stats(loop)
+            close_mailbox(mailbox)
+            swap_timer_wheel(previous_wheel)
+            swap_free_list(previous)
+            io_uring_queue_exit(ring)
+        finally:
+            if profile is not None and profile.path is not None:
+                profile.dump()  # note: after ring is released, failing dump can't leak it.
 
 
 cdef unsigned int __checkup(unsigned int entries, tuple coroutine):
@@ -60,6 +115,43 @@ cdef unsigned int __checkup(unsigned int entries, tuple coroutine):
     return coro_len
 
 
+cdef unsigned int __setup(__io_uring_params* params,
+                          unicode mode,
+                          unsigned int entries,
+                          unsigned int flags,
+                          unsigned int batch,
+                          int wq_fd,
+                          tuple coroutine,
+                          unsigned int coro_len) except 0:
+    ''' Fill `params` based on setup `mode` & return `batch` size '''
+    cdef unicode msg
+
+    memset(params, 0, sizeof(__io_uring_params))
+    params.flags = flags
+    if wq_fd > -1:
+        params.flags |= IORING_SETUP_ATTACH_WQ
+        params.wq_fd = wq_fd
+    if mode is None:
+        return batch or 1
+    elif mode == 'latency':
+        params.flags |= IORING_SETUP_SINGLE_ISSUER | IORING_SETUP_COOP_TASKRUN
+        return batch or 1
+    elif mode == 'throughput':
+        params.flags |= IORING_SETUP_SINGLE_ISSUER | IORING_SETUP_DEFER_TASKRUN \
+                        | IORING_SETUP_CQSIZE | IORING_SETUP_CLAMP
+        params.cq_entries = entries * 4
+        return batch or 16
+    elif mode == 'sqpoll':
+        params.flags |= IORING_SETUP_SQPOLL | IORING_SETUP_SINGLE_ISSUER \
+                        | IORING_SETUP_CQSIZE | IORING_SETUP_CLAMP
+        params.cq_entries = entries * 4
+        params.sq_thread_idle = 2000  # millisecond
+        return batch or 1
+    __close_all_coroutine(coroutine, coro_len)
+    msg = f'`run()` - `mode` must be "latency", "throughput" or "sqpoll", received {mode!r}'
+    raise ValueError(msg)
+
+
 cdef inline void __check_coroutine(tuple coroutine, unsigned int coro_len, unicode msg):
     for i in range(coro_len):
         if not isinstance(coroutine[i], CoroutineType):
@@ -87,7 +179,7 @@ cdef inline void __prep_coroutine(io_uring ring,
         unsigned int    i
 
     for i in range(coro_len):
-        sqe = SQE()
+        sqe = new_sqe()
         Py_XINCREF(ptr := <PyObject*>sqe)
         sqe.job = CORO
         sqe.coro = coroutine[i]
@@ -97,69 +189,206 @@ cdef inline void __prep_coroutine(io_uring ring,
         io_uring_put_sqe(ring, sqe)
 
 
-cdef list __event_loop(io_uring ring, unsigned int entries):
+cdef inline unsigned int __sq_unflushed(io_uring ring) noexcept nogil:
+    # note: entries that are ready but not yet handed to the kernel.
+    return ring.ptr.sq.sqe_tail - ring.ptr.sq.sqe_head
+
+
+cdef list __event_loop(io_uring ring,
+                       unsigned int batch,
+                       timespec ts,
+                       TimerWheel wheel,
+                       LoopStats stats,
+                       Profiler profile):
     cdef:
-        SQE             sqe, _sqe
-        bint            sub_coro
+        SQE             sqe
+        Timer           timer
+        bint            sub_coro, idle = False
+        sigset          sigmask = sigset()
         list            r = []
         __s32           res
+        __u32           flags
+        __u64           message
         __u64           user_data
         object          coro, value
-        unicode         msg
         PyObject*       ptr
         io_uring_cqe    cqe = io_uring_cqe()
-        unsigned int    index=0, counter=0, cq_ready=0
+        unsigned int    index=0, counter=0, ready=0, cq_ready=0, cq_done=0
 
     # event manager
-    while counter := ((io_uring_submit(ring) if io_uring_sq_ready(ring) else 0) + counter-cq_ready):
-        if io_uring_wait_cqe(ring, cqe) != 0:
+    while counter := (counter - cq_done + (ready := __sq_unflushed(ring))):
+        cq_done = 0
+        # note: signal that arrived while loop itself was running did not interrupt any wait,
+        #       run its handler before waiting, else it's deferred till next completion.
+        PyErr_CheckSignals()
+        if io_uring_cq_ready(ring):
+            if ready:  # completions are already waiting, only submit.
+                io_uring_submit(ring)
+                if stats is not None:
+                    stats.submit(ready, False)
+        elif batch > 1 and not idle:
+            try:  # wait for `batch` completions but not longer than `ts`
+                with nogil:
+                    io_uring_submit_and_wait_timeout(ring, cqe, min(batch, counter), ts, sigmask)
+            except OSError as e:
+                if e.errno == ETIME:
+                    idle = True  # nothing arrived in time, next round wait for single completion.
+                elif e.errno != EINTR:
+                    raise
+            if stats is not None:
+                stats.submit(ready, True)
+        else:
+            try:
+                with nogil:  # note: lets other threads run their own event loop.
+                    io_uring_submit_and_wait(ring, 1)
+            except InterruptedError:
+                pass
+            idle = False
+            if stats is not None:
+                stats.submit(ready, True)
+        # note: Python signal handler only runs between bytecodes, run it now, e.g. `SIGINT`
+        #       raises `KeyboardInterrupt` here instead of once some coroutine resumes.
+        PyErr_CheckSignals()
+        if not (cq_ready := io_uring_for_each_cqe(ring, cqe)):
             continue
-        cq_ready = 0
-        for index in range(io_uring_for_each_cqe(ring, cqe)):
+        if stats is not None:
+            stats.wait(cq_ready, counter)
+        for index in range(cq_ready):
             res, user_data = cqe.get_index(index)
+            flags = cqe.ptr[index].flags
+            if message := user_data & (MESSAGE_DATA | MESSAGE_FD):
+                # note: posted by another ring, was never part of `counter`.
+                user_data ^= message
+                flags = message
+            elif not (flags & IORING_CQE_F_MORE):
+                cq_done += 1  # note: multishot entry is still in-flight while `F_MORE` is set.
             if not user_data:
                 continue
-            cq_ready += 1
             if (ptr := <PyObject*><uintptr_t>user_data) is NULL:
                 raise RuntimeError('`engine()` - received `NULL` from `user_data`')
             sqe = <SQE>ptr
-            sqe.result = res
-            if sqe.job & CORO:
+            if stats is not None and sqe.start:
+                stats.complete(sqe.ptr, sqe.start)
+                sqe.start = 0
+            if sqe.multishot:
+                # note: zero-copy send is armed as multishot, its `IORING_CQE_F_NOTIF` result
+                #       comes without `F_MORE` so it disarms entry like last multishot result.
+                if not (message or flags & IORING_CQE_F_MORE):
+                    sqe.armed = False
+                    Py_XDECREF(ptr)
+                if (coro := sqe.coro) is None:
+                    if (discard := sqe.discard) is not None:  # dropped, see `SQE.drop()`
+                        if not sqe.armed:
+                            sqe.discard = None
+                        discard(res, flags)
+                    else:  # nothing is awaiting, hold result till next `await`
+                        sqe.pending.append((res, flags))
+                    continue
+                sqe.coro = None
+                sqe.result = res
+                sqe.cqe_flags = flags
+                value = False
+                sub_coro = sqe.sub_coro
+            elif sqe.job & TIMER:  # wheel alarm, fire all expired timers together.
                 Py_XDECREF(ptr)
-                value = None    # start coroutine
-            else:
-                value = False   # bogus value
-            if not (coro := sqe.coro):
+                for timer in wheel.expire(sqe):
+                    if (coro := timer.coro) is not None:
+                        timer.coro = None
+                        counter += __resume(ring, coro, timer.sub_coro, False, r, wheel, stats,
+                                            profile)
+                    elif isinstance(value := timer.callback(*timer.args), CoroutineType):
+                        __prep_coroutine(ring, (value,), 1, True)  # run as task
                 continue
-            sub_coro = sqe.sub_coro
-            while True:
-                try:
-                    sqe = coro.send(value)
-                except StopIteration as e:
-                    if not sqe.sub_coro:
-                        r.append(e.value)
+            else:
+                sqe.result = res
+                sqe.cqe_flags = flags
+                coro = sqe.coro
+                sub_coro = sqe.sub_coro
+                if sqe.job & CORO:
+                    if stats is not None:
+                        stats.job(CORO)
+                    Py_XDECREF(ptr)
+                    free_sqe(sqe)   # coroutine has started, entry can be reused.
+                    value = None    # start coroutine
                 else:
-                    if sqe.job & ENTRY:
-                        sqe.coro = coro
-                        sqe.sub_coro = sub_coro
-                    elif sqe.job & ENTRIES:
-                        sqe.job = NOJOB         # change first job
-                        _sqe = sqe[sqe.len-1]   # last entry
-                        _sqe.coro = coro
-                        _sqe.sub_coro = sub_coro
-                    elif sqe.job & RING:
-                        value = ring
-                        continue
-                    else:
-                        msg = f'`run()` received unrecognized `job` {JOBS(sqe.job).name}'
-                        raise NotImplementedError(msg)
-
-                    if not io_uring_put_sqe(ring, sqe):
-                        counter += io_uring_submit(ring)
-                        if not io_uring_put_sqe(ring, sqe):  # try again
-                            msg = '`run()` - length of `sqe > entries`'
-                            raise RuntimeError(msg)
-                break
+                    value = False   # bogus value
+                if coro is None:
+                    continue
+                elif not sqe.job & CORO:
+                    Py_XDECREF(ptr)  # entry is done, coroutine holds it again.
+            counter += __resume(ring, coro, sub_coro, value, r, wheel, stats, profile)
         if cq_ready:
             io_uring_cq_advance(ring, cq_ready)  # free seen entries
+        if wheel.dirty:
+            counter += wheel.arm(ring)
     return r
+
+
+cdef unsigned int __resume(io_uring ring,
+                           object coro,
+                           bint sub_coro,
+                           object value,
+                           list r,
+                           TimerWheel wheel,
+                           LoopStats stats,
+                           Profiler profile) except? 0:
+    ''' Send `value` into `coro` & put entry it awaits into `ring`, returns submitted count '''
+    cdef:
+        SQE             sqe, _sqe
+        unicode         msg
+        unsigned int    submitted = 0
+        __u64           start = 0
+
+    while True:
+        if profile is not None:
+            start = now()
+        try:
+            sqe = coro.send(value)
+        except StopIteration as e:
+            if profile is not None:
+                profile.step(coro, start, None)
+            if not sub_coro:
+                r.append(e.value)
+            return 0
+        if profile is not None:
+            profile.step(coro, start, sqe)
+        if stats is not None:
+            stats.job(sqe.job)
+        if sqe.job & ENTRY:
+            sqe.coro = coro
+            sqe.sub_coro = sub_coro
+        elif sqe.job & ENTRIES:
+            sqe.job = NOJOB         # change first job
+            _sqe = sqe[sqe.len-1]   # last entry
+            _sqe.coro = coro
+            _sqe.sub_coro = sub_coro
+        elif sqe.job & MULTI:  # armed multishot, wait for next result
+            sqe.coro = coro
+            sqe.sub_coro = sub_coro
+            return 0
+        elif sqe.job & TIMER:  # wait in timer wheel, no entry needed
+            sqe.coro = coro
+            sqe.sub_coro = sub_coro
+            wheel.add(<Timer>sqe)
+            return 0
+        elif sqe.job & RING:
+            value = ring
+            continue
+        else:
+            msg = f'`run()` received unrecognized `job` {JOBS(sqe.job).name}'
+            raise NotImplementedError(msg)
+
+        if stats is not None:
+            (_sqe if sqe.job == NOJOB else sqe).start = now()
+        if not io_uring_put_sqe(ring, sqe):
+            if stats is not None:
+                stats.sq_full += 1
+            submitted = io_uring_submit(ring)
+            if not io_uring_put_sqe(ring, sqe):  # try again
+                msg = '`run()` - length of `sqe > entries`'
+                raise RuntimeError(msg)
+        if not sqe.multishot:
+            # note: ring holds reference while in-flight, coroutine that only awaits entry is
+            #       otherwise unreachable & could be collected by cyclic garbage collector.
+            Py_XINCREF(<PyObject*>(_sqe if sqe.job == NOJOB else sqe))
+        return submitted
@@ -1,7 +1,9 @@
 from libc.errno cimport ETIME
+from liburing.lib.type cimport __s32
 from liburing.error cimport trap_error
 from liburing.time cimport timespec, io_uring_prep_timeout
-from .entry cimport SQE
+from .entry cimport SQE, new_sqe, free_sqe
+from .timer cimport new_timer
 
 
 async def sleep(double second, unsigned int flags=0):
@@ -18,15 +20,26 @@ async def sleep(double second, unsigned int flags=0):
         Example
             >>> await sleep(1)      # 1 second
             >>> await sleep(0.001)  # 1 millisecond
+
+        Note
+            - Without `flags`, waits in event loop `TimerWheel` so any number of sleeps share
+            single kernel timeout, resolution is 1 millisecond.
+            - With `flags`, its own kernel timeout is used.
     '''
     if second < 0:
         raise ValueError('`sleep(second)` can not be `< 0`')
+    if not flags:
+        await new_timer(second)
+        return
 
     cdef:
-        SQE         sqe = SQE(1, False)
+        SQE         sqe = new_sqe(1, False)
+        __s32       result
         timespec    ts = timespec(second)  # prepare timeout
     io_uring_prep_timeout(sqe, ts, 0, flags)  # note: `count=1` means no timer!
     await sqe
+    result = sqe.result
+    free_sqe(sqe)
     # note: `ETIME` is returned as result for successfully timing-out.
-    if sqe.result != -ETIME:
-        trap_error(sqe.result)
+    if result != -ETIME:
+        trap_error(result)
@@ -0,0 +1,44 @@
+from posix.time cimport clock_gettime, timespec as _timespec, CLOCK_MONOTONIC
+from liburing.lib.type cimport __u8, __u64
+from liburing.lib.uring cimport __io_uring_sqe
+
+
+cdef extern from * nogil:
+    '''
+    static inline __u8 __shakti_sqe_opcode(struct io_uring_sqe* sqe)
+    {
+        return sqe->opcode;
+    }
+    static inline unsigned int __shakti_log2(unsigned long long value)
+    {
+        return value ? 63 - __builtin_clzll(value) : 0;
+    }
+    '''
+    # note: `opcode` is not exposed by `liburing.lib.uring.__io_uring_sqe`
+    __u8 sqe_opcode '__shakti_sqe_opcode'(__io_uring_sqe* sqe)
+    unsigned int log2 '__shakti_log2'(unsigned long long value)
+
+
+cdef enum:
+    JOBS_LEN = 6
+    OPCODES = 64
+    BUCKETS = 32
+
+
+cdef class LoopStats:
+    cdef:
+        readonly int    ring_id
+        readonly __u64  submits, syscalls, waits, cqes, sq_full, inflight, inflight_max
+        __u64           _jobs[JOBS_LEN]
+        __u64           _batch[BUCKETS]
+        __u64           _latency[OPCODES][BUCKETS]
+
+    cdef inline void submit(self, unsigned int ready, bint wait) noexcept nogil
+    cdef inline void wait(self, unsigned int cq_ready, unsigned int counter) noexcept nogil
+    cdef inline void job(self, __u8 job) noexcept nogil
+    cdef inline void complete(self, __io_uring_sqe* sqe, __u64 start) noexcept nogil
+
+
+cdef __u64 now() noexcept nogil
+cdef void open_loop_stats(LoopStats stats)
+cdef void close_loop_stats(LoopStats stats) noexcept
@@ -0,0 +1,131 @@
+from threading import get_ident
+from .entry import JOBS
+import liburing
+
+
+cdef dict _loops = {}    # {ring_id: LoopStats}
+cdef dict _threads = {}  # {thread_id: LoopStats}
+
+
+cdef class LoopStats:
+    ''' Event Loop Statistics
+
+        Example
+            >>> run(main(), stats=True)
+
+            # inside event loop
+            >>> stats = loop_stats()
+            >>> stats.syscalls, stats.cqes
+            (1024, 4096)
+            >>> stats.as_dict()
+            {'ring_id': 3, 'submits': 4096, ..., 'batch': {1: 12, 2: 70, 4: 211},
+             'latency': {'IORING_OP_RECV': {8: 1021, 16: 3}, ...}}
+
+        Note
+            - Only collected when `run(stats=True)`, otherwise event loop does not touch it.
+            - `batch` is histogram of completions handled per wake-up, key is `>=` power of 2.
+            - `latency` is histogram of put-to-completion time per opcode, key is `>=` microsecond
+            power of 2.
+            - `syscalls` counts `io_uring_enter` made by event loop (less with `mode='sqpoll'`).
+    '''
+    def __init__(self, int ring_id=-1):
+        self.ring_id = ring_id
+
+    cdef inline void submit(self, unsigned int ready, bint wait) noexcept nogil:
+        self.submits += ready
+        self.syscalls += 1
+        self.waits += wait
+
+    cdef inline void wait(self, unsigned int cq_ready, unsigned int counter) noexcept nogil:
+        self.cqes += cq_ready
+        self._batch[log2(cq_ready)] += 1
+        self.inflight = counter
+        if counter > self.inflight_max:
+            self.inflight_max = counter
+
+    cdef inline void job(self, __u8 job) noexcept nogil:
+        self._jobs[log2(job)] += 1
+
+    cdef inline void complete(self, __io_uring_sqe* sqe, __u64 start) noexcept nogil:
+        cdef __u8 opcode = sqe_opcode(sqe)
+        if opcode < OPCODES:
+            self._latency[opcode][min(log2((now() - start) // 1000), BUCKETS-1)] += 1
+
+    @property
+    def jobs(self)-> dict[str, int]:
+        return {JOBS(1 << i).name: self._jobs[i] for i in range(JOBS_LEN) if self._jobs[i]}
+
+    @property
+    def batch(self)-> dict[int, int]:
+        return {1 << i: self._batch[i] for i in range(BUCKETS) if self._batch[i]}
+
+    @property
+    def latency(self)-> dict[str, dict[int, int]]:
+        cdef:
+            unsigned int    i, j
+            dict            r = {}
+        for i in range(OPCODES):
+            for j in range(BUCKETS):
+                if self._latency[i][j]:
+                    r.setdefault(_opcodes.get(i, i), {})[1 << j] = self._latency[i][j]
+        return r
+
+    def as_dict(self)-> dict:
+        return {'ring_id': self.ring_id,
+                'submits': self.submits,
+                'syscalls': self.syscalls,
+                'waits': self.waits,
+                'cqes': self.cqes,
+                'sq_full': self.sq_full,
+                'inflight': self.inflight,
+                'inflight_max': self.inflight_max,
+                'jobs': self.jobs,
+                'batch': self.batch,
+                'latency': self.latency}
+
+
+cdef dict _opcodes = {getattr(liburing, name): name
+                      for name in dir(liburing) if name.startswith('IORING_OP_')}
+
+
+cdef __u64 now() noexcept nogil:
+    cdef _timespec ts
+    clock_gettime(CLOCK_MONOTONIC, &ts)
+    return ts.tv_sec * 1_000_000_000 + ts.tv_nsec
+
+
+cdef void open_loop_stats(LoopStats stats):
+    _loops[stats.ring_id] = stats
+    _threads[get_ident()] = stats
+
+
+cdef void close_loop_stats(LoopStats stats) noexcept:
+    _loops.pop(stats.ring_id, None)
+    _threads.pop(get_ident(), None)
+
+
+def loop_stats(int ring_id=-1)-> LoopStats | None:
+    ''' Running Event Loop Statistics
+
+        Type
+            ring_id:    int     # `-1` is event loop of current thread
+            return:     LoopStats | None
+
+        Example
+            >>> loop_stats().as_dict()
+            {'ring_id': 3, 'submits': 4096, ...}
+
+            # scrape all running event loops, e.g. from metrics endpoint
+            >>> [loop_stats(i).as_dict() for i in loop_ids()]
+
+        Note
+            - Returns `None` if event loop is not running with `run(stats=True)`.
+    '''
+    if ring_id < 0:
+        return _threads.get(get_ident())
+    return _loops.get(ring_id)
+
+
+def loop_ids()-> list[int]:
+    ''' Ring ID of all running event loops that collect statistics. '''
+    return list(_loops)
@@ -0,0 +1,53 @@
+from cpython.object cimport PyObject
+from cpython.ref cimport Py_XINCREF
+from liburing.lib.type cimport __u64
+from liburing.queue cimport io_uring, io_uring_submit, io_uring_sqe_set_data64
+from liburing.time cimport timespec, io_uring_prep_timeout, io_uring_prep_timeout_update, \
+                           io_uring_prep_timeout_remove, IORING_TIMEOUT_ABS
+from liburing.helper cimport io_uring_put_sqe
+from .entry cimport TIMER, SQE, new_sqe, free_sqe
+from .stats cimport log2, now
+
+
+cdef extern from * nogil:
+    int ctz '__builtin_ctzll'(unsigned long long value)
+
+
+cdef enum:
+    WHEEL_BITS = 6
+    WHEEL_SIZE = 1 << WHEEL_BITS    # slots per level
+    WHEEL_LEVELS = 11               # `11 * 6 bits` covers all of `__u64` ticks
+    TICK = 1_000_000                # nanosecond, 1 millisecond
+
+
+cdef class Timer(SQE):
+    cdef:
+        Timer               _prev, _next
+        TimerWheel          wheel
+        int                 slot
+        double              delay
+        object              callback
+        tuple               args
+        readonly __u64      expire
+
+
+cdef class TimerWheel:
+    cdef:
+        list                slots
+        __u64               bitmap[WHEEL_LEVELS]
+        __u64               origin, current, armed
+        SQE                 alarm
+        timespec            ts
+        bint                dirty
+        readonly unsigned int   count
+
+    cdef void add(self, Timer timer)
+    cdef void insert(self, Timer timer)
+    cdef void remove(self, Timer timer)
+    cdef __u64 next_tick(self)
+    cdef list expire(self, SQE alarm)
+    cdef unsigned int arm(self, io_uring ring)
+
+
+cdef Timer new_timer(double second)
+cdef TimerWheel swap_timer_wheel(TimerWheel wheel)
@@ -0,0 +1,271 @@
+cdef class Timer(SQE):
+    ''' Timer Entry - waits in event loop `TimerWheel` instead of its own kernel timeout.
+
+        Example
+            >>> timer = call_later(1, print, 'hi')
+            >>> timer.expire
+            1234
+            >>> bool(timer)
+            True
+            >>> timer.stop()
+            True
+
+        Note
+            - Created by `sleep()` and `call_later()`.
+            - Resolution is 1 millisecond, deadline is rounded up to next tick.
+    '''
+    def __init__(self):
+        raise TypeError('`Timer()` is created by `sleep()` or `call_later()`')
+
+    def __await__(self):
+        if self.wheel is not None:
+            raise RuntimeError('`Timer()` - already scheduled')
+        self.job = TIMER
+        yield self  # note: event loop adds timer into its wheel.
+
+    def __bool__(self):
+        ''' `True` while timer is waiting to fire '''
+        return self.slot > -1
+
+    def stop(self)-> bool:
+        ''' Stop Timer
+
+            Example
+                >>> timer = call_later(1, print, 'hi')
+                >>> timer.stop()
+                True    # stopped before firing
+                >>> timer.stop()
+                False
+
+            Note
+                - Removing timer from wheel is O(1), if it was the last timer kernel timeout
+                is removed as well.
+        '''
+        if self.slot < 0:
+            return False
+        self.wheel.remove(self)
+        self.wheel.count -= 1
+        self.wheel.dirty = True
+        self.wheel = None
+        return True
+
+
+cdef Timer new_timer(double second):
+    cdef Timer timer = Timer.__new__(Timer, 0)  # note: `0` entry, nothing to put in ring.
+    timer.job = TIMER
+    timer.slot = -1
+    timer.delay = second
+    return timer
+
+
+cdef inline __u64 __upper(__u64 tick, unsigned int level) noexcept nogil:
+    # `tick` with all bits of `level` and below cleared.
+    cdef unsigned int shift = WHEEL_BITS * (level + 1)
+    return 0 if shift >= 64 else (tick >> shift) << shift
+
+
+cdef class TimerWheel:
+    ''' Hierarchical Timer Wheel
+
+        Note
+            - Each event loop has single `TimerWheel`, created by `run()`.
+            - `11` levels of `64` slots with 1 millisecond tick, timer is placed on level of
+            highest bit where its deadline differs from current tick & cascades down as
+            current tick reaches its slot.
+            - Only single kernel timeout is armed, for nearest slot. Timers that expire
+            together are fired in same event loop round.
+            - Insert and `Timer.stop()` are O(1), finding next slot is `ctz` on each level bitmap.
+    '''
+    def __init__(self):
+        self.slots = [None] * (WHEEL_SIZE * WHEEL_LEVELS)
+        self.origin = now()
+        self.ts = timespec()
+
+    def __len__(self):
+        return self.count
+
+    cdef void add(self, Timer timer):
+        cdef __u64 expire = now() - self.origin + <__u64>(min(timer.delay, 4e9) * 1e9)
+        expire = (expire + TICK - 1) // TICK  # round up to next tick
+        timer.expire = max(expire, self.current + 1)
+        timer.wheel = self
+        self.insert(timer)
+        self.count += 1
+        self.dirty = True
+
+    cdef void insert(self, Timer timer):
+        cdef:
+            Timer           head, tail
+            unsigned int    level = log2(timer.expire ^ self.current) // WHEEL_BITS
+            unsigned int    index = (timer.expire >> (WHEEL_BITS * level)) & (WHEEL_SIZE - 1)
+
+        timer.slot = level * WHEEL_SIZE + index
+        if (head := self.slots[timer.slot]) is None:
+            self.slots[timer.slot] = timer._prev = timer._next = timer
+            self.bitmap[level] |= 1ULL << index
+        else:  # append to tail, so timers fire in order they were added.
+            tail = head._prev
+            tail._next = timer._prev = head._prev = timer
+            timer._next = head
+            timer._prev = tail
+
+    cdef void remove(self, Timer timer):
+        cdef unsigned int slot = timer.slot
+        if timer._next is timer:  # last one in slot
+            self.slots[slot] = None
+            self.bitmap[slot // WHEEL_SIZE] &= ~(1ULL << (slot & (WHEEL_SIZE - 1)))
+        else:
+            timer._prev._next = timer._next
+            timer._next._prev = timer._prev
+            if self.slots[slot] is timer:
+                self.slots[slot] = timer._next
+        timer._prev = timer._next = None
+        timer.slot = -1
+
+    cdef __u64 next_tick(self):
+        ''' Start tick of nearest occupied slot '''
+        cdef:
+            __u64           tick, r = <__u64>-1
+            unsigned int    level
+        for level in range(WHEEL_LEVELS):
+            if self.bitmap[level]:
+                tick = __upper(self.current, level) \
+                       | (<__u64>ctz(self.bitmap[level]) << (WHEEL_BITS * level))
+                if tick < r:
+                    r = tick
+        return r
+
+    cdef list expire(self, SQE alarm):
+        ''' Kernel timeout fired, advance wheel & return expired timers '''
+        cdef:
+            Timer           timer, head, _next
+            list            fired = []
+            __u64           tick, target
+            unsigned int    level, slot
+
+        free_sqe(alarm)
+        if alarm is not self.alarm:
+            return fired  # note: removed or replaced alarm
+        self.alarm = None
+        self.dirty = True
+        target = (now() - self.origin) // TICK
+        while self.count and (tick := self.next_tick()) <= target:
+            self.current = tick
+            for level in reversed(range(WHEEL_LEVELS)):
+                if tick & ((1ULL << (WHEEL_BITS * level)) - 1):
+                    continue  # not at start of slot on this level
+                slot = level * WHEEL_SIZE + ((tick >> (WHEEL_BITS * level)) & (WHEEL_SIZE - 1))
+                if (head := self.slots[slot]) is None:
+                    continue
+                self.slots[slot] = None
+                self.bitmap[level] &= ~(1ULL << (slot & (WHEEL_SIZE - 1)))
+                timer = head
+                while True:
+                    _next = timer._next
+                    timer._prev = timer._next = None
+                    timer.slot = -1
+                    if timer.expire <= tick:
+                        timer.wheel = None
+                        fired.append(timer)
+                        self.count -= 1
+                    else:  # cascade down to lower level
+                        self.insert(timer)
+                    if _next is head:
+                        break
+                    timer = _next
+        if target > self.current:
+            self.current = target
+        return fired
+
+    cdef unsigned int arm(self, io_uring ring):
+        ''' Arm, move or remove kernel timeout for nearest slot & return submitted count '''
+        cdef:
+            SQE             sqe
+            __u64           tick, ns
+            unsigned int    r = 0
+
+        self.dirty = False
+        if self.count:
+            if (tick := self.next_tick()) >= self.armed and self.alarm is not None:
+                return 0  # already armed early enough
+            ns = self.origin + tick * TICK
+            self.ts.ptr.tv_sec = ns // 1_000_000_000
+            self.ts.ptr.tv_nsec = ns % 1_000_000_000
+            self.armed = tick
+            sqe = new_sqe(1, False)
+            if self.alarm is None:
+                sqe.job = TIMER
+                io_uring_prep_timeout(sqe, self.ts, 0, IORING_TIMEOUT_ABS)
+                io_uring_sqe_set_data64(sqe, <__u64><void*>sqe)
+                Py_XINCREF(<PyObject*>sqe)  # note: ring holds reference while armed.
+                self.alarm = sqe
+            else:
+                io_uring_prep_timeout_update(sqe, self.ts, <__u64><void*>self.alarm,
+                                             IORING_TIMEOUT_ABS)
+                io_uring_sqe_set_data64(sqe, 0)  # note: `user_data=0` result is ignored.
+        elif self.alarm is not None:  # nothing left to wait for, don't keep event loop alive.
+            sqe = new_sqe(1, False)
+            io_uring_prep_timeout_remove(sqe, <__u64><void*>self.alarm, 0)
+            io_uring_sqe_set_data64(sqe, 0)
+            self.alarm = None
+        else:
+            return 0
+        if not io_uring_put_sqe(ring, sqe):
+            r = io_uring_submit(ring)
+            io_uring_put_sqe(ring, sqe)
+        if sqe is not self.alarm:
+            free_sqe(sqe)
+        return r
+
+
+cdef extern from * nogil:
+    '''
+    static __thread void* __shakti_timer_wheel = NULL;
+    '''
+    # note: each thread runs its own event loop, so timer wheel is per thread.
+    void* _current '__shakti_timer_wheel'
+
+
+cdef TimerWheel swap_timer_wheel(TimerWheel wheel):
+    ''' Replace current thread timer wheel and return previous one.
+
+        Note
+            - caller must hold reference to `wheel` while its in use.
+    '''
+    global _current
+    cdef TimerWheel previous = None if _current is NULL else <TimerWheel>_current
+    _current = NULL if wheel is None else <void*>wheel
+    return previous
+
+
+def call_later(double second, object callback not None, *args)-> Timer:
+    ''' Call Later
+
+        Type
+            second:     float
+            callback:   Callable
+            args:       Any
+            return:     Timer
+
+        Example
+            >>> timer = call_later(5, print, 'idle connection')
+            ...
+            >>> timer.stop()  # activity, cancel idle timer
+            True
+
+            # coroutine returned by `callback` is ran as task
+            >>> call_later(1, close, client_fd)
+
+        Note
+            - Must be called from inside event loop.
+            - Error raised by `callback` is raised by `run()`.
+    '''
+    if second < 0:
+        raise ValueError('`call_later(second)` can not be `< 0`')
+    if _current is NULL:
+        raise RuntimeError('`call_later()` - event loop is not running')
+    cdef Timer timer = new_timer(second)
+    timer.callback = callback
+    timer.args = args
+    (<TimerWheel>_current).add(timer)
+    return timer
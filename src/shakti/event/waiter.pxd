@@ -0,0 +1,10 @@
+from cpython.object cimport PyObject
+from cpython.ref cimport Py_XINCREF
+from liburing.lib.type cimport __u64
+from liburing.queue cimport io_uring, io_uring_prep_nop, io_uring_submit, io_uring_sqe_set_data64
+from liburing.helper cimport io_uring_put_sqe
+from .entry cimport SQE
+
+
+cdef SQE new_waiter()
+cdef void wake(io_uring ring, SQE waiter) noexcept
@@ -0,0 +1,28 @@
+cdef SQE new_waiter():
+    ''' Entry that parks coroutine awaiting it till `wake()` is called.
+
+        Example
+            >>> waiter = new_waiter()
+            >>> waiters.append(waiter)
+            >>> await waiter  # parked, nothing is submitted
+            ...
+            # other coroutine
+            >>> wake(ring, waiters.pop())
+
+        Note
+            - Waiter is marked as armed multishot entry, so `await` only waits for next result
+            & ring holds reference to it till woken.
+    '''
+    cdef SQE waiter = SQE(multishot=True)
+    waiter.armed = True
+    Py_XINCREF(<PyObject*>waiter)
+    return waiter
+
+
+cdef void wake(io_uring ring, SQE waiter) noexcept:
+    ''' Resume coroutine parked on `waiter` with `nop` completion. '''
+    io_uring_prep_nop(waiter)
+    io_uring_sqe_set_data64(waiter, <__u64><PyObject*>waiter)
+    if not io_uring_put_sqe(ring, waiter):
+        io_uring_submit(ring)  # ring is full
+        io_uring_put_sqe(ring, waiter)
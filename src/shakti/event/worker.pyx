@@ -0,0 +1,156 @@
+from sys import stdout, stderr
+from os import fork, waitpid, waitstatus_to_exitcode, kill, cpu_count, _exit, WNOHANG
+from time import monotonic, sleep as _sleep
+from signal import signal, pthread_sigmask, SIGINT, SIGTERM, SIGKILL, SIG_IGN, SIG_BLOCK, \
+                   SIG_SETMASK
+from traceback import print_exc
+from liburing.queue cimport io_uring, io_uring_queue_init, io_uring_queue_exit
+from .run import run
+
+
+def run_workers(object factory, unsigned int workers=0, *, bint restart=True,
+                double timeout=5, **kwargs)-> None:
+    ''' Run Event Loop per CPU Core
+
+        Type
+            factory:    Callable[[int], CoroutineType]  # called inside each worker with its index
+            workers:    int     # number of worker process, `0` uses `os.cpu_count()`
+            restart:    bool    # restart worker that exited with error
+            timeout:    float   # second to wait for workers to stop before killing them
+            kwargs:     dict    # passed into `run()` e.g. `entries`, `mode`
+            return:     None
+
+        Example
+            >>> async def server(index):
+            ...     server_fd = await listener('0.0.0.0', 8080)  # `SO_REUSEPORT`
+            ...     async for client_fd in accept_many(server_fd):
+            ...         await task(handler(client_fd))
+            ...
+            >>> run_workers(server)
+
+        Note
+            - Each worker is forked process running its own ring through `run()`, ring of parent
+            is passed as `wq_fd` (`IORING_SETUP_ATTACH_WQ`). Since Linux 5.12 async worker pool
+            is per process, so after `fork()` this only shares hash map that serializes buffered
+            writes to same file, each worker still has its own pool.
+            - `SIGINT` or `SIGTERM` stops all workers & returns. Worker gets `SIGTERM`, which
+            raises `SystemExit` out of its event loop, its ring is exited & coroutine returned by
+            `factory` is closed, so its `finally` blocks run. Worker still running after
+            `timeout` is killed.
+            - Worker that exits with error is restarted, unless it failed within first second
+            (crash loop) or `restart=False`, then rest of workers are stopped and
+            `ChildProcessError` is raised.
+            - `mode='sqpoll'` does not share worker pool since kernel `SQPOLL` thread can not be
+            shared between processes.
+    '''
+    cdef:
+        int             pid, code
+        dict            pids = {}  # {pid: (index, start time)}
+        tuple           handlers
+        unicode         msg
+        io_uring        ring = io_uring()
+        unsigned int    index
+
+    if not callable(factory):
+        raise TypeError('`run_workers(factory)` must be callable that returns coroutine')
+    global _stopping
+    _stopping = False
+
+    io_uring_queue_init(1, ring)  # note: only passed into workers as `wq_fd`.
+    if kwargs.get('mode') != 'sqpoll':
+        kwargs.setdefault('wq_fd', ring.ptr.ring_fd)
+    handlers = signal(SIGINT, _shutdown), signal(SIGTERM, _shutdown)
+    try:
+        for index in range(workers or cpu_count()):
+            if _stopping:
+                break
+            __spawn(factory, index, kwargs, pids)
+        while pids and not _stopping:
+            pid, code = waitpid(-1, WNOHANG)
+            if not pid:
+                _sleep(.05)  # note: `_shutdown()` only sets flag, so poll rather than block.
+                continue
+            index, start = pids.pop(pid)
+            if code := waitstatus_to_exitcode(code):
+                if restart and monotonic() - start > 1:
+                    __spawn(factory, index, kwargs, pids)
+                else:
+                    msg = f'`run_workers()` - worker {index} exited with {code!r}'
+                    raise ChildProcessError(msg)
+    finally:
+        signal(SIGINT, handlers[0])
+        signal(SIGTERM, handlers[1])
+        __stop(pids, timeout)
+        io_uring_queue_exit(ring)
+
+
+cdef bint _stopping = False
+
+
+def _shutdown(signum, frame):
+    # note: raising here could be lost, e.g. `KeyboardInterrupt` inside `fork()` hooks is only
+    #       printed as unraisable, `run_workers()` checks flag instead.
+    global _stopping
+    _stopping = True
+
+
+cdef int __spawn(object factory, unsigned int index, dict kwargs, dict pids) except -1:
+    # note: signal is blocked till new worker has set its own handler, else it would run
+    #       `_shutdown()` of parent.
+    cdef:
+        object  mask = pthread_sigmask(SIG_BLOCK, (SIGINT, SIGTERM))
+        int     pid
+    try:
+        pid = fork()
+    except BaseException:
+        pthread_sigmask(SIG_SETMASK, mask)
+        raise
+    if pid:
+        pids[pid] = index, monotonic()
+        pthread_sigmask(SIG_SETMASK, mask)
+        return 0
+    # worker
+    cdef int code = 0
+    cdef object coro = None
+    try:
+        signal(SIGINT, SIG_IGN)  # note: parent stops workers.
+        signal(SIGTERM, _terminate)
+        pthread_sigmask(SIG_SETMASK, mask)
+        run(coro := factory(index), **kwargs)
+    except SystemExit:
+        if coro is not None:
+            try:
+                coro.close()  # note: `await` inside its `finally` can not run anymore.
+            except BaseException:
+                print_exc()
+    except BaseException:
+        print_exc()
+        code = 1
+    finally:
+        stdout.flush()
+        stderr.flush()
+        _exit(code)
+
+
+def _terminate(signum, frame):
+    raise SystemExit  # note: raised inside event loop of worker, see `run_workers()`
+
+
+cdef void __stop(dict pids, double timeout):
+    cdef:
+        int     pid
+        double  deadline = monotonic() + timeout
+
+    for pid in pids:
+        try:
+            kill(pid, SIGTERM)
+        except ProcessLookupError:
+            pass
+    for pid in pids:
+        while not waitpid(pid, WNOHANG)[0]:
+            if monotonic() > deadline:
+                kill(pid, SIGKILL)
+                waitpid(pid, 0)
+                break
+            _sleep(.01)
+    pids.clear()
@@ -0,0 +1,37 @@
+from cpython.bytes cimport PyBytes_FromStringAndSize
+from cpython.bytearray cimport PyByteArray_AS_STRING
+from ..lib.error cimport HTTPError
+
+
+cdef enum:  # parser state
+    PARSE_HEAD
+    PARSE_BODY
+    PARSE_CHUNK_SIZE
+    PARSE_CHUNK_DATA
+    PARSE_TRAILER
+    CHUNK_LINE = 1024  # max chunk size line, extensions are ignored
+
+
+cdef class HTTPRequest:
+    cdef:
+        readonly str    method, target, version
+        readonly list   headers
+        readonly bytes  body
+        readonly bint   keep_alive
+
+
+cdef class HTTPParser:
+    cdef:
+        bytearray       _buffer
+        size_t          _start, _searched, _remaining, _size
+        int             _state
+        list            _chunks
+        HTTPRequest     _request
+        HTTPError       _error
+        readonly bint   expect_continue
+        readonly size_t max_header, max_body
+
+    cdef HTTPRequest parse(self)
+    cdef void head(self, size_t end) except *
+    cdef bytes take(self, size_t length)
+    cdef HTTPRequest done(self, bytes body)
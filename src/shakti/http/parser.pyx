@@ -0,0 +1,255 @@
+cdef class HTTPRequest:
+
+    def __init__(self, str method not None, str target not None, list headers=None,
+                 bytes body=b'', str version='HTTP/1.1'):
+        ''' HTTP Request, created by `HTTPParser`
+
+            Type
+                method:  str
+                target:  str                     # e.g. '/path?query'
+                headers: list[tuple[str, str]]   # names are lower case, in received order
+                body:    bytes                   # chunked body is already joined
+                version: str
+                return:  None
+
+            Example
+                >>> request = HTTPRequest('GET', '/?page=2', [('host', 'localhost')])
+                >>> request.path, request.query, request.header('Host')
+                ('/', 'page=2', 'localhost')
+        '''
+        self.method = method
+        self.target = target
+        self.headers = [(name.lower(), value) for name, value in headers or ()]
+        self.body = body
+        self.version = version
+        self.keep_alive = keep_alive(version, self.header('connection', ''))
+
+    @property
+    def path(self)-> str:
+        return self.target.partition('?')[0]
+
+    @property
+    def query(self)-> str:
+        return self.target.partition('?')[2]
+
+    def header(self, str name not None, object default=None)-> str:
+        ''' First value of header `name`, case insensitive '''
+        name = name.lower()
+        for key, value in self.headers:
+            if key == name:
+                return value
+        return default
+
+
+cdef class HTTPParser:
+
+    def __init__(self, *, size_t max_header=65536, size_t max_body=1048576):
+        ''' Incremental HTTP/1.x Request Parser
+
+            Type
+                max_header: int     # max bytes of request line & headers
+                max_body:   int     # max bytes of body, chunked or not
+                return:     None
+
+            Example
+                >>> parser = HTTPParser()
+                >>> parser.feed(b'GET / HTTP/1.1\r\nHost: localhost\r\n\r\nPOST /')
+                [HTTPRequest]
+                >>> parser.feed(b' HTTP/1.1\r\nContent-Length: 5\r\n\r\nhello')
+                [HTTPRequest]
+
+            Note
+                - `feed()` takes any buffer, as many bytes as received, & returns all requests
+                it completes, pipelined requests are returned together in order.
+                - Head end is searched only in newly received data, not whole buffer each time.
+                - `Content-Length` & `Transfer-Encoding: chunked` bodies are supported, trailer
+                fields of chunked body are dropped.
+                - Malformed request raises `HTTPError` with status to answer, parser should not
+                be used after it. If requests before it are complete, they are returned first &
+                error is raised by next `feed()`, see `failed`.
+                - `expect_continue` is set while body of `Expect: 100-continue` request is
+                still missing.
+        '''
+        if not max_header:
+            raise ValueError(f'`{self.__class__.__name__}(max_header)` - can not be `0`')
+        self.max_header = max_header
+        self.max_body = max_body
+        self.expect_continue = False
+        self._buffer = bytearray()
+        self._start = self._searched = self._remaining = self._size = 0
+        self._state = PARSE_HEAD
+        self._chunks = []
+
+    @property
+    def failed(self)-> bool:
+        ''' Malformed request is waiting to be raised by next `feed()` '''
+        return self._error is not None
+
+    def __len__(self):
+        return len(self._buffer) - self._start  # buffered bytes, not yet parsed
+
+    def feed(self, object data not None)-> list[HTTPRequest]:
+        cdef:
+            list        requests = []
+            HTTPRequest request
+        if self._error is not None:
+            raise self._error
+        if len(data):
+            self._buffer += data
+        try:
+            while (request := self.parse()) is not None:
+                requests.append(request)
+        except HTTPError as e:
+            if not requests:
+                raise
+            self._error = e  # note: complete requests come first, error is raised next time.
+        if self._start:
+            # note: deleting from front of `bytearray` only moves its start.
+            del self._buffer[:self._start]
+            self._searched = self._searched - self._start if self._searched > self._start else 0
+            self._start = 0
+        return requests
+
+    cdef HTTPRequest parse(self):
+        cdef:
+            bytes       line
+            size_t      size, length = len(self._buffer)
+            Py_ssize_t  index
+
+        if self._state == PARSE_HEAD:
+            # note: empty lines before request line are ignored, RFC 9112 section 2.2
+            while self._buffer.startswith(b'\r\n', self._start):
+                self._start += 2
+            index = self._buffer.find(b'\r\n\r\n', max(self._start, self._searched))
+            if index < 0:
+                if length - self._start > self.max_header:
+                    raise HTTPError(431, 'request header fields too large')
+                self._searched = max(self._start, length - 3)
+                return None
+            elif <size_t>index - self._start > self.max_header:
+                raise HTTPError(431, 'request header fields too large')
+            self.head(index)
+            self._start = self._searched = index + 4
+            if self._state == PARSE_HEAD:
+                return self.done(b'')
+
+        if self._state == PARSE_BODY:
+            if length - self._start < self._remaining:
+                return None
+            return self.done(self.take(self._remaining))
+
+        while True:  # chunked body
+            if self._state == PARSE_CHUNK_SIZE:
+                if (index := self._buffer.find(b'\r\n', self._start)) < 0:
+                    if length - self._start > CHUNK_LINE:
+                        raise HTTPError(400, 'invalid chunk size')
+                    return None
+                line = self.take(index - self._start).split(b';', 1)[0].strip(b' \t')
+                self._start += 2
+                if not line or line.lstrip(b'0123456789abcdefABCDEF'):
+                    raise HTTPError(400, 'invalid chunk size')
+                if size := int(line, 16):
+                    if self._size + size > self.max_body:
+                        raise HTTPError(413, 'content too large')
+                    self._remaining = size
+                    self._state = PARSE_CHUNK_DATA
+                else:
+                    self._state = PARSE_TRAILER
+            elif self._state == PARSE_CHUNK_DATA:
+                if length - self._start < self._remaining + 2:
+                    return None
+                self._chunks.append(self.take(self._remaining))
+                self._size += self._remaining
+                if not self._buffer.startswith(b'\r\n', self._start):
+                    raise HTTPError(400, 'invalid chunk')
+                self._start += 2
+                self._state = PARSE_CHUNK_SIZE
+            else:  # trailer
+                if (index := self._buffer.find(b'\r\n', self._start)) < 0:
+                    if length - self._start > self.max_header:
+                        raise HTTPError(431, 'request header fields too large')
+                    return None
+                elif <size_t>index == self._start:
+                    self._start += 2
+                    line = b''.join(self._chunks)
+                    self._chunks = []
+                    return self.done(line)
+                self._start = index + 2
+
+    cdef void head(self, size_t end) except *:
+        cdef:
+            list        lines = self.take(end - self._start).split(b'\r\n')
+            list        parts, headers = []
+            bytes       line, name, sep, value, version
+            str         key, text, connection = ''
+            Py_ssize_t  length = -1
+            bint        chunked = False, expect = False
+            HTTPRequest request
+
+        if len(parts := lines[0].split(b' ')) != 3 or not parts[0] or not parts[1]:
+            raise HTTPError(400, 'invalid request line')
+        if (version := parts[2]) not in (b'HTTP/1.1', b'HTTP/1.0'):
+            if version.startswith(b'HTTP/'):
+                raise HTTPError(505, 'HTTP version not supported')
+            raise HTTPError(400, 'invalid request line')
+        for line in lines[1:]:
+            name, sep, value = line.partition(b':')
+            # note: no space is allowed before `:` & obsolete line folding is rejected.
+            if not sep or not name or name[len(name)-1] in b' \t' or line[0] in b' \t':
+                raise HTTPError(400, 'invalid header field')
+            key = name.decode('latin-1').lower()
+            text = value.strip(b' \t').decode('latin-1')
+            headers.append((key, text))
+            if key == 'content-length':
+                if not (text.isascii() and text.isdigit()) or -1 < length != int(text):
+                    raise HTTPError(400, 'invalid content-length')
+                length = int(text)
+            elif key == 'transfer-encoding':
+                if text.lower() != 'chunked':
+                    raise HTTPError(501, f'transfer-encoding {text!r} not implemented')
+                chunked = True
+            elif key == 'connection':
+                connection = text
+            elif key == 'expect':
+                expect = text.lower() == '100-continue'
+        if chunked and length > -1:
+            raise HTTPError(400, 'both content-length & transfer-encoding')
+        elif length > -1 and <size_t>length > self.max_body:
+            raise HTTPError(413, 'content too large')
+
+        request = HTTPRequest.__new__(HTTPRequest)
+        request.method = parts[0].decode('latin-1')
+        request.target = parts[1].decode('latin-1')
+        request.version = version.decode()
+        request.headers = headers
+        request.keep_alive = keep_alive(request.version, connection)
+        self._request = request
+        if chunked:
+            self._state = PARSE_CHUNK_SIZE
+        elif length > 0:
+            self._remaining = length
+            self._state = PARSE_BODY
+        self.expect_continue = expect and self._state != PARSE_HEAD
+
+    cdef bytes take(self, size_t length):
+        cdef bytes data = PyBytes_FromStringAndSize(
+            PyByteArray_AS_STRING(self._buffer) + self._start, length
+        )
+        self._start += length
+        return data
+
+    cdef HTTPRequest done(self, bytes body):
+        cdef HTTPRequest request = self._request
+        request.body = body
+        self._request = None
+        self._state = PARSE_HEAD
+        self._remaining = self._size = 0
+        self.expect_continue = False
+        return request
+
+
+cdef bint keep_alive(str version, str connection):
+    cdef set tokens = {i.strip().lower() for i in connection.split(',')}
+    if version == 'HTTP/1.0':
+        return 'keep-alive' in tokens
+    return 'close' not in tokens
@@ -0,0 +1,30 @@
+from liburing.lib.socket cimport *
+from liburing.socket cimport sockaddr
+from liburing.socket_extra cimport isIP
+from liburing.queue cimport io_uring
+from ..event.entry cimport RING, SQE
+from ..event.run cimport __prep_coroutine
+from ..lib.error cimport HTTPError, UnsupportedOperation
+from .parser cimport HTTPRequest, HTTPParser
+
+
+cdef class HTTPResponse:
+    cdef:
+        readonly unsigned int   status
+        readonly str            reason
+        readonly list           headers
+        readonly object         body
+        readonly bint           stream
+
+    cdef bytes head(self, HTTPRequest request, bint keep_alive, bint framed)
+
+
+cdef class HTTPServer:
+    cdef:
+        object                  handler
+        set                     clients
+        readonly int            fileno
+        readonly in_port_t      port
+        readonly bint           closing
+        readonly size_t         bufsize, max_header, max_body
+        readonly double         timeout
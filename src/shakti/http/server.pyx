@@ -0,0 +1,300 @@
+from http import HTTPStatus as _HTTPStatus
+from traceback import print_exc as _print_exc
+from ..io.common import close as _close
+from ..io.socket import listener as _listener, accept as _accept, recv_into as _recv_into, \
+                        sendall as _sendall, shutdown as _shutdown, getsockname as _getsockname
+
+
+cdef dict REASONS = {i.value: i.phrase for i in _HTTPStatus}
+cdef bytes CONTINUE = b'HTTP/1.1 100 Continue\r\n\r\n'
+
+
+cdef class HTTPResponse:
+
+    def __init__(self, object body=b'', unsigned int status=200, object headers=None, *,
+                 str reason=None):
+        ''' HTTP Response
+
+            Type
+                body:    bytes | str | Iterable[bytes] | AsyncIterable[bytes]
+                status:  int
+                headers: dict[str, str] | list[tuple[str, str]] | None
+                reason:  str | None     # `None` uses standard phrase of `status`
+                return:  None
+
+            Example
+                >>> HTTPResponse(b'hello world', headers={'Content-Type': 'text/plain'})
+
+                >>> async def rows():
+                ...     for row in await query():
+                ...         yield row
+                >>> HTTPResponse(rows())  # streamed as chunked body
+
+            Note
+                - `Content-Length` & `Connection` headers are set by server, `str` body is
+                encoded as UTF-8.
+                - Body that is not `bytes`-like is streamed with `Transfer-Encoding: chunked`,
+                or till connection is closed for HTTP/1.0 client.
+                - Other `body`, e.g. `None`, raises `TypeError`, so handler that returns it is
+                answered with `500` before anything is sent.
+        '''
+        if type(body) is str:
+            body = body.encode()
+        self.body = body
+        self.stream = not isinstance(body, (bytes, bytearray, memoryview))
+        if self.stream and not (hasattr(body, '__aiter__') or hasattr(body, '__iter__')):
+            raise TypeError(f'`{self.__class__.__name__}(body)` - must be `bytes`, `str` or '
+                            f'iterable, got {type(body).__name__!r}')
+        self.status = status
+        self.reason = REASONS.get(status, '') if reason is None else reason
+        if headers is None:
+            self.headers = []
+        elif type(headers) is dict:
+            self.headers = list(headers.items())
+        else:
+            self.headers = list(headers)
+
+    @property
+    def bodyless(self)-> bool:
+        ''' Status that never has body, e.g. `204 No Content` '''
+        return self.status < 200 or self.status == 204 or self.status == 304
+
+    cdef bytes head(self, HTTPRequest request, bint keep_alive, bint framed):
+        cdef:
+            list    lines = [f'HTTP/1.1 {self.status} {self.reason}']
+            str     name, value
+        for name, value in self.headers:
+            lines.append(f'{name}: {value}')
+        if not self.bodyless:
+            if not self.stream:
+                lines.append(f'Content-Length: {len(self.body)}')
+            elif framed:
+                lines.append('Transfer-Encoding: chunked')
+        if not keep_alive:
+            lines.append('Connection: close')
+        elif request.version == 'HTTP/1.0':
+            lines.append('Connection: keep-alive')
+        lines.append('\r\n')
+        return '\r\n'.join(lines).encode('latin-1')
+
+
+cdef class HTTPServer:
+
+    def __init__(self, object handler=None, *, size_t bufsize=65536, size_t max_header=65536,
+                 size_t max_body=1048576, double timeout=60):
+        ''' HTTP/1.1 Server
+
+            Type
+                handler:    Callable[[HTTPRequest], Awaitable[HTTPResponse | bytes | str]]
+                bufsize:    int     # bytes received at once per connection
+                max_header: int     # larger request head is answered with `431`
+                max_body:   int     # larger request body is answered with `413`
+                timeout:    float   # second, idle keep-alive connection is closed after it
+                return:     None
+
+            Example
+                >>> async def hello(request):
+                ...     if request.path != '/':
+                ...         raise HTTPError(404, 'not found')
+                ...     return HTTPResponse(b'hello world', headers={'Content-Type': 'text/plain'})
+
+                >>> server = HTTPServer(hello)
+                >>> await server.serve('0.0.0.0', 8080)
+
+                # or override `respond()`
+                >>> class Server(HTTPServer):
+                ...     async def respond(self, request):
+                ...         return HTTPResponse(request.body)
+
+            Note
+                - Each accepted connection is served by its own `task()`, connection is kept
+                alive till client closes it, asks to close it or is idle for `timeout`.
+                - Pipelined requests that arrive together are handled in order & all their
+                responses are sent by single `sendall()`.
+                - `HTTPError` raised by handler is answered with its status, any other error is
+                printed & answered with `500` & connection is closed.
+                - Error while streaming body or any other error of connection is printed & only
+                its connection is closed.
+                - `Expect: 100-continue` is answered before rest of body is received.
+        '''
+        self.handler = handler
+        self.bufsize = bufsize or 65536
+        self.max_header = max_header
+        self.max_body = max_body
+        self.timeout = timeout
+        self.fileno = -1
+        self.port = 0
+        self.closing = False
+        self.clients = set()
+
+    async def serve(self, str host not None='127.0.0.1', in_port_t port=8080, *,
+                    int backlog=1024, bint reuse_port=True):
+        ''' Listen & Serve till `close()`
+
+            Example
+                >>> async def main():
+                ...     await server.serve('127.0.0.1', 0)
+                >>> await task(main())
+                >>> server.port  # random port
+                41829
+                >>> ...
+                >>> await server.close()
+        '''
+        cdef:
+            SQE         sqe = SQE(0, error=False)
+            int         sockfd
+            bytes       _host = host.encode()
+            io_uring    ring
+        if self.fileno > -1 or self.closing:
+            raise UnsupportedOperation(f'`{self.__class__.__name__}.serve()` - is already '
+                                       'serving or closed')
+        sqe.job = RING
+        ring = await sqe
+        self.fileno = await _listener(host, port, backlog, reuse_port=reuse_port)
+        try:
+            self.port = (await _getsockname(self.fileno, sockaddr(
+                __AF_INET6 if isIP(__AF_INET6, _host) else __AF_INET, _host, 0
+            )))[1]
+            while not self.closing:
+                try:
+                    sockfd = await _accept(self.fileno)
+                except OSError:
+                    if self.closing:
+                        break  # `shutdown()` by `close()`
+                    raise
+                __prep_coroutine(ring, (self.connection(sockfd),), 1, True)
+        finally:
+            await _close(self.fileno)
+            self.fileno = -1
+
+    async def close(self):
+        ''' Stop Accepting & End Idle Connections
+
+            Note
+                - Request being handled is still answered, then its connection is closed.
+        '''
+        cdef int sockfd
+        self.closing = True
+        for sockfd in ([self.fileno] if self.fileno > -1 else []) + list(self.clients):
+            try:
+                await _shutdown(sockfd, __SHUT_RD)  # note: wakes waiting `accept` & `recv`
+            except OSError:
+                pass  # already disconnected
+
+    async def respond(self, HTTPRequest request):
+        ''' Answer Request, calls `handler` '''
+        if self.handler is None:
+            raise HTTPError(404, 'not found')
+        return await self.handler(request)
+
+    async def connection(self, int sockfd):
+        ''' Serve Single Connection, `sockfd` is closed at end '''
+        cdef:
+            HTTPParser      parser = HTTPParser(max_header=self.max_header, max_body=self.max_body)
+            bytearray       buffer = bytearray(self.bufsize)
+            memoryview      view = memoryview(buffer)
+            list            requests, out
+            HTTPRequest     request
+            HTTPResponse    response
+            bint            keep_alive = True, framed
+            bytes           head
+            int             length
+
+        self.clients.add(sockfd)
+        try:
+            while keep_alive and not self.closing:
+                try:
+                    if parser.failed:
+                        requests = parser.feed(b'')  # raises malformed request
+                    else:
+                        length = await _recv_into(sockfd, buffer, timeout=self.timeout)
+                        if not length:
+                            break
+                        requests = parser.feed(view[:length])
+                except TimeoutError:
+                    break  # idle
+                except HTTPError as e:
+                    response = error_response(e)
+                    await _sendall(sockfd, response.head(None, False, True) + response.body)
+                    break
+                out = []
+                for request in requests:
+                    # note: HTTP/1.0 has no chunked encoding, streamed body ends when connection
+                    #       is closed.
+                    framed = request.version != 'HTTP/1.0'
+                    keep_alive = request.keep_alive and not self.closing
+                    try:
+                        response = as_response(await self.respond(request))
+                        if response.stream and not framed:
+                            keep_alive = False
+                        head = response.head(request, keep_alive, framed)  # e.g. bad header
+                    except HTTPError as e:
+                        response = error_response(e)
+                        head = response.head(request, keep_alive, True)
+                    except Exception:
+                        _print_exc()
+                        response = HTTPResponse(b'internal server error', 500)
+                        keep_alive = False
+                        head = response.head(request, keep_alive, True)
+                    if response.stream:
+                        out.append(head)
+                        await _sendall(sockfd, b''.join(out))
+                        out = []
+                        try:
+                            await _stream(sockfd, request, response, framed)
+                        except OSError:
+                            raise
+                        except Exception:
+                            # note: head is already sent, closing is only way to tell client
+                            #       body is broken.
+                            _print_exc()
+                            keep_alive = False
+                    else:
+                        out.append(head)
+                        if request.method != 'HEAD' and not response.bodyless:
+                            out.append(response.body)
+                    if not keep_alive:
+                        break
+                if out:
+                    await _sendall(sockfd, b''.join(out))
+                if keep_alive and parser.expect_continue:
+                    await _sendall(sockfd, CONTINUE)
+        except OSError:
+            pass  # e.g. connection reset by peer
+        except Exception:
+            _print_exc()  # note: only this connection is closed, `run()` keeps on serving.
+        finally:
+            self.clients.discard(sockfd)
+            await _close(sockfd)
+
+
+async def _stream(int sockfd, HTTPRequest request, HTTPResponse response, bint framed):
+    # note: head is already sent.
+    if request.method == 'HEAD' or response.bodyless:
+        return
+    if hasattr(response.body, '__aiter__'):
+        async for chunk in response.body:
+            await _send_chunk(sockfd, chunk, framed)
+    else:
+        for chunk in response.body:
+            await _send_chunk(sockfd, chunk, framed)
+    if framed:
+        await _sendall(sockfd, b'0\r\n\r\n')
+
+
+async def _send_chunk(int sockfd, object chunk, bint framed):
+    if type(chunk) is str:
+        chunk = chunk.encode()
+    if len(chunk):
+        await _sendall(sockfd, b'%x\r\n%b\r\n' % (len(chunk), chunk) if framed else chunk)
+
+
+cdef HTTPResponse as_response(object response):
+    if type(response) is HTTPResponse:
+        return response
+    return HTTPResponse(response)
+
+
+cdef HTTPResponse error_response(HTTPError error):
+    return HTTPResponse(error.message or REASONS.get(error.status, ''), error.status,
+                        [('Content-Type', 'text/plain')])
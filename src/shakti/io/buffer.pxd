@@ -0,0 +1,68 @@
+from cpython.mem cimport PyMem_RawCalloc, PyMem_RawMalloc, PyMem_RawFree
+from cpython.buffer cimport PyBuffer_FillInfo
+from libc.string cimport memset
+from libc.errno cimport ENOBUFS
+from posix.mman cimport PROT_READ, PROT_WRITE, MAP_PRIVATE, MAP_ANONYMOUS, MAP_FAILED, mmap, munmap
+from liburing.lib.type cimport __u16, __u64, __iovec
+from liburing.lib.uring cimport __io_uring_sqe, __io_uring_buf, __io_uring_buf_ring, \
+                                __io_uring_buf_reg, __io_uring_buf_ring_init, \
+                                __io_uring_buf_ring_add, __io_uring_buf_ring_advance, \
+                                __io_uring_buf_ring_mask
+from liburing.queue cimport io_uring
+from liburing.register cimport io_uring_buf_reg, io_uring_register_buf_ring, \
+                               io_uring_unregister_buf_ring, io_uring_register_buffers, \
+                               io_uring_unregister_buffers
+from liburing.common cimport iovec
+from liburing.error cimport memory_error, trap_error
+from ..event.entry cimport RING, SQE
+from ..core.base cimport AsyncBase
+
+
+cdef extern from * nogil:
+    '''
+    static inline void __shakti_sqe_set_buf_group(struct io_uring_sqe* sqe, __u16 bgid)
+    {
+        sqe->buf_group = bgid;
+    }
+    '''
+    # note: `buf_group` is not exposed by `liburing.lib.uring.__io_uring_sqe`
+    void sqe_set_buf_group '__shakti_sqe_set_buf_group'(__io_uring_sqe* sqe, __u16 bgid)
+
+
+cdef class BufferBase(AsyncBase):
+    cdef:
+        io_uring                ring
+        unsigned char*          memory
+        readonly unsigned int   count, size, available
+
+    cdef void put(self, __u16 bid) noexcept nogil
+    cdef BufferLease lease(self, __u16 bid, unsigned int length)
+
+
+cdef class BufferRing(BufferBase):
+    cdef:
+        __io_uring_buf_ring*    ptr
+        int                     mask
+        readonly int            group
+
+    cdef int register(self) except -1
+
+
+cdef class BufferPool(BufferBase):
+    cdef:
+        __u16*                  stack
+        bint                    registered
+
+    cdef int register(self) except -1
+    cdef BufferLease pop(self, unsigned int length)
+
+
+cdef class BufferLease:
+    cdef:
+        BufferBase              owner
+        __u16                   bid
+        unsigned int            exports
+        readonly unsigned int   length
+
+    cdef unsigned char* data(self) noexcept
+    cdef int index(self) noexcept
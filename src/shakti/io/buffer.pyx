@@ -0,0 +1,347 @@
+cdef int _next_group = 0
+
+
+cdef class BufferBase(AsyncBase):
+
+    def __dealloc__(self):
+        if self.memory is not NULL:
+            PyMem_RawFree(self.memory)
+            self.memory = NULL
+
+    async def __aexit__(self, *errors):
+        self.close()
+        if any(errors):
+            return False
+
+    cdef void put(self, __u16 bid) noexcept nogil:
+        pass
+
+    cdef BufferLease lease(self, __u16 bid, unsigned int length):
+        cdef BufferLease lease = BufferLease.__new__(BufferLease)
+        lease.owner = self
+        lease.bid = bid
+        lease.length = length
+        self.available -= 1
+        return lease
+
+    def close(self):
+        pass
+
+
+cdef class BufferRing(BufferBase):
+
+    def __init__(self, unsigned int count=64, unsigned int size=4096, *, int group=-1):
+        ''' Provided Buffer Ring - kernel picks a buffer as data arrives.
+
+            Type
+                count:  int     # number of buffers, must be power of 2
+                size:   int     # size of each buffer
+                group:  int     # buffer group id, default is auto assigned
+                return: None
+
+            Example
+                >>> async with BufferRing(64, 4096) as br:
+                ...     async for lease in recv_many(client_fd, br):
+                ...         with lease:
+                ...             await sendall(client_fd, lease)  # zero-copy
+
+                # or
+                >>> br = await BufferRing()
+                ...
+                >>> br.close()
+
+            Note
+                - Memory is shared by all `recv_many` that use same `BufferRing`, so memory
+                scales with number of active reads not number of open connections.
+                - `BufferLease` must be released to return its buffer back to the ring.
+        '''
+        global _next_group
+        if not count or count > 32768 or count & (count - 1):
+            self.msg = f'`{self.__class__.__name__}(count)` - must be power of 2 and `<= 32768`'
+            raise ValueError(self.msg)
+        if not size:
+            self.msg = f'`{self.__class__.__name__}(size)` - can not be `0`'
+            raise ValueError(self.msg)
+        if group < 0:
+            group = _next_group
+            _next_group = (_next_group + 1) & 0xffff
+        self.group = group
+        self.count = count
+        self.size = size
+        self.mask = __io_uring_buf_ring_mask(count)
+
+    def __bool__(self):
+        return self.ptr is not NULL
+
+    async def __ainit__(self):
+        cdef SQE sqe = SQE(0, error=False)
+        sqe.job = RING
+        self.ring = await sqe
+        self.register()
+
+    cdef int register(self) except -1:
+        cdef:
+            __u16               bid
+            void*               ptr
+            __io_uring_buf_reg  _reg
+            io_uring_buf_reg    reg = io_uring_buf_reg()
+
+        if self.memory is NULL:
+            self.memory = <unsigned char*>PyMem_RawCalloc(self.count, self.size)
+            if self.memory is NULL:
+                memory_error(self)
+        ptr = mmap(NULL, self.count * sizeof(__io_uring_buf), PROT_READ | PROT_WRITE,
+                   MAP_PRIVATE | MAP_ANONYMOUS, -1, 0)
+        if ptr is MAP_FAILED:
+            memory_error(self)
+        memset(&_reg, 0, sizeof(__io_uring_buf_reg))
+        _reg.ring_addr = <__u64>ptr
+        _reg.ring_entries = self.count
+        _reg.bgid = self.group
+        reg.ptr = &_reg
+        try:
+            io_uring_register_buf_ring(self.ring, reg, 0)
+        except BaseException:
+            munmap(ptr, self.count * sizeof(__io_uring_buf))
+            raise
+        finally:
+            reg.ptr = NULL
+        self.ptr = <__io_uring_buf_ring*>ptr
+        __io_uring_buf_ring_init(self.ptr)
+        for bid in range(self.count):
+            __io_uring_buf_ring_add(self.ptr, self.memory + bid * self.size,
+                                    self.size, bid, self.mask, bid)
+        __io_uring_buf_ring_advance(self.ptr, self.count)
+        self.available = self.count
+        return 0
+
+    cdef void put(self, __u16 bid) noexcept nogil:
+        # return single buffer back to the ring, no syscall needed.
+        if self.ptr is not NULL:
+            __io_uring_buf_ring_add(self.ptr, self.memory + bid * self.size,
+                                    self.size, bid, self.mask, 0)
+            __io_uring_buf_ring_advance(self.ptr, 1)
+            self.available += 1
+
+    def close(self):
+        ''' Unregister buffer ring from kernel
+
+            Note
+                - Memory is kept alive until all `BufferLease` are gone.
+        '''
+        if self.ptr is not NULL:
+            try:
+                io_uring_unregister_buf_ring(self.ring, self.group)
+            finally:
+                munmap(self.ptr, self.count * sizeof(__io_uring_buf))
+                self.ptr = NULL
+
+
+cdef class BufferPool(BufferBase):
+
+    def __init__(self, unsigned int count=16, unsigned int size=65536):
+        ''' Registered Buffer Pool - buffers are pinned & mapped by kernel only once.
+
+            Type
+                count:  int     # number of buffers, `<= 16384`
+                size:   int     # size of each buffer, `<= 1 GiB`
+                return: None
+
+            Example
+                >>> async with BufferPool(16, 65536) as pool:
+                ...     with await read(fd, 65536, pool=pool) as lease:
+                ...         await write(other_fd, lease)  # zero-copy
+                ...
+                ...     lease = pool.acquire()
+                ...     memoryview(lease)[:5] = b'hello'
+                ...     lease.resize(5)
+                ...     await write(fd, lease)
+                ...     lease.release()
+
+                # or
+                >>> pool = await BufferPool()
+                ...
+                >>> pool.close()
+
+            Note
+                - `read`, `write` and `File` use `IORING_OP_READ_FIXED` & `IORING_OP_WRITE_FIXED`
+                with `BufferPool` buffers, so kernel skips pinning & mapping of pages on each
+                operation.
+                - `BufferLease` must be released to return its buffer back to the pool.
+                - Only one `BufferPool` can be registered per ring.
+        '''
+        if not count or count > 16384:
+            self.msg = f'`{self.__class__.__name__}(count)` - must be `> 0` and `<= 16384`'
+            raise ValueError(self.msg)
+        if not size or size > 1 << 30:
+            self.msg = f'`{self.__class__.__name__}(size)` - must be `> 0` and `<= 1 GiB`'
+            raise ValueError(self.msg)
+        self.count = count
+        self.size = size
+
+    def __dealloc__(self):
+        if self.stack is not NULL:
+            PyMem_RawFree(self.stack)
+            self.stack = NULL
+
+    def __bool__(self):
+        return self.registered
+
+    async def __ainit__(self):
+        cdef SQE sqe = SQE(0, error=False)
+        sqe.job = RING
+        self.ring = await sqe
+        self.register()
+
+    cdef int register(self) except -1:
+        cdef:
+            __u16   bid
+            __iovec *_iov
+            iovec   iov = iovec(None)
+
+        if self.memory is NULL:
+            self.memory = <unsigned char*>PyMem_RawCalloc(self.count, self.size)
+            self.stack = <__u16*>PyMem_RawMalloc(self.count * sizeof(__u16))
+            if self.memory is NULL or self.stack is NULL:
+                memory_error(self)
+            for bid in range(self.count):
+                self.stack[bid] = self.count - 1 - bid  # note: lowest `bid` is leased first.
+            self.available = self.count
+        _iov = <__iovec*>PyMem_RawMalloc(self.count * sizeof(__iovec))
+        if _iov is NULL:
+            memory_error(self)
+        for bid in range(self.count):
+            _iov[bid].iov_base = self.memory + bid * self.size
+            _iov[bid].iov_len = self.size
+        iov.ptr = _iov
+        try:
+            io_uring_register_buffers(self.ring, iov, self.count)
+            # note: kernel keeps its own copy of `iovec`s.
+        finally:
+            iov.ptr = NULL
+            PyMem_RawFree(_iov)
+        self.registered = True
+        return 0
+
+    cdef void put(self, __u16 bid) noexcept nogil:
+        self.stack[self.available] = bid
+        self.available += 1
+
+    cdef BufferLease pop(self, unsigned int length):
+        if not self.registered:
+            self.msg = f'`{self.__class__.__name__}` is not registered, use `await BufferPool()`'
+            raise ValueError(self.msg)
+        if not self.available:
+            trap_error(-ENOBUFS, f'`{self.__class__.__name__}` - all buffers are leased')
+        return self.lease(self.stack[self.available-1], length)
+
+    def acquire(self)-> BufferLease:
+        ''' Lease free buffer, to be filled & used with `write`
+
+            Example
+                >>> lease = pool.acquire()
+                >>> len(lease)
+                65536
+
+            Note
+                - Use `BufferLease.resize()` to set length of filled region.
+        '''
+        return self.pop(self.size)
+
+    def close(self):
+        ''' Unregister buffer pool from kernel
+
+            Note
+                - Memory is kept alive until all `BufferLease` are gone.
+        '''
+        if self.registered:
+            try:
+                io_uring_unregister_buffers(self.ring)
+            finally:
+                self.registered = False
+
+
+cdef class BufferLease:
+    ''' Zero-Copy Leased Buffer
+
+        Example
+            >>> with lease:
+            ...     len(lease)
+            5
+            ...     bytes(lease)
+            b'hello'
+            ...     memoryview(lease)[:2]
+            <memory at 0x...>
+
+            # or
+            >>> lease.release()
+
+        Note
+            - Supports buffer protocol, can be passed directly into `send`, `write`, ...
+            - Buffer is returned to `BufferRing` or `BufferPool` on `release()`, exiting `with`
+            block or when `BufferLease` is garbage collected.
+            - Can not be released while a `memoryview` of it is still in use.
+    '''
+    def __init__(self):
+        raise TypeError('`BufferLease()` is created by `BufferRing` or `BufferPool`')
+
+    def __dealloc__(self):
+        if self.owner is not None:
+            self.owner.put(self.bid)
+            self.owner = None
+
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        if self.owner is None:
+            raise BufferError('`BufferLease` has already been released')
+        PyBuffer_FillInfo(buffer, self, self.data(), self.length, self.index() < 0, flags)
+        # note: only `BufferPool` buffer is writable, `BufferRing` buffer belongs to kernel.
+        self.exports += 1
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        self.exports -= 1
+
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.owner is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *errors):
+        self.release()
+
+    cdef unsigned char* data(self) noexcept:
+        return self.owner.memory + self.bid * self.owner.size
+
+    cdef int index(self) noexcept:
+        # registered buffer index, `-1` if not leased from `BufferPool`
+        if isinstance(self.owner, BufferPool):
+            return self.bid
+        return -1
+
+    def resize(self, unsigned int length):
+        ''' Set length of filled region
+
+            Example
+                >>> lease = pool.acquire()
+                >>> memoryview(lease)[:5] = b'hello'
+                >>> lease.resize(5)
+                >>> bytes(lease)
+                b'hello'
+        '''
+        if self.owner is None:
+            raise BufferError('`BufferLease` has already been released')
+        if self.exports:
+            raise BufferError('`BufferLease.resize()` - buffer is still in use by `memoryview`')
+        if length > self.owner.size:
+            raise ValueError(f'`BufferLease.resize()` - can not be `> {self.owner.size}`')
+        self.length = length
+
+    def release(self):
+        if self.exports:
+            raise BufferError('`BufferLease.release()` - buffer is still in use by `memoryview`')
+        if self.owner is not None:
+            self.owner.put(self.bid)
+            self.owner = None
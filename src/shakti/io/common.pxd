@@ -1,5 +1,5 @@
 from liburing.common cimport io_uring_prep_close, io_uring_prep_close_direct
-from ..event.entry cimport SQE
+from ..event.entry cimport SQE, new_sqe, free_sqe
 from ..core.base cimport AsyncBase
 from ..lib.error cimport UnsupportedOperation
 
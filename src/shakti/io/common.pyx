@@ -26,9 +26,10 @@ async def close(unsigned int fd, bint direct=False):
         Note
             - Set `direct=True` to close direct descriptor & `fd` can be used to supply file index.
     '''
-    cdef SQE sqe = SQE()
+    cdef SQE sqe = new_sqe()
     if direct:
         io_uring_prep_close_direct(sqe, fd)
     else:
         io_uring_prep_close(sqe, fd)
     await sqe
+    free_sqe(sqe)
@@ -1,22 +1,46 @@
-from liburing.lib.type cimport __s32, __u32, __u64
+from libc.errno cimport ENFILE
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from liburing.lib.type cimport __s32, __u32, __s64, __u64
 from liburing.lib.file cimport *
-from liburing.common cimport AT_FDCWD, io_uring_prep_close, io_uring_prep_close_direct
+from liburing.common cimport AT_FDCWD, AT_EMPTY_PATH, IORING_FILE_INDEX_ALLOC, iovec, \
+                             io_uring_prep_close, io_uring_prep_close_direct
 from liburing.statx cimport STATX_SIZE, statx, io_uring_prep_statx
 from liburing.file cimport open_how, io_uring_prep_openat, io_uring_prep_openat2, \
-                           io_uring_prep_read, io_uring_prep_write
-from ..event.entry cimport SQE
+                           io_uring_prep_openat_direct, io_uring_prep_openat2_direct, \
+                           io_uring_prep_write, io_uring_prep_readv, io_uring_prep_writev
+from liburing.queue cimport IOSQE_FIXED_FILE, io_uring
+from liburing.lib.uring cimport __io_uring_prep_read, __io_uring_prep_read_fixed, \
+                                __io_uring_prep_write_fixed
+from liburing.error cimport raise_error
+from ..event.entry cimport RING, SQE, new_sqe, free_sqe
 from ..lib.error cimport UnsupportedOperation
 from .common cimport IOBase
+from .buffer cimport BufferPool, BufferLease
 
 
 cdef class File(IOBase):
     cdef:
         str             _encoding
-        int             _dir_fd, _seek
+        int             _dir_fd
+        __u64           _seek
+        __s64           _size
         bint            _bytes, _append, _creating, _direct
         __u64           _resolve, _flags, _mode
         readonly bytes  path
 
+    cdef void prep_openat2(self, SQE sqe, open_how how) noexcept
+    cdef statx prep_size(self, SQE sqe)
+
+
+cdef class FileChunk(SQE):
+    cdef:
+        bytes           buffer
+        __u64           offset
+        unsigned int    filled
+
+    cdef bytes data(self)
+    cdef void rest(self, int fd) noexcept
+
 
 cpdef enum __file_define__:
     # note: copied from `liburing.file.pxd`
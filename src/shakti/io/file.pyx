@@ -1,3 +1,7 @@
+from collections import deque
+from codecs import getincrementaldecoder as _getincrementaldecoder
+
+
 FILE_ACCEESS = {'x', 'a', 'r', 'w', 'b', '+', '!', 'T'}
 
 
@@ -10,6 +14,7 @@ cdef class File(IOBase):
                  *,
                  __u64 resolve=0,
                  dir_fd=AT_FDCWD,
+                 bint direct=False,
                  **kwargs):
         ''' Asynchronous "io_uring" File I/O - easy to use, highly optimized.
 
@@ -19,6 +24,7 @@ cdef class File(IOBase):
                 mode:    int
                 resolve: int
                 dir_fd:  int
+                direct:  bool
                 kwargs:  Dict[str, Union[str, int]]     # extended features
                 return:  None
 
@@ -88,6 +94,8 @@ cdef class File(IOBase):
                 - Mode can be combined e.g. `access='rw'` for reading and writing.
                 - Internally maintains offset + read/write last seek position.
                 - `AT_FDCWD` uses current working directory, if `path` is relative path.
+                - `direct=True` opens file into registered `FileTable`, `fileno` is then direct
+                descriptor index & every read/write skips kernel file table lookup.
         '''
         cdef set[str] found
         if found := set(access) - FILE_ACCEESS:
@@ -102,6 +110,8 @@ cdef class File(IOBase):
         self._flags = kwargs.get('flags', 0)
         self._mode = mode
         self._seek = 0
+        self._size = -1
+        self._direct = direct
         self.path = path.encode()
 
         # True/False
@@ -210,7 +220,7 @@ cdef class File(IOBase):
                 - `File.open` combines features of `openat` & `openat2` as its own.
         '''
         cdef:
-            SQE         sqe = SQE()
+            SQE         sqe = new_sqe()
             open_how    how
 
         if self.fileno > -1:
@@ -220,15 +230,19 @@ cdef class File(IOBase):
         if self._resolve:
             how = open_how(self._flags, self._mode, self._resolve)
             try:
-                io_uring_prep_openat2(sqe, self.path, how, self._dir_fd)
+                self.prep_openat2(sqe, how)
                 await sqe
             except BlockingIOError:
                 if how.resolve & RESOLVE_CACHED:
                     how.resolve &= ~RESOLVE_CACHED
                     # note: must retry without `RESOLVE_CACHED` since file path
                     #       was not in kernel's lookup cache.
-                io_uring_prep_openat2(sqe, self.path, how, self._dir_fd)
+                self.prep_openat2(sqe, how)
                 await sqe
+        elif self._direct:
+            io_uring_prep_openat_direct(sqe, self.path, self._flags, IORING_FILE_INDEX_ALLOC,
+                                        self._mode, self._dir_fd)
+            await sqe
         else:
             io_uring_prep_openat(sqe, self.path, self._flags, self._mode, self._dir_fd)
             # note: `EWOULDBLOCK` would be raised if `O_NONBLOCK` `flags` was set.
@@ -236,25 +250,37 @@ cdef class File(IOBase):
             #       there is no point accounting for that error.
             await sqe
         self.fileno = sqe.result
+        free_sqe(sqe)
+
+    cdef void prep_openat2(self, SQE sqe, open_how how) noexcept:
+        if self._direct:
+            io_uring_prep_openat2_direct(sqe, self.path, how, IORING_FILE_INDEX_ALLOC,
+                                         self._dir_fd)
+        else:
+            io_uring_prep_openat2(sqe, self.path, how, self._dir_fd)
 
     async def close(self):
         self.closed()
 
-        cdef SQE sqe = SQE()
+        cdef SQE sqe = new_sqe()
 
         if self._direct:
             io_uring_prep_close_direct(sqe, self.fileno)
         else:
             io_uring_prep_close(sqe, self.fileno)
         await sqe
+        free_sqe(sqe)
         self.fileno = -1
 
-    async def read(self, object length=None, object offset=None)-> str | bytes:
+    async def read(self, object length=None, object offset=None, *, double timeout=0,
+                   BufferPool pool=None)-> str | bytes | BufferLease:
         '''
             Type
-                length: Optional[int]
-                offset: Optional[int]
-                return: str | bytes
+                length:  Optional[int]
+                offset:  Optional[int]
+                timeout: float
+                pool:    Optional[BufferPool]
+                return:  str | bytes | BufferLease
 
             Example
                 # file content: b'hello world'
@@ -278,43 +304,216 @@ cdef class File(IOBase):
                 >>>     await file.read()
                 b'hello world'
 
+                >>> async with BufferPool() as pool, File('path/file') as file:
+                ...     with await file.read(pool=pool) as lease:
+                ...         bytes(lease)
+                b'hello world'
+
             Note
                 - if `offset` is not set last read/write seek position is used
+                - if `length` is not set rest of the file is read, file size is cached after
+                first `statx` so following reads skip it.
+                - `timeout` (second) raises `TimeoutError` if read takes longer.
+                - With `pool` file is read into registered buffer using `IORING_OP_READ_FIXED`,
+                at most `pool.size` bytes are read & `BufferLease` is returned as is, no copy or
+                decode is done.
         '''
         self.closed()
         self.reading()
 
         cdef:
-            SQE     sqe = SQE()
-            statx   stat
-            __u64   _length, _offset = self._seek if offset is None else offset
+            SQE         sqe = new_sqe(1, True, timeout), _sqe
+            statx       stat
+            bytes       buffer
+            BufferLease lease
+            __u64       _length, _offset = self._seek if offset is None else offset
+
+        if pool is not None:
+            lease = prep_read_fixed(sqe, self.fileno, pool,
+                                    pool.size if length is None else length, _offset)
+            if self._direct:
+                sqe.flags |= IOSQE_FIXED_FILE
+            await sqe
+            lease.length = sqe.result
+            free_sqe(sqe)
+            self._seek = _offset + lease.length
+            return lease
 
         if length is None:
-            stat = statx()
-            io_uring_prep_statx(sqe, stat, self.path, 0, STATX_SIZE, self._dir_fd)
-            await sqe
-            _length = stat.stx_size
+            if self._size < 0:
+                _sqe = new_sqe()  # note: `statx` leaves `rw_flags` set, so separate entry.
+                stat = self.prep_size(_sqe)
+                await _sqe
+                free_sqe(_sqe)
+                self._size = stat.stx_size
+            _length = self._size - _offset if <__u64>self._size > _offset else 0
         else:
             _length = length
 
-        cdef bytearray buffer = bytearray(_length)
+        if not _length:
+            free_sqe(sqe)
+            return b'' if self._bytes else ''
 
-        io_uring_prep_read(sqe, self.fileno, buffer, _length, _offset)
+        # note: kernel reads straight into `bytes` memory, so no extra copy is made.
+        buffer = PyBytes_FromStringAndSize(NULL, _length)
+        __io_uring_prep_read(sqe.ptr, self.fileno, PyBytes_AS_STRING(buffer), _length, _offset)
+        if self._direct:
+            sqe.flags |= IOSQE_FIXED_FILE
         await sqe
         cdef unsigned int result = sqe.result
+        free_sqe(sqe)
 
         self._seek = _offset + result
-        if self._bytes:
-            return bytes(buffer if _length == result else buffer[:result])
+        if _length != result:
+            buffer = buffer[:result]
+        return buffer if self._bytes else buffer.decode(self._encoding)
+
+    async def readinto(self, unsigned char[::1] buffer, object offset=None, *,
+                       double timeout=0)-> __u32:
+        '''
+            Type
+                buffer:  bytearray | memoryview | array | ...
+                offset:  Optional[int]
+                timeout: float
+                return:  int
+
+            Example
+                >>> buffer = bytearray(1024)
+                >>> async with File('path/file') as file:
+                ...     await file.readinto(buffer)
+                11
+                >>> buffer[:11]
+                bytearray(b'hello world')
+
+            Note
+                - Kernel reads straight into writable `buffer`, no new `bytes` is created.
+                - if `offset` is not set last read/write seek position is used
+        '''
+        self.closed()
+        self.reading()
+
+        cdef:
+            __u32   length = len(buffer)
+            __u64   _offset = self._seek if offset is None else offset
+
+        if length == 0:
+            return length
+
+        cdef SQE sqe = new_sqe(1, True, timeout)
+        __io_uring_prep_read(sqe.ptr, self.fileno, &buffer[0], length, _offset)
+        if self._direct:
+            sqe.flags |= IOSQE_FIXED_FILE
+        await sqe
+        length = sqe.result
+        free_sqe(sqe)
+        self._seek = _offset + length
+        return length
+
+    async def iter_chunks(self, unsigned int chunk_size=65536, unsigned int readahead=4,
+                          object offset=None):
+        '''
+            Type
+                chunk_size: int
+                readahead:  int     # number of reads kept in-flight
+                offset:     Optional[int]
+                return:     AsyncIterator[str | bytes]
+
+            Example
+                >>> async with File('path/big.log', 'rb') as file:
+                ...     async for chunk in file.iter_chunks(1 << 20, readahead=8):
+                ...         await sendall(client_fd, chunk)
+
+            Note
+                - `readahead` reads are kept in-flight at increasing offsets & chunks are yielded
+                in order as they complete, so memory use is `chunk_size * readahead` no matter how
+                large the file is.
+                - if `offset` is not set last read/write seek position is used, seek position
+                follows yielded chunks.
+                - File size is taken from cached `statx`, data appended afterwards is not read.
+                - Short read is continued till its chunk is full, chunk is only shorter at end of
+                file.
+                - In text mode chunks are decoded incrementally, so multi-byte character split
+                between chunks is not broken.
+        '''
+        self.closed()
+        self.reading()
+
+        if not chunk_size or not readahead:
+            self.msg = f'`{self.__class__.__name__}.iter_chunks()` - '
+            self.msg += '`chunk_size` & `readahead` can not be `0`'
+            raise ValueError(self.msg)
+
+        cdef:
+            SQE         sqe = SQE(0, error=False)
+            statx       stat
+            FileChunk   chunk
+            io_uring    ring
+            object      inflight = deque()
+            object      decoder = None
+            __u64       length, _offset = self._seek if offset is None else offset
+
+        if not self._bytes:
+            decoder = _getincrementaldecoder(self._encoding)()
+        sqe.job = RING
+        ring = await sqe
+        if self._size < 0:
+            sqe = new_sqe()
+            stat = self.prep_size(sqe)
+            await sqe
+            free_sqe(sqe)
+            self._size = stat.stx_size
+        try:
+            while True:
+                # keep `readahead` reads in-flight, submitted with next `await`.
+                while len(inflight) < readahead and _offset < <__u64>self._size:
+                    length = min(chunk_size, self._size - _offset)
+                    chunk = new_chunk(self.fileno, length, _offset, self._direct)
+                    if chunk.put(ring) or not inflight:
+                        inflight.append(chunk)  # note: if ring is full `await` arms it instead.
+                        _offset += length
+                    else:
+                        break
+                if not inflight:
+                    break
+                chunk = inflight.popleft()
+                await chunk
+                while chunk.result:
+                    chunk.filled += chunk.result
+                    if chunk.filled == len(chunk.buffer):
+                        break
+                    chunk.rest(self.fileno)  # short read, read rest of range.
+                    await chunk
+                if not chunk.filled:
+                    break  # file was truncated
+                self._seek = chunk.offset + chunk.filled
+                if decoder is None:
+                    yield chunk.data()
+                else:
+                    yield decoder.decode(chunk.data())
+            if decoder is not None and (tail := decoder.decode(b'', True)):
+                yield tail
+        finally:
+            while inflight:
+                if (chunk := inflight.popleft()).armed:
+                    chunk.cancel(ring)
+                    # note: `chunk` holds on to its buffer till kernel is done with it.
+
+    cdef statx prep_size(self, SQE sqe):
+        # note: `fd` based `statx` does not resolve `path` again, direct descriptor has no `fd`.
+        cdef statx stat = statx()
+        if self._direct:
+            io_uring_prep_statx(sqe, stat, self.path, 0, STATX_SIZE, self._dir_fd)
         else:
-            return (buffer if _length == result else buffer[:result]).decode(self._encoding)
+            io_uring_prep_statx(sqe, stat, b'', AT_EMPTY_PATH, STATX_SIZE, self.fileno)
+        return stat
 
-    async def write(self, object data, object offset=None)-> __u32:
+    async def write(self, object data, object offset=None, *, double timeout=0)-> __u32:
         '''
             Type
-                data:   Union[str, bytes, bytearray, memoryview]
-                offset: int
-                return: int
+                data:    Union[str, bytes, bytearray, memoryview, BufferLease]
+                offset:  int
+                timeout: float
+                return:  int
 
             Example
                 >>> async with File('path/file', 'w') as file:
@@ -327,6 +526,8 @@ cdef class File(IOBase):
 
             Note
                 - if `offset` is not set last read/write seek position is used
+                - `timeout` (second) raises `TimeoutError` if write takes longer.
+                - `BufferLease` of `BufferPool` is written using `IORING_OP_WRITE_FIXED`.
         '''
         self.closed()
         self.writing()
@@ -340,17 +541,24 @@ cdef class File(IOBase):
             return 0
 
         cdef:
-            SQE     sqe = SQE()
+            SQE     sqe = new_sqe(1, True, timeout)
             __u64   _offset = self._seek if offset is None else offset
 
-        if not self._bytes:
-            data = data.encode(self._encoding)
-
-        io_uring_prep_write(sqe, self.fileno, data, len(data), _offset)
+        if not prep_write_fixed(sqe, self.fileno, data, _offset):
+            if not self._bytes:
+                data = data.encode(self._encoding)
+            io_uring_prep_write(sqe, self.fileno, data, len(data), _offset)
+        if self._direct:
+            sqe.flags |= IOSQE_FIXED_FILE
         await sqe
 
         cdef __u32 result = sqe.result
+        free_sqe(sqe)
         self._seek = _offset + result
+        if self._append:
+            self._size = -1  # note: appended at end of file not `_offset`
+        elif self._size > -1 and <__u64>self._size < self._seek:
+            self._size = self._seek
         return result
 
 
@@ -395,7 +603,7 @@ async def open(str path not None, __u64 flags=0, *,
     '''
     cdef:
         _path = path.encode()
-        SQE sqe = SQE()
+        SQE sqe = new_sqe()
         open_how how = open_how()
 
     if (flags & (O_CREAT | O_TMPFILE)):
@@ -405,43 +613,279 @@ async def open(str path not None, __u64 flags=0, *,
 
     io_uring_prep_openat2(sqe, _path, how, dir_fd)
     await sqe
-    return sqe.result  # fd
+    cdef __s32 result = sqe.result
+    free_sqe(sqe)
+    return result  # fd
 
 
-async def read(int fd, __s32 length, __u64 offset=0)-> bytes:
+async def open_direct(str path not None, __u64 flags=0, *,
+                      __u64 mode=0o660, __u64 resolve=0, int dir_fd=AT_FDCWD)-> int:
+    '''
+        Example
+            >>> async with FileTable():
+            ...     index = await open_direct('/path/file.ext')
+            ...     await read(index, 1024, direct=True)
+            ...     await close(index, True)
+            b'hi...bye!'
+
+        Note
+            - Same as `open()` but file is opened straight into registered `FileTable` &
+            returns direct descriptor index rather than `fd`.
+    '''
+    cdef:
+        _path = path.encode()
+        SQE sqe = new_sqe(1, False)
+        open_how how = open_how()
+
+    if (flags & (O_CREAT | O_TMPFILE)):
+        how.ptr.mode = mode
+    how.ptr.flags = flags
+    how.ptr.resolve = resolve
+
+    io_uring_prep_openat2_direct(sqe, _path, how, IORING_FILE_INDEX_ALLOC, dir_fd)
+    await sqe
+    cdef __s32 result = sqe.result
+    free_sqe(sqe)
+    if result > -1:
+        return result  # `index`
+    elif result == -ENFILE:
+        raise_error(result, 'Either file table is full or register file not enabled!')
+    else:
+        raise_error(result)
+
+
+async def read(int fd, __s32 length, __u64 offset=0, *, double timeout=0,
+               bint direct=False, BufferPool pool=None)-> bytes | BufferLease:
     '''
         Example
             >>> await read(fd, length)
             b'hi...bye!'
+
+            >>> await read(fd, length, timeout=5)  # raises `TimeoutError`
+
+            >>> await read(index, length, direct=True)  # direct descriptor
+
+            >>> with await read(fd, length, pool=pool) as lease:  # registered buffer
+            ...     bytes(lease)
+            b'hi...bye!'
+
+        Note
+            - With `pool` data is read into registered buffer using `IORING_OP_READ_FIXED`,
+            at most `pool.size` bytes are read & `BufferLease` is returned, no copy is done.
     '''
     if not length: return b''
     cdef:
-        SQE sqe = SQE()
-        bytearray buffer = bytearray(length)
-    io_uring_prep_read(sqe, fd, buffer, length, offset)
+        SQE         sqe = new_sqe(1, True, timeout)
+        bytes       buffer
+        BufferLease lease
+    if pool is None:
+        buffer = PyBytes_FromStringAndSize(NULL, length)
+        __io_uring_prep_read(sqe.ptr, fd, PyBytes_AS_STRING(buffer), length, offset)
+    else:
+        lease = prep_read_fixed(sqe, fd, pool, length, offset)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
     await sqe
-    return bytes(buffer if length == sqe.result else buffer[:sqe.result])
+    cdef __s32 result = sqe.result
+    free_sqe(sqe)
+    if pool is not None:
+        lease.length = result
+        return lease
+    return buffer if length == result else buffer[:result]
 
 
-async def write(int fd, const unsigned char[:] buffer, __u64 offset=0)-> __u32:
+async def readinto(int fd, unsigned char[::1] buffer, __u64 offset=0, *, double timeout=0,
+                   bint direct=False)-> __u32:
     '''
         Type
-            fd:     int
-            buffer: bytes | bytearray | memoryview
-            offset: int
-            return: int
+            fd:      int
+            buffer:  bytearray | memoryview | array | ...
+            offset:  int
+            timeout: float
+            direct:  bool
+            return:  int
 
         Example
-            >>> await write(fd, b'hi...bye!')
+            >>> buffer = bytearray(1024)
+            >>> await readinto(fd, buffer)
             9
+            >>> buffer[:9]
+            bytearray(b'hi...bye!')
+
+            >>> await readinto(fd, memoryview(buffer)[100:200], 9)  # fill part of buffer
+
+        Note
+            - Kernel reads straight into writable `buffer`, no new `bytes` is created.
     '''
     cdef __u32 length = len(buffer)
+    if length == 0:
+        return length
+    cdef SQE sqe = new_sqe(1, True, timeout)
+    __io_uring_prep_read(sqe.ptr, fd, &buffer[0], length, offset)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    await sqe
+    length = sqe.result
+    free_sqe(sqe)
+    return length
+
+
+async def readv(int fd, list buffers not None, __u64 offset=0, *, double timeout=0,
+                bint direct=False)-> __u32:
+    '''
+        Type
+            fd:      int
+            buffers: List[bytearray | memoryview | array | ...]
+            offset:  int
+            timeout: float
+            direct:  bool
+            return:  int
+
+        Example
+            >>> header, body = bytearray(4), bytearray(5)
+            >>> await readv(fd, [header, body])
+            9
+            >>> header, body
+            (bytearray(b'hi..'), bytearray(b'.bye!'))
+
+        Note
+            - Scatter read, `buffers` are filled in order using single entry.
+    '''
+    cdef:
+        object              buffer
+        unsigned char[::1]  view
+    for buffer in buffers:
+        view = buffer  # note: each buffer must be writable & contiguous.
+    if not buffers:
+        return 0
+    cdef:
+        SQE     sqe = new_sqe(1, True, timeout)
+        iovec   iov = iovec(buffers)
+        __u32   result
+    io_uring_prep_readv(sqe, fd, iov, offset)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    await sqe
+    result = sqe.result
+    free_sqe(sqe)
+    return result
+
+
+async def write(int fd, object buffer, __u64 offset=0, *,
+                double timeout=0, bint direct=False)-> __u32:
+    '''
+        Type
+            fd:      int
+            buffer:  bytes | bytearray | memoryview | BufferLease
+            offset:  int
+            timeout: float
+            direct:  bool
+            return:  int
+
+        Example
+            >>> await write(fd, b'hi...bye!')
+            9
+
+            >>> await write(fd, b'hi...bye!', timeout=5)  # raises `TimeoutError`
+
+            >>> await write(index, b'hi...bye!', direct=True)  # direct descriptor
+            9
+
+        Note
+            - `BufferLease` of `BufferPool` is written using `IORING_OP_WRITE_FIXED`.
+    '''
+    cdef:
+        __u32                   length = len(buffer)
+        const unsigned char[:]  view
 
     if length == 0:
         return length
 
-    cdef SQE sqe = SQE()
-    io_uring_prep_write(sqe, fd, buffer, length, offset)
+    cdef SQE sqe = new_sqe(1, True, timeout)
+    if not prep_write_fixed(sqe, fd, buffer, offset):
+        view = buffer
+        io_uring_prep_write(sqe, fd, view, length, offset)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    await sqe
+    length = sqe.result
+    free_sqe(sqe)
+    return length
+
+
+async def writev(int fd, list buffers not None, __u64 offset=0, *, double timeout=0,
+                 bint direct=False)-> __u32:
+    '''
+        Type
+            fd:      int
+            buffers: List[bytes | bytearray | memoryview | ...]
+            offset:  int
+            timeout: float
+            direct:  bool
+            return:  int
+
+        Example
+            >>> await writev(fd, [b'header', b'body'])
+            10
+
+        Note
+            - Gather write, `buffers` are written in order using single entry without having
+            to join them first.
+    '''
+    if not buffers:
+        return 0
+    cdef:
+        SQE     sqe = new_sqe(1, True, timeout)
+        iovec   iov = iovec(buffers)
+        __u32   result
+    io_uring_prep_writev(sqe, fd, iov, len(iov), offset)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
     await sqe
+    result = sqe.result
+    free_sqe(sqe)
+    return result
+
+
+cdef BufferLease prep_read_fixed(SQE sqe, int fd, BufferPool pool, __u64 length, __u64 offset):
+    cdef BufferLease lease = pool.pop(min(length, pool.size))
+    __io_uring_prep_read_fixed(sqe.ptr, fd, lease.data(), lease.length, offset, lease.bid)
+    return lease
+
+
+cdef bint prep_write_fixed(SQE sqe, int fd, object data, __u64 offset):
+    # `True` if `data` is leased from `BufferPool` & `IORING_OP_WRITE_FIXED` is prepared.
+    cdef int index
+    if type(data) is BufferLease and (index := (<BufferLease>data).index()) > -1:
+        __io_uring_prep_write_fixed(sqe.ptr, fd, <const char*>(<BufferLease>data).data(),
+                                    (<BufferLease>data).length, offset, index)
+        return True
+    return False
+
+
+cdef class FileChunk(SQE):
+
+    def __init__(self):
+        raise TypeError('`FileChunk()` is created by `File.iter_chunks()`')
+
+    cdef bytes data(self):
+        if self.filled == len(self.buffer):
+            return self.buffer
+        return self.buffer[:self.filled]
+
+    cdef void rest(self, int fd) noexcept:
+        # note: `flags` are kept, next `await` re-arms entry.
+        __io_uring_prep_read(self.ptr, fd, PyBytes_AS_STRING(self.buffer) + self.filled,
+                             len(self.buffer) - self.filled, self.offset + self.filled)
+
 
-    return (length := sqe.result)
+cdef FileChunk new_chunk(int fd, __u64 length, __u64 offset, bint direct):
+    cdef FileChunk chunk = FileChunk.__new__(FileChunk)
+    SQE.__init__(chunk, 1, True, multishot=True)
+    # note: kernel reads straight into `bytes` memory, which is not shared till its yielded.
+    chunk.buffer = PyBytes_FromStringAndSize(NULL, length)
+    chunk.offset = offset
+    __io_uring_prep_read(chunk.ptr, fd, PyBytes_AS_STRING(chunk.buffer), length, offset)
+    if direct:
+        chunk.flags |= IOSQE_FIXED_FILE
+    return chunk
@@ -0,0 +1,10 @@
+from liburing.queue cimport io_uring
+from liburing.register cimport io_uring_register_files_sparse, io_uring_unregister_files
+from ..event.entry cimport RING, SQE
+from ..core.base cimport AsyncBase
+
+
+cdef class FileTable(AsyncBase):
+    cdef:
+        io_uring                ring
+        readonly unsigned int   count
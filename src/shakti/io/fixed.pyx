@@ -0,0 +1,59 @@
+cdef class FileTable(AsyncBase):
+
+    def __init__(self, unsigned int count=1024):
+        ''' Registered (Fixed) File Table - ring owned table of direct descriptors.
+
+            Type
+                count:  int     # number of slots
+                return: None
+
+            Example
+                >>> async with FileTable(1024):
+                ...     index = await open_direct('/path/file')
+                ...     await read(index, 5, direct=True)
+                ...     await close(index, True)
+                b'hello'
+
+                # or
+                >>> table = await FileTable()
+                ...
+                >>> table.close()
+
+            Note
+                - Table is registered sparse, `open_direct`, `accept_direct`, `socket(direct=True)`,
+                `File(direct=True)` are allocated a free slot by kernel.
+                - Operation with `direct=True` sets `IOSQE_FIXED_FILE`, so kernel skips file table
+                lookup & reference counting for each operation.
+                - Only one table can be registered per ring.
+        '''
+        if not count:
+            self.msg = f'`{self.__class__.__name__}(count)` - can not be `0`'
+            raise ValueError(self.msg)
+        self.count = count
+
+    def __bool__(self):
+        return self.ring is not None
+
+    async def __ainit__(self):
+        cdef SQE sqe = SQE(0, error=False)
+        sqe.job = RING
+        cdef io_uring ring = await sqe
+        io_uring_register_files_sparse(ring, self.count)
+        self.ring = ring
+
+    async def __aexit__(self, *errors):
+        self.close()
+        if any(errors):
+            return False
+
+    def close(self):
+        ''' Unregister file table from kernel
+
+            Note
+                - Direct descriptors still in table are closed.
+        '''
+        if self.ring is not None:
+            try:
+                io_uring_unregister_files(self.ring)
+            finally:
+                self.ring = None
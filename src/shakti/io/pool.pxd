@@ -0,0 +1,44 @@
+from libc.errno cimport EAGAIN
+from liburing.lib.type cimport __s32
+from liburing.lib.socket cimport *
+from liburing.lib.uring cimport __io_uring_prep_recv
+from liburing.queue cimport io_uring
+from ..event.entry cimport RING, SQE, new_sqe, free_sqe
+from ..event.waiter cimport new_waiter, wake
+from ..lib.error cimport UnsupportedOperation
+from ..lib.time cimport clock_gettime, CLOCK_MONOTONIC
+
+
+cdef extern from '<sys/socket.h>' nogil:
+    enum:
+        MSG_PEEK
+        MSG_DONTWAIT
+
+
+cdef enum:  # waiter state, `>= 0` is `sockfd` handed over by `release()`
+    WAITING = -1
+    RESERVED = -2   # connection slot handed over, waiter connects by itself.
+    EXPIRED = -3
+    CLOSED = -4
+
+
+cdef class ConnectionPool:
+    cdef:
+        dict            idle, opened, busy, waiters
+        io_uring        ring
+        int             family
+        char            peek[1]
+        readonly bint   closed
+        readonly unsigned int maxsize
+        readonly double idle_timeout, timeout, connect_timeout
+
+    cdef void free_slot(self, tuple key)
+    cdef list expired(self, tuple key)
+
+
+cdef class Connection:
+    cdef:
+        ConnectionPool  pool
+        str             host
+        in_port_t       port
+        readonly int    fileno
@@ -0,0 +1,268 @@
+from ..event.timer import call_later as _call_later
+from .common import close as _close
+from .socket import socket as _socket, connect as _connect
+
+
+cdef class ConnectionPool:
+
+    def __init__(self, unsigned int maxsize=10, *, double idle_timeout=60, double timeout=0,
+                 double connect_timeout=0, int family=__AF_INET):
+        ''' Client Connection Pool - keeps idle keep-alive sockets per `(host, port)`
+
+            Type
+                maxsize:         int    # max open connections per `(host, port)`
+                idle_timeout:    float  # second, idle socket is closed after it
+                timeout:         float  # second, max wait for free connection, `0` waits forever
+                connect_timeout: float  # second, applies to each new connection
+                family:          int    # `AF_INET` or `AF_INET6`
+                return:          None
+
+            Example
+                >>> pool = ConnectionPool(100, idle_timeout=30, timeout=5)
+                >>> async with pool.connection('example.com', 80) as sockfd:
+                ...     await sendall(sockfd, b'GET / HTTP/1.1\r\nHost: example.com\r\n\r\n')
+                ...     await recv(sockfd, 1024)
+                ...
+                >>> await pool.close()
+
+                # or
+                >>> sockfd = await pool.acquire('example.com', 80)
+                >>> await pool.release(sockfd)          # back into pool
+                >>> await pool.release(sockfd, False)   # broken or not reusable, close it
+
+            Note
+                - Idle socket is checked by `recv(MSG_PEEK | MSG_DONTWAIT)` before its handed out,
+                socket closed by peer or with unread data is dropped & next one is tried.
+                - Last released socket is reused first, so rest stay idle long enough to expire.
+                - Once `maxsize` connections are open, `acquire()` waits for one to be released
+                & raises `TimeoutError` after `timeout`.
+                - Pool belongs to event loop of its first `acquire()`.
+        '''
+        if not maxsize:
+            raise ValueError(f'`{self.__class__.__name__}(maxsize)` - can not be `0`')
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.family = family
+        self.closed = False
+        self.idle = {}      # `{(host, port): [(sockfd, expire), ...]}`
+        self.opened = {}    # `{(host, port): count}`, idle & busy
+        self.busy = {}      # `{sockfd: (host, port)}`
+        self.waiters = {}   # `{(host, port): [[waiter, state], ...]}`
+
+    def __len__(self):
+        return sum(len(i) for i in self.idle.values())  # idle sockets
+
+    def connection(self, str host not None, in_port_t port)-> Connection:
+        ''' Acquire & release connection with `async with`
+
+            Example
+                >>> async with pool.connection('example.com', 80) as sockfd:
+                ...     ...
+
+            Note
+                - Connection is returned into pool, or closed if block raised error.
+        '''
+        return Connection(self, host, port)
+
+    async def acquire(self, str host not None, in_port_t port)-> int:
+        ''' Checkout Connection
+
+            Example
+                >>> sockfd = await pool.acquire('example.com', 80)
+                >>> ...
+                >>> await pool.release(sockfd)
+        '''
+        cdef:
+            SQE     sqe, waiter
+            int     sockfd
+            list    idle, entry
+            tuple   key = (host, port)
+            object  timer = None
+
+        if self.closed:
+            raise UnsupportedOperation(f'`{self.__class__.__name__}` is closed')
+        if self.ring is None:
+            sqe = SQE(0, error=False)
+            sqe.job = RING
+            self.ring = await sqe
+
+        for sockfd in self.expired(key):
+            await _close(sockfd)
+        idle = self.idle.setdefault(key, [])
+        while idle:
+            sockfd = idle.pop()[0]
+            if await self.check(sockfd):
+                self.busy[sockfd] = key
+                return sockfd
+            await _close(sockfd)
+            self.free_slot(key)
+
+        if self.opened.get(key, 0) < self.maxsize:
+            self.opened[key] = self.opened.get(key, 0) + 1
+        else:
+            entry = [waiter := new_waiter(), WAITING]
+            self.waiters.setdefault(key, []).append(entry)
+            if self.timeout:
+                timer = _call_later(self.timeout, self._expire, key, entry)
+            await waiter
+            if timer is not None:
+                timer.stop()
+            if (sockfd := entry[1]) > -1:  # released socket handed over
+                self.busy[sockfd] = key
+                return sockfd
+            elif sockfd == EXPIRED:
+                raise TimeoutError(f'`{self.__class__.__name__}.acquire()` - no free connection '
+                                   f'for {host!r}:{port} within {self.timeout} second')
+            elif sockfd == CLOSED:
+                raise UnsupportedOperation(f'`{self.__class__.__name__}` is closed')
+            # `RESERVED` - slot of closed connection is handed over.
+
+        try:
+            sockfd = await _socket(self.family)
+        except BaseException:
+            self.free_slot(key)
+            raise
+        try:
+            await _connect(sockfd, host, port, timeout=self.connect_timeout)
+        except BaseException:
+            await _close(sockfd)
+            self.free_slot(key)
+            raise
+        self.busy[sockfd] = key
+        return sockfd
+
+    async def release(self, int sockfd, bint reuse=True):
+        ''' Return Connection into Pool
+
+            Example
+                >>> await pool.release(sockfd)
+                >>> await pool.release(sockfd, False)  # close it
+
+            Note
+                - Waiting `acquire()` gets released socket directly.
+                - Set `reuse=False` if socket is broken or peer does not keep connection alive.
+        '''
+        cdef:
+            int     fd
+            list    waiters, entry
+            tuple   key
+
+        if (key := self.busy.pop(sockfd, None)) is None:
+            raise ValueError(f'`{self.__class__.__name__}.release()` - {sockfd} was not acquired '
+                             'from this pool')
+        if reuse and not self.closed:
+            if waiters := self.waiters.get(key):
+                entry = waiters.pop(0)
+                entry[1] = sockfd
+                wake(self.ring, <SQE>entry[0])
+            else:
+                self.idle.setdefault(key, []).append(
+                    (sockfd, clock_gettime(CLOCK_MONOTONIC) + self.idle_timeout)
+                )
+                for fd in self.expired(key):
+                    await _close(fd)
+        else:
+            await _close(sockfd)
+            self.free_slot(key)
+
+    async def check(self, int sockfd)-> bool:
+        ''' Idle Socket is Still Usable
+
+            Example
+                >>> await pool.check(sockfd)
+                True
+
+            Note
+                - Connected socket with nothing to read returns `EAGAIN`, `0` means peer has
+                closed it & any data is late or unexpected answer, both are not reusable.
+        '''
+        cdef:
+            SQE     sqe = new_sqe(1, False)
+            __s32   result
+        __io_uring_prep_recv(sqe.ptr, sockfd, self.peek, 1, MSG_PEEK | MSG_DONTWAIT)
+        await sqe
+        result = sqe.result
+        free_sqe(sqe)
+        return result == -EAGAIN
+
+    async def prune(self):
+        ''' Close idle sockets that have passed `idle_timeout` '''
+        cdef int sockfd
+        for key in list(self.idle):
+            for sockfd in self.expired(key):
+                await _close(sockfd)
+
+    async def close(self):
+        ''' Close idle sockets & wake waiting `acquire()`
+
+            Note
+                - Busy sockets are closed by their `release()`.
+        '''
+        cdef:
+            list    idle, waiters, entry
+            tuple   key
+            int     sockfd
+        self.closed = True
+        for waiters in self.waiters.values():
+            for entry in waiters:
+                entry[1] = CLOSED
+                wake(self.ring, <SQE>entry[0])
+        self.waiters.clear()
+        for key, idle in list(self.idle.items()):
+            del self.idle[key]
+            for sockfd, _ in idle:
+                await _close(sockfd)
+                self.free_slot(key)
+
+    def _expire(self, tuple key, list entry):
+        # note: called by timer, waiter that is still parked gives up its place.
+        if entry[1] == WAITING:
+            self.waiters[key].remove(entry)
+            entry[1] = EXPIRED
+            wake(self.ring, <SQE>entry[0])
+
+    cdef void free_slot(self, tuple key):
+        ''' Connection is closed, hand its slot to first waiter or lower open count. '''
+        cdef:
+            list            waiters, entry
+            unsigned int    count
+        if waiters := self.waiters.get(key):
+            entry = waiters.pop(0)
+            entry[1] = RESERVED
+            wake(self.ring, <SQE>entry[0])
+        elif count := self.opened[key] - 1:
+            self.opened[key] = count
+        else:
+            del self.opened[key]
+
+    cdef list expired(self, tuple key):
+        ''' Remove expired idle sockets of `key` & return them to be closed. '''
+        cdef:
+            list    idle, r = []
+            double  current = clock_gettime(CLOCK_MONOTONIC)
+        if idle := self.idle.get(key):
+            while idle and idle[0][1] < current:  # note: oldest is first
+                r.append(idle.pop(0)[0])
+                self.free_slot(key)
+        return r
+
+
+cdef class Connection:
+
+    def __init__(self, ConnectionPool pool not None, str host not None, in_port_t port):
+        ''' Pooled Connection, created by `ConnectionPool.connection()` '''
+        self.pool = pool
+        self.host = host
+        self.port = port
+        self.fileno = -1
+
+    async def __aenter__(self):
+        self.fileno = await self.pool.acquire(self.host, self.port)
+        return self.fileno
+
+    async def __aexit__(self, *errors):
+        cdef int sockfd = self.fileno
+        self.fileno = -1
+        await self.pool.release(sockfd, not any(errors))
@@ -0,0 +1,43 @@
+from libc.errno cimport ETIMEDOUT
+from liburing.lib.type cimport __s32, __u16, __u32
+from liburing.lib.socket cimport *
+from liburing.socket cimport sockaddr, io_uring_prep_socket, io_uring_prep_connect, \
+                             io_uring_prep_send
+from liburing.socket_extra cimport isIP
+from liburing.common cimport io_uring_prep_close
+from liburing.lib.uring cimport __io_uring_prep_recv
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from liburing.queue cimport io_uring
+from liburing.error cimport trap_error
+from ..event.entry cimport RING, SQE, new_sqe, free_sqe
+from ..event.waiter cimport new_waiter, wake
+from ..lib.time cimport clock_gettime, CLOCK_MONOTONIC
+from .file cimport File
+
+
+cdef extern from '<arpa/inet.h>' nogil:
+    const char* inet_ntop(int af, const void* src, char* dst, socklen_t size)
+
+
+cdef enum:
+    DNS_A = 1
+    DNS_SOA = 6
+    DNS_AAAA = 28
+    DNS_NXDOMAIN = 3
+    DNS_PACKET = 4096
+
+
+cdef class Resolver:
+    cdef:
+        dict            hosts, inflight
+        list            _nameservers
+        bint            loaded, _configured
+        str             _hosts_path, _resolv_path
+        readonly dict   cache
+        readonly double timeout, negative_ttl
+        readonly unsigned int attempts
+
+    cdef list cached(self, tuple key)
+
+
+cdef Resolver default_resolver()
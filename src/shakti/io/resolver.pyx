@@ -0,0 +1,339 @@
+from random import getrandbits as _getrandbits
+from socket import gaierror as _gaierror, EAI_NONAME as _EAI_NONAME
+
+
+cdef class Resolver:
+
+    def __init__(self, list nameservers=None, *, str hosts='/etc/hosts',
+                 str resolv_conf='/etc/resolv.conf', double timeout=2, unsigned int attempts=2,
+                 double negative_ttl=30):
+        ''' Asynchronous DNS Resolver
+
+            Type
+                nameservers:  list[str | tuple[str, int]] | None  # `None` reads `resolv_conf`
+                hosts:        str    # hosts file, checked before any query
+                resolv_conf:  str
+                timeout:      float  # second, per query
+                attempts:     int    # rounds over all nameservers
+                negative_ttl: float  # second, used if server does not send `SOA`
+                return:       None
+
+            Example
+                >>> resolver = Resolver()
+                >>> await resolver.resolve('localhost')
+                [(2, '127.0.0.1')]
+
+                >>> resolver = Resolver([('127.0.0.1', 5353)])
+                >>> await resolver.resolve('example.com', AF_INET)
+                [(2, '93.184.216.34')]
+
+            Note
+                - Queries are sent over UDP socket created in ring, event loop is never blocked.
+                - Answer is cached for its lowest TTL, name that does not exist or has no record
+                is cached for `SOA` minimum TTL.
+                - Concurrent lookups of same name in same event loop wait for single query.
+                - `search` domains & TCP retry of truncated answer are not supported.
+        '''
+        cdef object server
+        self._nameservers = []
+        self._configured = nameservers is not None
+        if self._configured:
+            for server in nameservers:
+                self._nameservers.append((server, 53) if type(server) is str else tuple(server))
+        self._hosts_path = hosts
+        self._resolv_path = resolv_conf
+        self.timeout = timeout
+        self.attempts = attempts or 1
+        self.negative_ttl = negative_ttl
+        self.hosts = {}
+        self.cache = {}
+        self.inflight = {}
+
+    @property
+    def nameservers(self)-> list[tuple[str, int]]:
+        return list(self._nameservers)
+
+    def clear(self):
+        ''' Clear cache, hosts & `resolv_conf` are loaded again on next lookup. '''
+        self.cache.clear()
+        self.loaded = False
+
+    async def load(self):
+        ''' Load hosts file & nameservers from `resolv_conf` '''
+        cdef:
+            str     line
+            list    fields, nameservers = []
+            dict    hosts = {}
+        for line in (await _read_text(self._hosts_path)).splitlines():
+            if len(fields := line.split('#', 1)[0].split()) > 1:
+                for name in fields[1:]:
+                    hosts.setdefault(name.lower(), []).append(
+                        (__AF_INET6 if ':' in fields[0] else __AF_INET, fields[0])
+                    )
+        self.hosts = hosts
+        if not self._configured:
+            for line in (await _read_text(self._resolv_path)).splitlines():
+                fields = line.split('#', 1)[0].split(';', 1)[0].split()
+                if len(fields) > 1 and fields[0] == 'nameserver':
+                    nameservers.append((fields[1], 53))
+            self._nameservers = nameservers or [('127.0.0.1', 53)]  # note: same as libc default
+        self.loaded = True
+
+    async def resolve(self, str host not None, int family=0)-> list[tuple[int, str]]:
+        ''' Resolve Host Name
+
+            Type
+                host:   str
+                family: int     # `AF_INET`, `AF_INET6` or `0` for both
+                return: list[tuple[int, str]]   # `(family, ip)`
+
+            Example
+                >>> await resolver.resolve('localhost')
+                [(2, '127.0.0.1')]
+
+            Note
+                - Raises `socket.gaierror` if name does not exist or has no address.
+                - With `family=0` IPv6 addresses are listed before IPv4.
+        '''
+        cdef:
+            SQE         sqe, waiter
+            list        result, record
+            tuple       key
+            double      ttl
+            io_uring    ring
+
+        host = host.lower().rstrip('.')
+        key = (host, family)
+        if (result := self.cached(key)) is not None:
+            return result
+        if not self.loaded:
+            await self.load()
+        if result := [i for i in self.hosts.get(host, ()) if not family or i[0] == family]:
+            return result
+
+        sqe = SQE(0, error=False)
+        sqe.job = RING
+        ring = await sqe
+        if (record := self.inflight.get(key)) is not None and record[0] is ring:
+            record.append(waiter := new_waiter())
+            await waiter
+            if type(record[1]) is list:
+                return list(record[1])
+            raise record[1]
+        # note: `record` is `[ring, result | error, *waiters]`
+        self.inflight[key] = record = [ring, None]
+        try:
+            result, ttl = await self.query(host, family)
+            if len(self.cache) > 4096:
+                self.prune()
+            self.cache[key] = (clock_gettime(CLOCK_MONOTONIC) + ttl, result or None)
+            if not result:
+                record[1] = not_found(host)
+                raise record[1]
+            record[1] = result
+            return list(result)
+        except BaseException as e:
+            if record[1] is None:
+                record[1] = e
+            raise
+        finally:
+            if self.inflight.get(key) is record:
+                del self.inflight[key]
+            for waiter in record[2:]:
+                wake(ring, waiter)
+
+    async def query(self, str host not None, int family=0)-> tuple[list, double]:
+        ''' Query Nameservers without Cache
+
+            Example
+                >>> await resolver.query('example.com')
+                ([(10, '2606:2800:220:1::'), (2, '93.184.216.34')], 300.0)
+
+            Note
+                - Returns `([], ttl)` if name does not exist or has no record.
+                - Each nameserver is tried in order, for `attempts` rounds.
+                - Raises `socket.gaierror` if there is no nameserver to ask.
+        '''
+        cdef:
+            list    qtypes
+            bytes   name = encode_name(host)
+            object  error = None
+        if not self.loaded:
+            await self.load()
+        if family == __AF_INET:
+            qtypes = [DNS_A]
+        elif family == __AF_INET6:
+            qtypes = [DNS_AAAA]
+        else:
+            qtypes = [DNS_AAAA, DNS_A]
+        for _ in range(self.attempts):
+            for server, port in self._nameservers:
+                try:
+                    return await self.ask(server, port, name, qtypes)
+                except OSError as e:  # timeout, refused, server failure, ...
+                    error = e
+        raise not_found(host) if error is None else error  # note: no nameserver to ask.
+
+    async def ask(self, str server, in_port_t port, bytes name, list qtypes):
+        cdef:
+            SQE         sqe = new_sqe(), io = new_sqe(1, True, self.timeout)
+            int         fd, family, rcode
+            bytes       packet, _server = server.encode()
+            dict        pending = {}, found = {}
+            list        addresses = []
+            double      ttl = -1, negative = -1, record_ttl
+            sockaddr    addr
+            __u16       qid, qtype
+
+        family = __AF_INET6 if isIP(__AF_INET6, _server) else __AF_INET
+        io_uring_prep_socket(sqe, family, __SOCK_DGRAM, 0, 0)
+        await sqe
+        fd = sqe.result
+        try:
+            addr = sockaddr(family, _server, port)
+            io_uring_prep_connect(sqe, fd, addr)
+            await sqe
+            for qtype in qtypes:
+                while (qid := _getrandbits(16)) in pending:
+                    pass
+                pending[qid] = qtype
+                # header: `id`, recursion desired, 1 question & `name`, `qtype`, class `IN`
+                packet = bytes((qid >> 8, qid & 0xFF, 1, 0, 0, 1, 0, 0, 0, 0, 0, 0))
+                packet += name + bytes((qtype >> 8, qtype & 0xFF, 0, 1))
+                io_uring_prep_send(io, fd, packet, len(packet), 0)
+                await io
+            while pending:
+                packet = PyBytes_FromStringAndSize(NULL, DNS_PACKET)
+                __io_uring_prep_recv(io.ptr, fd, PyBytes_AS_STRING(packet), DNS_PACKET, 0)
+                await io
+                packet = packet[:io.result]
+                if len(packet) < 12 or not (qtype := pending.pop(packet[0] << 8 | packet[1], 0)):
+                    continue  # note: stray or late answer of previous query.
+                rcode, found[qtype], record_ttl = parse_answer(packet, qtype)
+                if rcode and rcode != DNS_NXDOMAIN:
+                    raise OSError(f'`{self.__class__.__name__}` - {server!r} failed with '
+                                  f'rcode {rcode}')
+                if found[qtype]:
+                    ttl = record_ttl if ttl < 0 else min(ttl, record_ttl)
+                elif record_ttl > -1:
+                    negative = record_ttl if negative < 0 else min(negative, record_ttl)
+        finally:
+            io_uring_prep_close(sqe, fd)
+            await sqe
+        free_sqe(sqe)
+        free_sqe(io)
+        for qtype in qtypes:
+            addresses.extend(found.get(qtype, ()))
+        if addresses:
+            return addresses, ttl
+        return addresses, self.negative_ttl if negative < 0 else negative
+
+    cdef list cached(self, tuple key):
+        cdef tuple entry
+        if (entry := self.cache.get(key)) is None:
+            return None
+        elif entry[0] < clock_gettime(CLOCK_MONOTONIC):
+            del self.cache[key]
+            return None
+        elif entry[1] is None:
+            raise not_found(key[0])
+        return list(entry[1])
+
+    def prune(self):
+        ''' Remove expired entries from cache '''
+        cdef double current = clock_gettime(CLOCK_MONOTONIC)
+        for key in [k for k, v in self.cache.items() if v[0] < current]:
+            del self.cache[key]
+
+
+cdef Resolver _resolver = None
+
+
+cdef Resolver default_resolver():
+    global _resolver
+    if _resolver is None:
+        _resolver = Resolver()
+    return _resolver
+
+
+async def resolve(str host not None, int family=0)-> list[tuple[int, str]]:
+    ''' Resolve Host Name using Default `Resolver`
+
+        Example
+            >>> await resolve('localhost')
+            [(2, '127.0.0.1')]
+
+        Note
+            - Used by `connect()` for host names, so its cache is shared.
+    '''
+    return await default_resolver().resolve(host, family)
+
+
+async def _read_text(str path):
+    try:
+        async with File(path) as file:
+            return await file.read()
+    except FileNotFoundError:
+        return ''
+
+
+cdef object not_found(str host):
+    return _gaierror(_EAI_NONAME, f'Name or service not known: {host!r}')
+
+
+cdef bytes encode_name(str host):
+    cdef bytes label, name = b''
+    for label in host.rstrip('.').encode('idna').split(b'.'):
+        if not 0 < len(label) < 64:
+            raise ValueError(f'`Resolver` - invalid host name {host!r}')
+        name += bytes((len(label),)) + label
+    return name + b'\x00'
+
+
+cdef Py_ssize_t skip_name(const unsigned char[:] data, Py_ssize_t i, Py_ssize_t size) except -1:
+    while i < size:
+        if not data[i]:
+            return i + 1
+        elif data[i] & 0xC0 == 0xC0:  # compression pointer
+            return i + 2
+        i += data[i] + 1
+    raise OSError('`Resolver` - malformed answer')
+
+
+cdef tuple parse_answer(bytes packet, __u16 qtype):
+    ''' Returns `(rcode, [(family, ip), ...], ttl)`, for negative answer `ttl` is from `SOA`. '''
+    cdef:
+        const unsigned char[:]  data = packet
+        Py_ssize_t              i = 12, end, size = len(packet)
+        unsigned int            n, count, rtype, length
+        int                     family = __AF_INET if qtype == DNS_A else __AF_INET6
+        __u32                   rttl
+        double                  ttl = -1
+        list                    found = []
+        char                    text[46]  # note: `INET6_ADDRSTRLEN`
+
+    for n in range(data[4] << 8 | data[5]):  # question
+        i = skip_name(data, i, size) + 4
+    count = data[6] << 8 | data[7]
+    for n in range(count + (data[8] << 8 | data[9])):  # answer + authority
+        i = skip_name(data, i, size)
+        if i + 10 > size:
+            raise OSError('`Resolver` - malformed answer')
+        rtype = data[i] << 8 | data[i+1]
+        rttl = <__u32>data[i+4] << 24 | <__u32>data[i+5] << 16 | data[i+6] << 8 | data[i+7]
+        length = data[i+8] << 8 | data[i+9]
+        if (end := i + 10 + length) > size:
+            raise OSError('`Resolver` - malformed answer')
+        i += 10
+        if n < count:
+            if rtype == qtype and length == (4 if qtype == DNS_A else 16):
+                inet_ntop(family, &data[i], text, sizeof(text))
+                found.append((family, text.decode()))
+                ttl = rttl if ttl < 0 else min(ttl, rttl)
+        elif rtype == DNS_SOA and not found and length >= 20:
+            # note: negative answer is cached for lower of `SOA` TTL & its `minimum` field.
+            i = end - 4
+            ttl = min(rttl,
+                      <__u32>data[i] << 24 | <__u32>data[i+1] << 16 | data[i+2] << 8 | data[i+3])
+        i = end
+    return data[3] & 0x0F, found, ttl
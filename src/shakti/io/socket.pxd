@@ -1,16 +1,57 @@
-from libc.errno cimport ENFILE
+from libc.errno cimport ENFILE, ENOBUFS
+from libc.string cimport strerror
+from posix.fcntl cimport O_CLOEXEC
+from posix.unistd cimport close as _close
 from cpython.array cimport array
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
 from liburing.lib.socket cimport *
-from liburing.lib.type cimport bool as bool_t
+from liburing.lib.type cimport __s32, __u16, __u32, __u64, __iovec, bool as bool_t
 from liburing.socket cimport sockaddr, io_uring_prep_socket, io_uring_prep_socket_direct_alloc, \
                              io_uring_prep_shutdown, io_uring_prep_send, io_uring_prep_recv, \
-                             io_uring_prep_accept, io_uring_prep_connect, \
-                             io_uring_prep_setsockopt, io_uring_prep_getsockopt
+                             io_uring_prep_accept, io_uring_prep_multishot_accept, io_uring_prep_connect, \
+                             io_uring_prep_setsockopt, io_uring_prep_getsockopt, msghdr, \
+                             io_uring_prep_sendmsg, io_uring_prep_send_zc
 from liburing.socket_extra cimport io_uring_prep_bind, io_uring_prep_listen, getsockname as _getsockname, \
-                                   getpeername as _getpeername, getaddrinfo as _getaddrinfo, isIP
+                                   getpeername as _getpeername, isIP
 from liburing.time cimport timespec, io_uring_prep_link_timeout
-from liburing.error cimport raise_error
-from ..event.entry cimport SQE
+from liburing.lib.io_uring cimport __SPLICE_F_FD_IN_FIXED
+from liburing.os cimport io_uring_prep_splice
+from liburing.lib.uring cimport __io_uring_prep_recv, __io_uring_prep_recv_multishot, \
+                                __io_uring_prep_accept_direct, __io_uring_prep_sendto, \
+                                __io_uring_prep_recvmsg, __io_uring_prep_recvmsg_multishot, \
+                                __io_uring_recvmsg_out, __io_uring_recvmsg_validate, \
+                                __io_uring_recvmsg_name, __io_uring_recvmsg_payload, \
+                                __io_uring_recvmsg_payload_length
+from liburing.common cimport IORING_CQE_F_MORE, IORING_CQE_BUFFER_SHIFT, IORING_FILE_INDEX_ALLOC, \
+                             iovec, io_uring_prep_close, io_uring_prep_close_direct
+from liburing.error cimport raise_error, trap_error
+from liburing.queue cimport IOSQE_BUFFER_SELECT, IOSQE_FIXED_FILE, IOSQE_IO_LINK, io_uring, \
+                            io_uring_prep_nop
+from ..event.entry cimport ECANCELED, RING, SQE, new_sqe, free_sqe
+from ..event.run cimport __prep_coroutine
+from ..event.waiter cimport new_waiter, wake
+from .buffer cimport BufferRing, sqe_set_buf_group
+from .file cimport File
+from .resolver cimport Resolver, default_resolver
+
+
+cdef extern from '<unistd.h>' nogil:
+    int pipe2(int pipefd[2], int flags)
+
+
+cdef class SendZC(SQE):
+    cdef object buffer
+
+
+cdef class HappyEyeballs:
+    cdef:
+        io_uring        ring
+        SQE             waiter
+        list            entries
+        int             sockfd
+        unsigned int    running
+        double          timeout
+        object          error
 
 
 # defines
@@ -1,3 +1,6 @@
+from ..event.timer import call_later as _call_later
+
+
 async def socket(int family=__AF_INET, int type=__SOCK_STREAM, int protocol=0, unsigned int flags=0,
                  *, bint direct=False)-> int:
     ''' Create Socket
@@ -9,21 +12,26 @@ async def socket(int family=__AF_INET, int type=__SOCK_STREAM, int protocol=0, u
         Note
             - Setting `direct=True` will return direct descriptor index.
     '''
-    cdef SQE sqe = SQE(error=False)
+    cdef:
+        SQE     sqe = new_sqe(1, False)
+        __s32   result
     if direct:
         io_uring_prep_socket_direct_alloc(sqe, family, type, protocol, flags)
     else:
         io_uring_prep_socket(sqe, family, type, protocol, flags)
     await sqe
-    if sqe.result > -1:
-        return sqe.result  # `fd` or `index`
+    result = sqe.result
+    free_sqe(sqe)
+    if result > -1:
+        return result  # `fd` or `index`
     else:
-        if direct and sqe.result == -ENFILE:
-            raise_error(sqe.result, 'Either file table is full or register file not enabled!')
-        raise_error(sqe.result)
+        if direct and result == -ENFILE:
+            raise_error(result, 'Either file table is full or register file not enabled!')
+        raise_error(result)
 
 
-async def connect(int sockfd, str host, in_port_t port=80):
+async def connect(int sockfd, str host, in_port_t port=80, *, double timeout=0,
+                  bint direct=False):
     '''
         Example
             >>> sockfd = await socket()
@@ -32,17 +40,30 @@ async def connect(int sockfd, str host, in_port_t port=80):
             >>> await connect(sockfd, '0.0.0.0', 12345)
             # or
             >>> await connect(sockfd, '/path')
+            # or
+            >>> await connect(sockfd, '0.0.0.0', 12345, timeout=5)  # raises `TimeoutError`
             ...
             >>> await close(sockfd)
+
+        Note
+            - Set `direct=True` if `sockfd` is direct descriptor index, family is then picked
+            from `host` since direct descriptor has no `fd` to look it up from.
+            - Host name is resolved using `resolve()`, each address is tried in order, use
+            `create_connection()` to try them concurrently.
     '''
     cdef:  # get family
-        SQE         sqe = SQE()
+        SQE         sqe = new_sqe(1, True, timeout)
         bytes       _host = host.encode()
         sockaddr    addr
         socklen_t   size = sizeof(__sockaddr_storage)
         __sockaddr  sa
+        object      error
 
-    __getsockname(sockfd, &sa, &size)
+    if direct:
+        sa.sa_family = socket_family(_host)
+        sqe.flags |= IOSQE_FIXED_FILE
+    else:
+        __getsockname(sockfd, &sa, &size)
 
     if sa.sa_family == __AF_UNIX:
         addr = sockaddr(sa.sa_family, _host, port)
@@ -54,89 +75,713 @@ async def connect(int sockfd, str host, in_port_t port=80):
             io_uring_prep_connect(sqe, sockfd, addr)
             await sqe
         else:
-            for af_, sock_, proto, canon, addr in _getaddrinfo(_host, str(port).encode()):
+            # note: resolved by ring's own UDP queries & cached, so event loop is not blocked.
+            for family, ip in await default_resolver().resolve(host, sa.sa_family):
+                addr = sockaddr(family, ip.encode(), port)
                 try:
                     io_uring_prep_connect(sqe, sockfd, addr)
                     await sqe
-                except OSError:
-                    continue
+                except OSError as e:
+                    error = e
                 else:
                     break
+            else:
+                raise error
     else:
         raise NotImplementedError
+    free_sqe(sqe)
+
 
+async def create_connection(str host not None, in_port_t port, *, double delay=0.25,
+                            double timeout=0, int family=0, Resolver resolver=None)-> int:
+    ''' Connect to First Reachable Address - "Happy Eyeballs" (RFC 8305)
+
+        Type
+            host:     str
+            port:     int
+            delay:    float     # second, before next address is tried while others are pending
+            timeout:  float     # second, applies to each attempt
+            family:   int       # `AF_INET`, `AF_INET6` or `0` for both
+            resolver: Resolver  # `None` uses default resolver
+            return:   int       # connected `sockfd`
+
+        Example
+            >>> sockfd = await create_connection('example.com', 80)
+            ...
+            >>> await close(sockfd)
 
-async def accept(int sockfd, int flags=0)-> int:
+        Note
+            - Resolved addresses are tried in order with IPv6 & IPv4 alternating, each attempt
+            opens its own socket & runs as task.
+            - Next attempt starts after `delay`, or as soon as an attempt fails, so blackholed
+            address does not stall the rest.
+            - First connected socket is returned, pending attempts are cancelled & closed.
+            - Error of last failed attempt is raised if none connects.
+    '''
+    cdef:
+        SQE             sqe
+        str             ip
+        bytes           _host = host.encode()
+        list            addresses
+        unsigned int    i
+        HappyEyeballs   attempts = HappyEyeballs.__new__(HappyEyeballs)
+
+    if isIP(__AF_INET6, _host):
+        addresses = [(__AF_INET6, host)]
+    elif isIP(__AF_INET, _host):
+        addresses = [(__AF_INET, host)]
+    else:
+        addresses = interleave(await (resolver or default_resolver()).resolve(host, family))
+    sqe = SQE(0, error=False)
+    sqe.job = RING
+    attempts.ring = await sqe
+    attempts.entries = [None] * len(addresses)
+    attempts.sockfd = -1
+    attempts.timeout = timeout
+    for i, (family, ip) in enumerate(addresses):
+        attempts.running += 1
+        __prep_coroutine(attempts.ring, (attempts.connect(i, family, ip.encode(), port),), 1, True)
+        if i + 1 < len(addresses):
+            await attempts.wait(delay)
+        if attempts.sockfd > -1:
+            break
+    while attempts.sockfd < 0 and attempts.running:
+        await attempts.wait(0)
+    if attempts.sockfd < 0:
+        raise attempts.error
+    return attempts.sockfd
+
+
+cdef class HappyEyeballs:
+
+    def __init__(self):
+        raise TypeError('`HappyEyeballs()` is created by `create_connection()`')
+
+    async def connect(self, unsigned int index, int family, bytes ip, in_port_t port):
+        # note: single attempt, ran as task & never raises, result is kept in `self`.
+        cdef:
+            SQE         sqe = new_sqe(1, False), io = new_sqe(1, False, self.timeout)
+            SQE         other
+            int         fd
+            __s32       result
+            sockaddr    addr = sockaddr(family, ip, port)
+
+        io_uring_prep_socket(sqe, family, __SOCK_STREAM, 0, 0)
+        await sqe
+        if (result := sqe.result) > -1:
+            fd = result
+            if self.sockfd < 0:  # note: other attempt could have won while socket was created.
+                io_uring_prep_connect(io, fd, addr)
+                self.entries[index] = io
+                await io
+                self.entries[index] = None
+                result = io.result
+            if result or self.sockfd > -1:  # failed or lost
+                io_uring_prep_close(sqe, fd)
+                await sqe
+            else:
+                self.sockfd = fd
+                for other in self.entries:
+                    if other is not None:
+                        other.cancel(self.ring)  # note: its own attempt frees it once cancelled.
+        free_sqe(sqe)
+        free_sqe(io)  # note: never submitted or its `await` is done.
+        if result < 0 and self.sockfd < 0:
+            self.error = OSError(-result, strerror(-result).decode())
+        self.running -= 1
+        self.notify()
+
+    async def wait(self, double second):
+        # note: parks `create_connection()` till an attempt is done or `second` passes.
+        cdef:
+            SQE     waiter = new_waiter()
+            object  timer = None
+        self.waiter = waiter
+        if second:
+            timer = _call_later(second, self.notify)
+        await waiter
+        if timer is not None:
+            timer.stop()
+
+    def notify(self):
+        cdef SQE waiter = self.waiter
+        if waiter is not None:
+            self.waiter = None
+            wake(self.ring, waiter)
+
+
+cdef list interleave(list addresses):
+    # note: alternate families, `resolve()` lists IPv6 before IPv4.
+    cdef:
+        list            r = []
+        list            ipv6 = [a for a in addresses if a[0] == __AF_INET6]
+        list            ipv4 = [a for a in addresses if a[0] != __AF_INET6]
+        unsigned int    i
+    for i in range(max(len(ipv6), len(ipv4))):
+        r.extend(ipv6[i:i+1])
+        r.extend(ipv4[i:i+1])
+    return r
+
+
+async def accept(int sockfd, int flags=0, *, double timeout=0, bint direct=False)-> int:
     '''
         Example
             >>> client_fd = await accept(socket_fd)
+            >>> client_fd = await accept(socket_fd, timeout=5)  # raises `TimeoutError`
     '''
-    cdef SQE sqe = SQE()
+    cdef SQE sqe = new_sqe(1, True, timeout)
     io_uring_prep_accept(sqe, sockfd, None, flags)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
     await sqe
-    return sqe.result
+    cdef __s32 result = sqe.result
+    free_sqe(sqe)
+    return result
 
 
-async def recv(int sockfd, unsigned int bufsize, int flags=0):
+async def accept_direct(int sockfd, int flags=0, *, double timeout=0, bint direct=False)-> int:
+    '''
+        Example
+            >>> async with FileTable():
+            ...     index = await accept_direct(socket_fd)
+            ...     await recv(index, 1024, direct=True)
+            ...     await close(index, True)
+            b'received data'
+
+        Note
+            - Client is accepted straight into registered file table, returns direct descriptor
+            index rather than `fd`.
+            - Set `direct=True` if `sockfd` is also direct descriptor index.
+    '''
+    cdef SQE sqe = new_sqe(1, False, timeout)
+    __io_uring_prep_accept_direct(sqe.ptr, sockfd, NULL, NULL, flags, IORING_FILE_INDEX_ALLOC)
+    # note: `liburing.io_uring_prep_accept_direct` does not accept `addr=None`
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    await sqe
+    cdef __s32 result = sqe.result
+    free_sqe(sqe)
+    if result > -1:
+        return result  # `index`
+    elif result == -ENFILE:
+        raise_error(result, 'Either file table is full or register file not enabled!')
+    else:
+        raise_error(result)
+
+
+async def accept_many(int sockfd, int flags=0, *, bint direct=False):
+    ''' Multishot Accept
+
+        Example
+            >>> async for client_fd in accept_many(server_fd):
+            ...     await task(client_handler(client_fd))
+
+        Note
+            - Single multishot `accept` entry stays armed in the ring and keeps on producing
+            client `fd`s, rather than submitting one entry per connection.
+            - Clients accepted while loop body is busy are queued, so none are lost.
+            - Leaving the loop cancels the armed entry & closes any queued client `fd`, including
+            those accepted before kernel has processed the cancel.
+    '''
+    cdef:
+        SQE         sqe = SQE(multishot=True), _sqe = SQE(0, error=False)
+        io_uring    ring
+
+    _sqe.job = RING
+    ring = await _sqe
+    io_uring_prep_multishot_accept(sqe, sockfd, None, flags)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    try:
+        while True:
+            await sqe
+            yield sqe.result
+    finally:
+        # note: client accepted after cancel is closed by event loop, nobody awaits `sqe`.
+        sqe.drop(ring, _close_accepted)
+
+
+def _close_accepted(int result, unsigned int cqe_flags):
+    if result > -1:
+        _close(result)
+
+
+async def recv(int sockfd, unsigned int bufsize, int flags=0, *, double timeout=0,
+               bint direct=False):
     '''
         Example
             >>> await recv(client_fd, 13)
             b'received data'
+
+            >>> await recv(client_fd, 13, timeout=5)  # raises `TimeoutError`
+
+        Note
+            - `timeout` (second) links timeout entry, both are submitted in same syscall.
+            - Set `direct=True` if `sockfd` is direct descriptor index.
     '''
+    if not bufsize: return b''
     cdef:
-        SQE         sqe = SQE()
-        memoryview  buf = memoryview(bytearray(bufsize))
-    io_uring_prep_recv(sqe, sockfd, buf, bufsize, flags)
+        SQE     sqe = new_sqe(1, True, timeout)
+        bytes   buf = PyBytes_FromStringAndSize(NULL, bufsize)
+    # note: kernel receives straight into `bytes` memory, so no extra copy is made.
+    __io_uring_prep_recv(sqe.ptr, sockfd, PyBytes_AS_STRING(buf), bufsize, flags)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
     await sqe
     cdef unsigned int result = sqe.result
-    return bytes(buf[:result] if result != bufsize else buf)
+    free_sqe(sqe)
+    return buf[:result] if result != bufsize else buf
+
+
+async def recv_into(int sockfd, unsigned char[::1] buffer, unsigned int nbytes=0, int flags=0,
+                    *, double timeout=0, bint direct=False)-> int:
+    '''
+        Example
+            >>> buffer = bytearray(1024)
+            >>> await recv_into(client_fd, buffer)
+            13
+            >>> buffer[:13]
+            bytearray(b'received data')
+
+            >>> await recv_into(client_fd, memoryview(buffer)[13:], 100)  # at most 100 bytes
+
+        Note
+            - Kernel receives straight into writable `buffer`, no new `bytes` is created.
+            - `nbytes=0` receives up to `len(buffer)`.
+    '''
+    if not nbytes or nbytes > len(buffer):
+        nbytes = len(buffer)
+    if not nbytes:
+        return 0
+    cdef SQE sqe = new_sqe(1, True, timeout)
+    __io_uring_prep_recv(sqe.ptr, sockfd, &buffer[0], nbytes, flags)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    await sqe
+    cdef __s32 result = sqe.result
+    free_sqe(sqe)
+    return result
+
+
+async def recvfrom(int sockfd, unsigned int bufsize, int flags=0, *, double timeout=0,
+                   bint direct=False)-> tuple[bytes, tuple[str, int]]:
+    ''' Receive Datagram & its Source Address
+
+        Example
+            >>> await recvfrom(udp_fd, 1024)
+            (b'metric:1|c', ('127.0.0.1', 53412))
+
+        Note
+            - Datagram bigger than `bufsize` is truncated.
+            - Use `recvmsg_many()` to receive many datagrams without entry per datagram.
+    '''
+    cdef:
+        SQE                 sqe = new_sqe(1, True, timeout)
+        bytes               buf = PyBytes_FromStringAndSize(NULL, bufsize)
+        msghdr              msg = msghdr()
+        __iovec             iov
+        __sockaddr_storage  name
+        unsigned int        result
+    iov.iov_base = PyBytes_AS_STRING(buf)
+    iov.iov_len = bufsize
+    msg.ptr.msg_iov = &iov
+    msg.ptr.msg_iovlen = 1
+    msg.ptr.msg_name = &name
+    msg.ptr.msg_namelen = sizeof(__sockaddr_storage)
+    name.ss_family = 0  # note: kernel leaves it untouched if sender has no address.
+    __io_uring_prep_recvmsg(sqe.ptr, sockfd, msg.ptr, flags)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    await sqe
+    result = sqe.result
+    free_sqe(sqe)
+    return buf[:result] if result != bufsize else buf, peer_address(<__sockaddr*>&name)
+
+
+async def recv_many(int sockfd, BufferRing br not None, int flags=0, *, bint direct=False):
+    ''' Multishot Receive into Provided Buffers
+
+        Example
+            >>> async with BufferRing(64, 4096) as br:
+            ...     async for lease in recv_many(client_fd, br):
+            ...         with lease:
+            ...             bytes(lease)
+            b'received data'
+
+        Note
+            - Single multishot `recv` entry stays armed, kernel picks a free buffer from `br`
+            as data arrives, so no buffer is pinned for idle connection.
+            - Yields `BufferLease`, it must be released to return buffer back to `br`.
+            - Iteration stops when peer closes connection.
+            - If `br` runs out of buffers, entry is re-armed once a buffer is released back.
+            - Leaving the loop cancels the armed entry & returns unread buffers back to `br`.
+    '''
+    if not br:
+        raise ValueError('`recv_many(br)` - `BufferRing` is not registered, use `await BufferRing()`')
+
+    cdef:
+        SQE     sqe = SQE(error=False, flags=IOSQE_BUFFER_SELECT, multishot=True)
+        __s32   result
+
+    __io_uring_prep_recv_multishot(sqe.ptr, sockfd, NULL, 0, flags)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    sqe_set_buf_group(sqe.ptr, br.group)
+    try:
+        while True:
+            await sqe
+            if (result := sqe.result) > 0:
+                yield br.lease(sqe.cqe_flags >> IORING_CQE_BUFFER_SHIFT, result)
+            elif result == 0:
+                break  # connection closed
+            elif result == -ENOBUFS:
+                if not br.available:
+                    trap_error(result, '`recv_many()` - all `BufferRing` buffers are leased')
+                # note: next `await` re-arms entry.
+            else:
+                trap_error(result)
+    finally:
+        # note: buffer filled after cancel is returned by event loop, nobody awaits `sqe`.
+        sqe.drop(br.ring, lambda result, cqe_flags: _return_buffer(br, result, cqe_flags))
+
+
+def _return_buffer(BufferRing br, int result, unsigned int cqe_flags):
+    if result > 0:
+        br.available -= 1  # note: taken by kernel, `put()` counts it back.
+        br.put(cqe_flags >> IORING_CQE_BUFFER_SHIFT)
+
 
+# note: `io_uring_recvmsg_out` followed by room for `sockaddr_in6`, at start of each buffer.
+cdef unsigned int RECVMSG_HEADER = sizeof(__io_uring_recvmsg_out) + sizeof(__sockaddr_in6)
 
-async def send(int sockfd, const unsigned char[:] buf, int flags=0):
+
+async def recvmsg_many(int sockfd, BufferRing br not None, int flags=0, *, bint direct=False):
+    ''' Multishot Receive of Datagrams into Provided Buffers
+
+        Example
+            >>> async with BufferRing(256, 2048) as br:
+            ...     async for batch in recvmsg_many(udp_fd, br):
+            ...         for payload, addr in batch:
+            ...             ...
+            [(b'metric:1|c', ('127.0.0.1', 53412)), (b'metric:2|c', ('127.0.0.1', 53412))]
+
+        Note
+            - Single multishot `recvmsg` entry stays armed, kernel writes each datagram with its
+            source address into free buffer of `br`.
+            - All datagrams that arrive during same event loop turn are yielded together as
+            `list[tuple[bytes, tuple[str, int]]]`, entry per datagram is never needed.
+            - Payload is copied out & buffer is returned to `br` right away, so small datagrams
+            do not hold whole buffers.
+            - Each buffer starts with 44 bytes header & source address, datagram bigger than
+            rest of buffer is truncated.
+            - Leaving the loop cancels the armed entry & returns unread buffers back to `br`.
+    '''
+    if not br:
+        raise ValueError('`recvmsg_many(br)` - `BufferRing` is not registered, use '
+                         '`await BufferRing()`')
+    if br.size <= RECVMSG_HEADER:
+        raise ValueError(f'`recvmsg_many(br)` - `BufferRing` size must be `> {RECVMSG_HEADER}`')
+
+    cdef:
+        SQE                     sqe = SQE(error=False, flags=IOSQE_BUFFER_SELECT, multishot=True)
+        SQE                     nop = new_sqe()
+        msghdr                  msg = msghdr()
+        list                    batch
+        __s32                   result
+        __u32                   cqe_flags
+        __u16                   bid
+        unsigned char*          data
+        __io_uring_recvmsg_out* out
+
+    # note: `msghdr` only tells kernel how much room to keep for address in each buffer.
+    msg.ptr.msg_namelen = sizeof(__sockaddr_in6)
+    __io_uring_prep_recvmsg_multishot(sqe.ptr, sockfd, msg.ptr, flags)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    sqe_set_buf_group(sqe.ptr, br.group)
+    try:
+        while True:
+            await sqe
+            sqe.pending.appendleft((sqe.result, sqe.cqe_flags))
+            # note: single `nop` lets event loop go around once, rest of datagrams that arrive
+            #       meanwhile are held in `pending` & taken as one batch.
+            io_uring_prep_nop(nop)
+            await nop
+            batch = []
+            while sqe.pending:
+                result, cqe_flags = sqe.pending.popleft()
+                if result > 0:
+                    bid = cqe_flags >> IORING_CQE_BUFFER_SHIFT
+                    data = br.memory + bid * br.size
+                    if (out := __io_uring_recvmsg_validate(data, result, msg.ptr)) is not NULL:
+                        batch.append((
+                            PyBytes_FromStringAndSize(
+                                <char*>__io_uring_recvmsg_payload(out, msg.ptr),
+                                __io_uring_recvmsg_payload_length(out, result, msg.ptr)
+                            ),
+                            peer_address(<__sockaddr*>__io_uring_recvmsg_name(out))
+                        ))
+                    br.available -= 1  # note: taken by kernel, `put()` counts it back.
+                    br.put(bid)
+                elif result == -ENOBUFS:
+                    if not br.available:
+                        trap_error(result, '`recvmsg_many()` - all `BufferRing` buffers are leased')
+                    # note: next `await` re-arms entry.
+                else:
+                    trap_error(result)
+            if batch:
+                yield batch
+    finally:
+        free_sqe(nop)
+        # note: buffer filled after cancel is returned by event loop, nobody awaits `sqe`.
+        sqe.drop(br.ring, lambda result, cqe_flags: _return_buffer(br, result, cqe_flags))
+
+
+cdef size_t ZEROCOPY_MIN = 16384  # note: below this size copying is cheaper than pinning pages.
+
+
+async def send(int sockfd, const unsigned char[:] buf, int flags=0, *, double timeout=0,
+               bint direct=False, bint zerocopy=False):
     '''
         Example
             >>> await send(client_fd, b'send data')
             10
+
+            >>> await send(client_fd, b'send data', timeout=5)  # raises `TimeoutError`
+
+            >>> await send(client_fd, large_payload, zerocopy=True)
+            1048576
+
+        Note
+            - `zerocopy=True` sends payload of 16 KiB or more using `IORING_OP_SEND_ZC`, kernel
+            sends straight from `buf` & returns only once its done with it, so `buf` can be
+            reused. Smaller payload or `timeout` uses normal copying send.
     '''
     cdef:
-        SQE sqe = SQE()
-        size_t length = len(buf)
+        SQE     sqe
+        SendZC  zc
+        size_t  length = len(buf)
+        __s32   result
+    if zerocopy and length >= ZEROCOPY_MIN and not timeout:
+        zc = new_send_zc(sockfd, buf, flags, direct)
+        await zc
+        result = zc.result
+        if zc.cqe_flags & IORING_CQE_F_MORE:
+            await zc  # `IORING_CQE_F_NOTIF`
+        return result
+    sqe = new_sqe(1, True, timeout)
     io_uring_prep_send(sqe, sockfd, buf, length, flags)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
     await sqe
-    return sqe.result
+    result = sqe.result
+    free_sqe(sqe)
+    return result
 
 
-async def sendall(int sockfd, const unsigned char[:] buf, int flags=0):
+async def sendall(int sockfd, const unsigned char[:] buf, int flags=0, *, double timeout=0,
+                  bint direct=False, bint zerocopy=False):
     '''
         Example
             >>> await sendall(client_fd, b'send data')
             10
+
+            >>> await sendall(client_fd, large_payload, zerocopy=True)
+
+        Note
+            - `timeout` applies to each `send` not whole `sendall`.
+            - `zerocopy=True` uses `IORING_OP_SEND_ZC` while 16 KiB or more is left to send, next
+            send is submitted without waiting for kernel to release previous part of `buf`,
+            all notifications are collected before return.
     '''
     cdef:
-        SQE             sqe     = SQE()
+        SQE             sqe     = new_sqe(1, True, timeout)
+        SendZC          zc
+        list            notify  = []
         size_t          length  = len(buf)
         unsigned int    total   = 0
 
-    while True:
-        io_uring_prep_send(sqe, sockfd, buf[total:], length-total, flags)
-        await sqe
-        if (total := total + sqe.result) == length:
-            break
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    zerocopy = zerocopy and not timeout
+    while total < length:
+        if zerocopy and length - total >= ZEROCOPY_MIN:
+            zc = new_send_zc(sockfd, buf[total:], flags, direct)
+            await zc
+            total += zc.result
+            if zc.cqe_flags & IORING_CQE_F_MORE:
+                notify.append(zc)
+        else:
+            io_uring_prep_send(sqe, sockfd, buf[total:], length-total, flags)
+            await sqe
+            total += sqe.result
+    for zc in notify:
+        await zc  # `IORING_CQE_F_NOTIF`
+    free_sqe(sqe)
+
+
+async def sendmsg(int sockfd, list buffers not None, int flags=0, *, double timeout=0,
+                  bint direct=False, sockaddr addr=None)-> int:
+    '''
+        Example
+            >>> await sendmsg(client_fd, [b'header', b'body'])
+            10
 
+            # datagram
+            >>> addr = sockaddr(AF_INET, b'127.0.0.1', 8125)
+            >>> await sendmsg(udp_fd, [b'metric:', b'1|c'], addr=addr)
+            10
 
-async def shutdown(int sockfd, int how=__SHUT_RDWR):
+        Note
+            - Gather send, `buffers` are sent in order using single entry without having to
+            join them first.
+            - Like `send()` it can send less than all of `buffers` on stream socket.
+            - `addr` sets destination of unconnected datagram socket, `buffers` are sent as
+            single datagram.
+    '''
+    if not buffers:
+        return 0
+    cdef:
+        SQE     sqe = new_sqe(1, True, timeout)
+        iovec   iov = iovec(buffers)
+        msghdr  msg = msghdr()
+        __s32   result
+    msg.ptr.msg_iov = iov.ptr
+    msg.ptr.msg_iovlen = len(iov)
+    if addr is not None:
+        msg.ptr.msg_name = addr.ptr
+        msg.ptr.msg_namelen = addr.sizeof
+    io_uring_prep_sendmsg(sqe, sockfd, msg, flags)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    await sqe
+    result = sqe.result
+    free_sqe(sqe)
+    return result
+
+
+async def sendto(int sockfd, const unsigned char[:] buf, sockaddr addr not None, int flags=0, *,
+                 double timeout=0, bint direct=False)-> int:
+    ''' Send Datagram to Address
+
+        Example
+            >>> udp_fd = await socket(AF_INET, SOCK_DGRAM)
+            >>> addr = sockaddr(AF_INET, b'127.0.0.1', 8125)
+            >>> await sendto(udp_fd, b'metric:1|c', addr)
+            10
+
+        Note
+            - Same `addr` can be reused for any number of sends.
+    '''
+    cdef:
+        SQE     sqe = new_sqe(1, True, timeout)
+        __s32   result
+    __io_uring_prep_sendto(sqe.ptr, sockfd, &buf[0] if len(buf) else NULL, len(buf), flags,
+                           <__sockaddr*>addr.ptr, addr.sizeof)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    await sqe
+    result = sqe.result
+    free_sqe(sqe)
+    return result
+
+
+async def sendfile(int sockfd, object file not None, __u64 offset=0, __u64 count=0, *,
+                   bint direct=False)-> __u64:
+    ''' Send File to Socket without Copy
+
+        Type
+            sockfd: int
+            file:   File | int  # `File()` or file descriptor
+            offset: int
+            count:  int         # `0` sends till end of file
+            direct: bool        # `sockfd` is direct descriptor
+            return: int         # total bytes sent
+
+        Example
+            >>> async with File('index.html') as file:
+            ...     await sendfile(client_fd, file)
+            1024
+
+            >>> await sendfile(client_fd, fd, 100, 50)  # 50 bytes starting at offset 100
+            50
+
+        Note
+            - Data is moved file -> pipe -> socket using linked `IORING_OP_SPLICE` entries, it
+            never enters userspace & memory used is a pipe pair no matter the file size.
+            - `File(direct=True)` is spliced as direct descriptor.
+            - Like `os.sendfile()` position of `file` is not changed.
+    '''
+    cdef:
+        SQE             sqe, drain
+        File            _file
+        int             fd, pipefd[2]
+        unsigned int    length, in_flags = 0
+        __s32           result
+        __u32           left
+        __u64           total = 0
+
+    if isinstance(file, File):
+        _file = <File>file
+        _file.closed()
+        fd = _file.fileno
+        if _file._direct:
+            in_flags = __SPLICE_F_FD_IN_FIXED
+    else:
+        fd = file
+    if pipe2(pipefd, O_CLOEXEC) < 0:
+        raise_error()
+    try:
+        sqe = new_sqe(2, False)
+        sqe.link_flag = IOSQE_IO_LINK  # note: short splice into pipe cancels splice out of it.
+        if direct:
+            (<SQE>sqe[1]).flags = IOSQE_FIXED_FILE
+        while not count or total < count:
+            # note: `length` never exceeds default pipe size, so splice into pipe can't block.
+            length = 65536 if not count or count - total > 65536 else count - total
+            io_uring_prep_splice(sqe, fd, offset + total, pipefd[1], -1, length, in_flags)
+            io_uring_prep_splice(sqe[1], pipefd[0], -1, sockfd, -1, length, 0)
+            await sqe
+            if (result := sqe.result) == 0:
+                break  # end of file
+            trap_error(result)
+            total += result
+            left = result
+            if (result := sqe[1].result) != -ECANCELED:
+                trap_error(result)
+                left -= result
+            if left:  # partial transfer, send what is still in pipe.
+                drain = new_sqe()
+                if direct:
+                    drain.flags = IOSQE_FIXED_FILE
+                while left:
+                    io_uring_prep_splice(drain, pipefd[0], -1, sockfd, -1, left, 0)
+                    await drain
+                    left -= drain.result
+                free_sqe(drain)
+        free_sqe(sqe)
+    finally:
+        _close(pipefd[0])
+        _close(pipefd[1])
+    return total
+
+
+async def shutdown(int sockfd, int how=__SHUT_RDWR, *, bint direct=False):
     '''
         How
             SHUT_RD
             SHUT_WR
             SHUT_RDWR   # (default)
     '''
-    cdef SQE sqe = SQE()
+    cdef SQE sqe = new_sqe()
     io_uring_prep_shutdown(sqe, sockfd, how)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
     await sqe
+    free_sqe(sqe)
 
 
-async def bind(int sockfd, str host, in_port_t port)-> object:
+async def bind(int sockfd, str host, in_port_t port, *, bint direct=False)-> object:
     '''
         Example
             >>> sockfd = await socket()
@@ -152,27 +797,80 @@ async def bind(int sockfd, str host, in_port_t port)-> object:
             '0.0.0.0', 6744  # random port
 
             >>> await close(sockfd)
+
+        Note
+            - Set `direct=True` if `sockfd` is direct descriptor index, family is then picked
+            from `host`.
     '''
     cdef:  # get family
         __sockaddr  sa
         socklen_t   size = sizeof(__sockaddr_storage)
+        bytes       _host = host.encode()
 
-    __getsockname(sockfd, &sa, &size)
+    if direct:
+        sa.sa_family = socket_family(_host)
+    else:
+        __getsockname(sockfd, &sa, &size)
 
     cdef:
-        sockaddr addr = sockaddr(sa.sa_family, host.encode(), port)
-        SQE sqe = SQE()
+        sockaddr addr = sockaddr(sa.sa_family, _host, port)
+        SQE sqe = new_sqe()
     io_uring_prep_bind(sqe, sockfd, addr)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
     await sqe
+    free_sqe(sqe)
     return addr
 
 
-async def listen(int sockfd, int backlog)-> int:
+async def listen(int sockfd, int backlog, *, bint direct=False)-> int:
     cdef:
-        SQE sqe = SQE()
+        SQE sqe = new_sqe()
     io_uring_prep_listen(sqe, sockfd, backlog)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
     await sqe
-    return sqe.result
+    cdef __s32 result = sqe.result
+    free_sqe(sqe)
+    return result
+
+
+async def listener(str host not None, in_port_t port, int backlog=1024, *,
+                   bint reuse_port=True, bint direct=False)-> int:
+    ''' Create Listening Socket
+
+        Example
+            >>> server_fd = await listener('0.0.0.0', 8080)
+            >>> client_fd = await accept(server_fd)
+            ...
+            >>> await close(server_fd)
+
+        Note
+            - `AF_INET6` socket is created if `host` is IPv6 address.
+            - `reuse_port=True` sets `SO_REUSEPORT` so each worker of `run_workers()` can listen
+            on same port & kernel balances incoming connections between them.
+            - `direct=True` creates listening socket in registered file table & returns direct
+            descriptor index, use `accept_direct(index, direct=True)`.
+    '''
+    cdef:
+        SQE sqe
+        int sockfd = await socket(socket_family(host.encode()), direct=direct)
+    try:
+        await setsockopt(sockfd, __SOL_SOCKET, __SO_REUSEADDR, 1, direct=direct)
+        if reuse_port:
+            await setsockopt(sockfd, __SOL_SOCKET, __SO_REUSEPORT, 1, direct=direct)
+        await bind(sockfd, host, port, direct=direct)
+        await listen(sockfd, backlog, direct=direct)
+    except BaseException:
+        if direct:
+            sqe = new_sqe()
+            io_uring_prep_close_direct(sqe, sockfd)
+            await sqe
+            free_sqe(sqe)
+        else:
+            _close(sockfd)
+        raise
+    return sockfd
 
 
 async def getsockname(int sockfd, sockaddr addr)-> tuple[str, int]:
@@ -183,7 +881,7 @@ async def getsockname(int sockfd, sockaddr addr)-> tuple[str, int]:
     return ip.decode(), port
 
 
-async def setsockopt(int sockfd, int level, int optname, object optval):
+async def setsockopt(int sockfd, int level, int optname, object optval, *, bint direct=False):
     '''
         Example
             >>> await setsockopt(sockfd, SOL_SOCKET, SO_REUSEADDR, 1)
@@ -204,12 +902,15 @@ async def setsockopt(int sockfd, int level, int optname, object optval):
         val = array('B', [optval])
     else:
         raise TypeError(f'`setsockopt` received `optval` type {t!r}, not supported')
-    cdef SQE sqe = SQE()
+    cdef SQE sqe = new_sqe()
     io_uring_prep_setsockopt(sqe, sockfd, level, optname, val)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
     await sqe
+    free_sqe(sqe)
 
 
-async def getsockopt(int sockfd, int level, int optname)-> int:
+async def getsockopt(int sockfd, int level, int optname, *, bint direct=False)-> int:
     '''
         Example
             >>> await getsockopt(sockfd, SOL_SOCKET, SO_REUSEADDR)
@@ -219,8 +920,47 @@ async def getsockopt(int sockfd, int level, int optname)-> int:
             - This function is still flawed, needs more testing.
     '''
     cdef:
-        SQE sqe = SQE()
+        SQE sqe = new_sqe()
         array optval = array('i', [0])
     io_uring_prep_getsockopt(sqe, sockfd, level, optname, optval)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
     await sqe
+    free_sqe(sqe)
     return optval[0]
+
+
+cdef class SendZC(SQE):
+
+    def __init__(self):
+        raise TypeError('`SendZC()` is created by `send(zerocopy=True)`')
+
+
+cdef SendZC new_send_zc(int sockfd, const unsigned char[:] buf, int flags, bint direct):
+    # note: zero-copy send posts two results, bytes sent with `IORING_CQE_F_MORE` then
+    #       `IORING_CQE_F_NOTIF` once kernel is done with `buf`. As multishot entry ring holds
+    #       reference to it till notification arrives, which keeps `buf` alive.
+    cdef SendZC sqe = SendZC.__new__(SendZC)
+    SQE.__init__(sqe, 1, True, multishot=True)
+    sqe.buffer = buf
+    io_uring_prep_send_zc(sqe, sockfd, buf, len(buf), flags, 0)
+    if direct:
+        sqe.flags |= IOSQE_FIXED_FILE
+    return sqe
+
+
+cdef inline int socket_family(bytes host) noexcept:
+    # note: direct descriptor has no `fd` to `getsockname` from, so family is picked from `host`.
+    return __AF_INET6 if isIP(__AF_INET6, host) else __AF_INET
+
+
+cdef tuple peer_address(__sockaddr* sa):
+    # note: source address of received datagram, same form as `getsockname()` returns.
+    cdef char ip[__INET6_ADDRSTRLEN]
+    if sa.sa_family == __AF_INET:
+        __inet_ntop(__AF_INET, &(<__sockaddr_in*>sa).sin_addr, ip, __INET6_ADDRSTRLEN)
+        return ip.decode(), __ntohs((<__sockaddr_in*>sa).sin_port)
+    elif sa.sa_family == __AF_INET6:
+        __inet_ntop(__AF_INET6, &(<__sockaddr_in6*>sa).sin6_addr, ip, __INET6_ADDRSTRLEN)
+        return ip.decode(), __ntohs((<__sockaddr_in6*>sa).sin6_port)
+    return None  # e.g. unnamed `AF_UNIX` socket
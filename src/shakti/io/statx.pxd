@@ -1,8 +1,8 @@
 from libc.errno cimport ENOENT
-from liburing.lib.type cimport __AT_FDCWD
+from liburing.lib.type cimport __s32, __AT_FDCWD
 from liburing.lib.statx cimport *
 from liburing.statx cimport statx, io_uring_prep_statx
-from ..event.entry cimport SQE
+from ..event.entry cimport SQE, new_sqe, free_sqe
 
 
 cdef class Statx(statx):
@@ -48,9 +48,10 @@ cdef class Statx(statx):
         if self.__awaited__:
             return self
         self.__awaited__ = True
-        cdef SQE sqe = SQE()
+        cdef SQE sqe = new_sqe()
         io_uring_prep_statx(sqe, self, self._path, self._flags, self._mask,  self._dir_fd)
         await sqe
+        free_sqe(sqe)
         return self
 
     async def __aexit__(self, *errors):
@@ -71,7 +72,10 @@ async def exists(str path not None)-> bool:
     '''
     cdef:
         bytes   _path = path.encode()
-        SQE     sqe = SQE(1, False)
+        SQE     sqe = new_sqe(1, False)
+        __s32   result
     io_uring_prep_statx(sqe, None, _path)
     await sqe
-    return sqe.result != -ENOENT  # FileNotFoundError
+    result = sqe.result
+    free_sqe(sqe)
+    return result != -ENOENT  # FileNotFoundError
@@ -0,0 +1,38 @@
+from libc.string cimport memcpy, memmove
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from cpython.bytearray cimport PyByteArray_FromStringAndSize, PyByteArray_AS_STRING
+from liburing.lib.type cimport __s32
+from liburing.lib.uring cimport __io_uring_prep_recv
+from liburing.common cimport SC_IOV_MAX, iovec, io_uring_prep_close, io_uring_prep_close_direct
+from liburing.socket cimport msghdr, io_uring_prep_sendmsg
+from liburing.queue cimport IOSQE_FIXED_FILE, io_uring
+from ..event.entry cimport RING, SQE, new_sqe, free_sqe
+from ..event.run cimport __prep_coroutine
+from ..event.waiter cimport new_waiter, wake
+from ..lib.error cimport UnsupportedOperation
+from .common cimport IOBase
+
+
+cdef extern from '<sys/socket.h>' nogil:
+    enum: MSG_MORE
+
+
+cdef class Stream(IOBase):
+    cdef:
+        bytearray       _buffer
+        size_t          _start, _end
+        double          _timeout
+        bint            _direct
+        readonly size_t limit
+        readonly bint   eof
+        # write
+        io_uring        ring
+        list            _buffers, _waiters
+        bint            _flushing, _corked
+        object          _error
+        readonly size_t high, low, pending
+
+    cdef void reserve(self, size_t length)
+    cdef bytes take(self, size_t length)
+    cdef void schedule(self)
+    cdef void wake_waiters(self, bint done)
@@ -0,0 +1,440 @@
+cdef class Stream(IOBase):
+
+    def __init__(self, int sockfd, size_t size=65536, *, size_t limit=65536, double timeout=0,
+                 bint direct=False, size_t high=65536, size_t low=16384):
+        ''' Buffered Socket Stream - parse protocol without joining `recv()` results.
+
+            Type
+                sockfd:  int    # connected socket
+                size:    int    # initial buffer size
+                limit:   int    # max bytes `readuntil` & `readline` can buffer
+                timeout: float  # applies to each `recv`
+                direct:  bool   # `sockfd` is direct descriptor
+                high:    int    # `drain()` waits once more than `high` bytes are pending
+                low:     int    # ... till pending bytes drop to `low`
+                return:  None
+
+            Example
+                >>> async with Stream(client_fd) as stream:
+                ...     await stream.readline()
+                ...     await stream.readuntil(b'\r\n\r\n')
+                ...     await stream.readexactly(13)
+                ...     await stream.read(1024)
+                b'GET / HTTP/1.1\r\n'
+                b'Host: localhost\r\n\r\n'
+                b'hello, world!'
+                b'...'
+                ...     stream.write(b'HTTP/1.1 200 OK\r\n')
+                ...     stream.write(b'Content-Length: 13\r\n\r\n')
+                ...     stream.write(b'hello, world!')
+                ...     await stream.drain()
+
+            Note
+                - Data is received straight into single reused buffer, buffer is compacted in
+                place & only grows when more than its size has to be buffered, read methods
+                return `bytes` copied once out of it.
+                - `readexactly` of more than buffer size receives rest of data directly into
+                returned `bytes`.
+                - Stream owns `sockfd`, `close()` closes it.
+                - Only one coroutine should read from stream at a time.
+                - `write()` only buffers data, all writes made during same event loop iteration,
+                by any coroutine, are sent together by single vectored `sendmsg` at start of
+                next iteration.
+        '''
+        if not size:
+            self.msg = f'`{self.__class__.__name__}(size)` - can not be `0`'
+            raise ValueError(self.msg)
+        if low > high:
+            self.msg = f'`{self.__class__.__name__}(low)` - can not be `> high`'
+            raise ValueError(self.msg)
+        self.fileno = sockfd
+        self.limit = limit
+        self.eof = False
+        self._timeout = timeout
+        self._direct = direct
+        self._buffer = PyByteArray_FromStringAndSize(NULL, size)
+        self._start = self._end = 0
+        self._buffers = []
+        self._waiters = []
+        self.high = high
+        self.low = low
+        self.pending = 0
+
+    async def __ainit__(self):
+        # note: socket is already connected, ring is kept so `write()` can schedule flush.
+        cdef SQE sqe = SQE(0, error=False)
+        sqe.job = RING
+        self.ring = await sqe
+
+    async def __aexit__(self, *errors):
+        if not any(errors):
+            return await self.close()
+        if self.fileno > -1:
+            try:
+                await self.close()
+            except Exception:
+                pass  # note: error raised inside `async with` block is more relevant.
+        return False
+
+    def __bool__(self):
+        return self.fileno > -1
+
+    def __len__(self):
+        return self._end - self._start  # buffered bytes
+
+    async def close(self):
+        ''' Flush Pending Writes & Close Socket
+
+            Note
+                - Socket is closed even if flush fails, its error is raised after.
+        '''
+        cdef SQE sqe
+        self.closed()
+        try:
+            if self.pending:
+                await self.flush()
+        finally:
+            sqe = new_sqe()
+            if self._direct:
+                io_uring_prep_close_direct(sqe, self.fileno)
+            else:
+                io_uring_prep_close(sqe, self.fileno)
+            await sqe
+            free_sqe(sqe)
+            self.fileno = -1
+
+    async def fill(self, size_t length=0)-> int:
+        ''' Receive more data into buffer
+
+            Example
+                >>> await stream.fill()
+                13
+
+            Note
+                - Makes room for at least `length` bytes, if buffer is full.
+                - Returns `0` once peer has closed its side & sets `stream.eof`.
+        '''
+        self.closed()
+        if self.eof:
+            return 0
+        cdef:
+            SQE     sqe = new_sqe(1, True, self._timeout)
+            __s32   result
+        self.reserve(length or 1)
+        __io_uring_prep_recv(sqe.ptr, self.fileno,
+                             PyByteArray_AS_STRING(self._buffer) + self._end,
+                             len(self._buffer) - self._end, 0)
+        if self._direct:
+            sqe.flags |= IOSQE_FIXED_FILE
+        await sqe
+        result = sqe.result
+        free_sqe(sqe)
+        if result:
+            self._end += result
+        else:
+            self.eof = True
+        return result
+
+    async def read(self, Py_ssize_t n=-1)-> bytes:
+        ''' Read Up to `n` Bytes
+
+            Example
+                >>> await stream.read(5)
+                b'hello'
+
+                >>> await stream.read()  # till end of stream
+                b', world!'
+
+            Note
+                - Buffered data is returned without receiving, else single `recv` is done.
+                - Returns `b''` at end of stream.
+        '''
+        if n < 0:
+            while await self.fill():
+                pass
+            return self.take(self._end - self._start)
+        elif not n:
+            return b''
+        elif self._start == self._end:
+            await self.fill()
+        return self.take(min(<size_t>n, self._end - self._start))
+
+    async def readexactly(self, size_t n)-> bytes:
+        ''' Read Exactly `n` Bytes
+
+            Example
+                >>> await stream.readexactly(5)
+                b'hello'
+
+            Note
+                - Raises `EOFError` if stream ends before `n` bytes, partial data is kept in
+                buffer & can still be read by `read()`.
+        '''
+        cdef:
+            SQE     sqe
+            bytes   data
+            size_t  length = self._end - self._start
+            __s32   result
+
+        if n <= length:
+            return self.take(n)
+        elif n - length < <size_t>len(self._buffer):
+            while self._end - self._start < n:
+                if not await self.fill(n - (self._end - self._start)):
+                    raise EOFError(f'`{self.__class__.__name__}.readexactly({n})` - '
+                                   f'stream ended after {self._end - self._start} bytes')
+            return self.take(n)
+        # large read, receive rest straight into returned `bytes`
+        self.closed()
+        data = PyBytes_FromStringAndSize(NULL, n)
+        memcpy(PyBytes_AS_STRING(data),
+               PyByteArray_AS_STRING(self._buffer) + self._start, length)
+        self._start = self._end = 0
+        sqe = new_sqe(1, True, self._timeout)
+        if self._direct:
+            sqe.flags |= IOSQE_FIXED_FILE
+        while length < n and not self.eof:
+            __io_uring_prep_recv(sqe.ptr, self.fileno, PyBytes_AS_STRING(data) + length,
+                                 n - length, 0)
+            await sqe
+            if result := sqe.result:
+                length += result
+            else:
+                self.eof = True
+        free_sqe(sqe)
+        if length < n:
+            self.reserve(length)
+            memcpy(PyByteArray_AS_STRING(self._buffer), PyBytes_AS_STRING(data), length)
+            self._end = length
+            raise EOFError(f'`{self.__class__.__name__}.readexactly({n})` - '
+                           f'stream ended after {length} bytes')
+        return data
+
+    async def readuntil(self, bytes separator=b'\n')-> bytes:
+        ''' Read Until `separator` is Found
+
+            Example
+                >>> await stream.readuntil(b'\r\n\r\n')
+                b'GET / HTTP/1.1\r\nHost: localhost\r\n\r\n'
+
+            Note
+                - Returned data includes `separator`.
+                - Only newly received data is searched, not whole buffer each time.
+                - Raises `ValueError` if `limit` bytes are buffered without finding
+                `separator` & `EOFError` if stream ends, buffered data is kept in both cases.
+        '''
+        cdef:
+            size_t      size = len(separator)
+            size_t      length, searched = 0  # relative to `_start`, buffer moves on `fill`
+            Py_ssize_t  index
+        if not size:
+            self.msg = f'`{self.__class__.__name__}.readuntil(separator)` - can not be empty'
+            raise ValueError(self.msg)
+        while True:
+            index = self._buffer.find(separator, self._start + searched, self._end)
+            if index > -1:
+                return self.take(index + size - self._start)
+            if (length := self._end - self._start) >= size:
+                searched = length - size + 1
+            if length >= self.limit:
+                self.msg = f'`{self.__class__.__name__}.readuntil()` - '
+                self.msg += f'separator not found in {self.limit} bytes limit'
+                raise ValueError(self.msg)
+            if not await self.fill():
+                raise EOFError(f'`{self.__class__.__name__}.readuntil()` - '
+                               f'stream ended before separator was found')
+
+    async def readline(self)-> bytes:
+        ''' Read Line
+
+            Example
+                >>> await stream.readline()
+                b'hello\n'
+
+            Note
+                - At end of stream remaining data without newline is returned, then `b''`.
+        '''
+        try:
+            return await self.readuntil(b'\n')
+        except EOFError:
+            return self.take(self._end - self._start)
+
+    def write(self, object data not None):
+        ''' Buffer Data to Send
+
+            Example
+                >>> stream.write(b'hello')
+                >>> stream.write(b' world')
+                >>> await stream.drain()
+
+            Note
+                - Does not block, `data` is copied unless its `bytes`.
+                - Error from previous flush is raised here or by `drain()`.
+        '''
+        self.closed()
+        if self._error is not None:
+            raise self._error
+        cdef size_t length = len(data)
+        if not length:
+            return
+        self._buffers.append(data if type(data) is bytes else bytes(data))
+        self.pending += length
+        if not (self._flushing or self._corked):
+            self.schedule()
+
+    def writelines(self, object lines not None):
+        for data in lines:
+            self.write(data)
+
+    def cork(self):
+        ''' Hold Writes till `uncork()` or `flush()`
+
+            Example
+                >>> stream.cork()
+                >>> for item in items:
+                ...     stream.write(item)
+                ...     await other()  # no partial send while waiting
+                >>> stream.uncork()
+        '''
+        self._corked = True
+
+    def uncork(self):
+        self._corked = False
+        if self._buffers and not self._flushing:
+            self.schedule()
+
+    async def drain(self):
+        ''' Wait for Pending Writes to Drop
+
+            Example
+                >>> stream.write(large_data)
+                >>> await stream.drain()
+
+            Note
+                - Only waits if more than `high` bytes are pending, till its `low` or less.
+                - Corked writes are sent as well once `high` is passed.
+        '''
+        self.closed()
+        if self.pending > self.high:
+            if self._buffers and not self._flushing:
+                self.schedule()
+            await self._wait(self.low)
+        if self._error is not None:
+            raise self._error
+
+    async def flush(self):
+        ''' Send all Pending Writes & Wait till its Done
+
+            Example
+                >>> stream.write(b'bye')
+                >>> await stream.flush()
+        '''
+        self.closed()
+        self._corked = False
+        if self._buffers and not self._flushing:
+            self.schedule()
+        if self.pending:
+            await self._wait(0)
+        if self._error is not None:
+            raise self._error
+
+    async def _wait(self, size_t level):
+        if not self._flushing:
+            return  # nothing is being sent
+        cdef SQE waiter = new_waiter()
+        self._waiters.append((level, waiter))
+        await waiter
+
+    async def _flush(self):
+        cdef:
+            SQE         sqe = new_sqe()
+            iovec       iov
+            msghdr      msg = msghdr()
+            list        buffers
+            size_t      count
+            __s32       sent
+            int         flags
+        if self._direct:
+            sqe.flags |= IOSQE_FIXED_FILE
+        try:
+            while self._buffers and self.fileno > -1:
+                buffers = self._buffers
+                self._buffers = []
+                while buffers:
+                    count = min(len(buffers), <size_t>SC_IOV_MAX)
+                    # note: `MSG_MORE` tells kernel more is coming, so split batch is not sent as
+                    #       many small segments.
+                    flags = MSG_MORE if count < <size_t>len(buffers) else 0
+                    iov = iovec(buffers[:count])
+                    msg.ptr.msg_iov = iov.ptr
+                    msg.ptr.msg_iovlen = count
+                    io_uring_prep_sendmsg(sqe, self.fileno, msg, flags)
+                    await sqe
+                    sent = sqe.result
+                    self.pending -= sent
+                    count = 0
+                    while sent and sent >= <__s32>len(buffers[count]):
+                        sent -= len(buffers[count])
+                        count += 1
+                    del buffers[:count]
+                    if sent:  # partial
+                        buffers[0] = memoryview(buffers[0])[sent:]
+                    self.wake_waiters(False)
+                if self._buffers and self._corked:
+                    break
+        except Exception as e:
+            self._error = e  # note: raised by next `write()`, `drain()` or `flush()`
+        finally:
+            self._flushing = False
+            self.wake_waiters(True)
+        free_sqe(sqe)
+
+    cdef void schedule(self):
+        if self.ring is None:
+            self.msg = f'`{self.__class__.__name__}()` - must be awaited or used as '
+            self.msg += '`async with` before `write()`'
+            raise UnsupportedOperation(self.msg)
+        self._flushing = True
+        # note: flush starts as task once current event loop iteration is done.
+        __prep_coroutine(self.ring, (self._flush(),), 1, True)
+
+    cdef void wake_waiters(self, bint done):
+        cdef:
+            SQE     waiter
+            size_t  level
+            list    waiters = []
+        for level, waiter in self._waiters:
+            if done or self.pending <= level:
+                wake(self.ring, waiter)
+            else:
+                waiters.append((level, waiter))
+        self._waiters = waiters
+
+    cdef void reserve(self, size_t length):
+        # make room for `length` bytes after buffered data, compact or grow buffer if needed.
+        cdef:
+            bytearray   buffer
+            size_t      size = self._end - self._start, capacity = len(self._buffer)
+        if not size:
+            self._start = self._end = 0
+        if capacity - self._end >= length:
+            return
+        elif capacity - size >= length:  # compact
+            memmove(PyByteArray_AS_STRING(self._buffer),
+                    PyByteArray_AS_STRING(self._buffer) + self._start, size)
+        else:  # grow
+            buffer = PyByteArray_FromStringAndSize(NULL, max(capacity * 2, size + length))
+            memcpy(PyByteArray_AS_STRING(buffer),
+                   PyByteArray_AS_STRING(self._buffer) + self._start, size)
+            self._buffer = buffer
+        self._start = 0
+        self._end = size
+
+    cdef bytes take(self, size_t length):
+        cdef bytes data = PyBytes_FromStringAndSize(
+            PyByteArray_AS_STRING(self._buffer) + self._start, length
+        )
+        self._start += length
+        if self._start == self._end:
+            self._start = self._end = 0
+        return data
@@ -13,3 +13,9 @@ cdef class ConnectionNotEstablishedError(Exception):
 
 cdef class DirExistsError(Exception):
     pass  # __module__ = FileExistsError.__module__
+
+
+cdef class HTTPError(Exception):
+    cdef:
+        readonly unsigned int   status
+        readonly str            message
@@ -1 +1,11 @@
-# Empty place holder to load `.pxd`
+cdef class HTTPError(Exception):
+
+    def __init__(self, unsigned int status=400, str message=''):
+        ''' HTTP Request Error, `status` is sent back to client
+
+            Example
+                >>> raise HTTPError(413, 'body too large')
+        '''
+        super().__init__(status, message)
+        self.status = status
+        self.message = message
@@ -5,7 +5,7 @@ from liburing.lib.type cimport __AT_FDCWD, mode_t
 from liburing.os cimport io_uring_prep_mkdirat
 from ..lib.error cimport DirExistsError
 from ..lib.path cimport join_bytes, join_string
-from ..event.entry cimport SQE
+from ..event.entry cimport SQE, new_sqe, free_sqe
 from random import choice
 from math import perm
 
@@ -25,10 +25,11 @@ async def mkdir(str path not None, mode_t mode=0o777, *, int dir_fd=__AT_FDCWD):
             >>> await mkdir('create-directory')
     '''
     cdef:
-        SQE sqe = SQE()
+        SQE sqe = new_sqe()
         bytes _path = path.encode()
     io_uring_prep_mkdirat(sqe, _path, mode, dir_fd)
     await sqe
+    free_sqe(sqe)
 
 
 async def mktdir(str prefix not None='',
@@ -55,7 +56,7 @@ async def mktdir(str prefix not None='',
         return ''
 
     cdef:
-        SQE             sqe = SQE()  # reuse same `sqe` memory
+        SQE             sqe = new_sqe()  # reuse same `sqe` memory
         str             name
         bytes           path
         unicode         msg
@@ -70,6 +71,7 @@ async def mktdir(str prefix not None='',
         except FileExistsError:
             continue
         else:
+            free_sqe(sqe)
             return path.decode()
     msg = 'mktdir() - No usable temporary directory name found'
     raise DirExistsError(EEXIST, msg)
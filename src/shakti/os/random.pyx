@@ -1,6 +1,8 @@
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+from liburing.lib.uring cimport __io_uring_prep_read
 from liburing.common cimport iovec, io_uring_prep_close
-from liburing.file cimport io_uring_prep_openat, io_uring_prep_read
-from ..event.entry cimport SQE
+from liburing.file cimport io_uring_prep_openat
+from ..event.entry cimport SQE, new_sqe, free_sqe
 
 
 async def random_bytes(unsigned int length)-> bytes:
@@ -14,19 +16,22 @@ async def random_bytes(unsigned int length)-> bytes:
         return b''
 
     cdef:
-        SQE             sqe = SQE(), sqes = SQE(2)
-        bytearray       buffer = bytearray(length)
+        SQE             sqe = new_sqe(), sqes = new_sqe(2)
+        bytes           buffer = PyBytes_FromStringAndSize(NULL, length)
         unsigned int    result
 
     # open
     io_uring_prep_openat(sqe, b'/dev/urandom')
     await sqe
     result = sqe.result  # fd
+    free_sqe(sqe)
 
     # read & close
-    io_uring_prep_read(sqes, result, buffer, length)
+    __io_uring_prep_read(sqes.ptr, result, PyBytes_AS_STRING(buffer), length, 0)
+    # note: kernel reads straight into `bytes` memory, so no extra copy is made.
     io_uring_prep_close(sqes[1], result)
     await sqes
     result = sqes.result
+    free_sqe(sqes)
 
-    return bytes(buffer if result == length else buffer[:result])
+    return buffer if result == length else buffer[:result]
@@ -2,7 +2,7 @@ from libc.errno cimport ENOENT
 from liburing.os cimport io_uring_prep_unlinkat
 from liburing.lib.type cimport __AT_FDCWD, __AT_REMOVEDIR
 from liburing.error cimport trap_error
-from ..event.entry cimport SQE
+from ..event.entry cimport SQE, new_sqe, free_sqe
 
 
 async def remove(object path not None, bint is_dir=False, *,
@@ -28,7 +28,7 @@ async def remove(object path not None, bint is_dir=False, *,
             Linux 5.11
     '''
     cdef:
-        SQE sqe = SQE(1, False)
+        SQE sqe = new_sqe(1, False)
         int flags = __AT_REMOVEDIR if is_dir else 0
 
     if type(path) is str:
@@ -36,8 +36,10 @@ async def remove(object path not None, bint is_dir=False, *,
 
     io_uring_prep_unlinkat(sqe, path, flags, dir_fd)
     await sqe
+    cdef int result = sqe.result
+    free_sqe(sqe)
     if ignore:
-        if not (sqe.result & -ENOENT):
-            trap_error(sqe.result)
+        if not (result & -ENOENT):
+            trap_error(result)
     else:
-        trap_error(sqe.result)
+        trap_error(result)
@@ -1,6 +1,6 @@
 from liburing.lib.type cimport *
 from liburing.os cimport io_uring_prep_renameat
-from ..event.entry cimport SQE
+from ..event.entry cimport SQE, new_sqe, free_sqe
 
 
 async def rename(str old_path not None,
@@ -31,11 +31,12 @@ async def rename(str old_path not None,
             linux 5.11
     '''
     cdef:
-        SQE     sqe = SQE()
+        SQE     sqe = new_sqe()
         bytes   _old_path = old_path.encode()
         bytes   _new_path = new_path.encode()
     io_uring_prep_renameat(sqe, _old_path, _new_path, old_dir_fd, new_dir_fd, flags)
     await sqe
+    free_sqe(sqe)
 
 
 cpdef enum __rename_define__:
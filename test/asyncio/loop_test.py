@@ -0,0 +1,164 @@
+import struct
+import asyncio
+import socket
+import pytest
+import shakti
+
+
+@pytest.fixture
+def loop():
+    loop = shakti.EventLoop()
+    yield loop
+    loop.close()
+
+
+def test_policy():
+    asyncio.set_event_loop_policy(shakti.EventLoopPolicy())
+    try:
+        assert asyncio.run(running_loop()) == 'EventLoop'
+    finally:
+        asyncio.set_event_loop_policy(None)
+
+
+def test_call(loop):
+    called = []
+    loop.call_later(0.002, called.append, 'later')
+    loop.call_soon(called.append, 'soon')
+    loop.run_until_complete(asyncio.sleep(0.005))
+    assert called == ['soon', 'later']
+    assert loop.run_until_complete(loop.run_in_executor(None, sum, [1, 2, 3])) == 6
+
+
+def test_sock(loop):
+    loop.run_until_complete(sock_echo(loop))
+
+
+def test_sock_accept_reset(loop):
+    loop.run_until_complete(sock_accept_reset(loop))
+
+
+def test_datagram(loop):
+    loop.run_until_complete(datagram(loop))
+
+
+def test_stream(loop):
+    loop.run_until_complete(stream_echo())
+
+
+def test_cancel(loop):
+    loop.run_until_complete(cancel_recv(loop))
+
+
+async def running_loop():
+    return asyncio.get_running_loop().__class__.__name__
+
+
+async def sock_echo(loop):
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen()
+    server.setblocking(False)
+    client = socket.socket()
+    client.setblocking(False)
+    with server, client:
+        accept = loop.create_task(loop.sock_accept(server))
+        await loop.sock_connect(client, server.getsockname())
+        conn, addr = await accept
+        with conn:
+            assert addr == client.getsockname()
+            await loop.sock_sendall(client, b'hello' * 100_000)
+            received = bytearray()
+            while len(received) < 500_000:
+                received += await loop.sock_recv(conn, 65536)
+            assert received == b'hello' * 100_000
+            buf = bytearray(5)
+            await loop.sock_sendall(conn, b'world')
+            assert await loop.sock_recv_into(client, buf) == 5
+            assert buf == b'world'
+            client.close()
+            assert await loop.sock_recv(conn, 10) == b''
+
+
+async def sock_accept_reset(loop):
+    # peer resets connection before its accepted, error belongs to `sock_accept` not loop.
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen()
+    server.setblocking(False)
+    with server:
+        client = socket.create_connection(server.getsockname())
+        client.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+        client.close()
+        await asyncio.sleep(.01)
+        with pytest.raises(OSError):
+            await loop.sock_accept(server)
+        await asyncio.sleep(0)  # loop keeps running
+
+
+async def stream_echo():
+    async def handler(reader, writer):
+        writer.write(await reader.readline())
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handler, '127.0.0.1', 0)
+    async with server:
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('localhost', port)
+        writer.write(b'hello world\n')
+        assert await reader.readline() == b'hello world\n'
+        assert await reader.read() == b''
+        writer.close()
+        await writer.wait_closed()
+
+
+async def cancel_recv(loop):
+    a, b = socket.socketpair()
+    with a, b:
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(loop.sock_recv(a, 10), 0.01)
+        await asyncio.sleep(0.001)  # let cancel entry complete
+        assert loop._proactor.inflight == 1  # only self-pipe read is left
+
+
+class Echo(asyncio.DatagramProtocol):
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.transport.sendto(data.upper(), addr)
+
+
+async def datagram(loop):
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(('127.0.0.1', 0))
+    server.setblocking(False)
+    client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    client.bind(('127.0.0.1', 0))
+    client.setblocking(False)
+    with server, client:
+        await loop.sock_sendto(client, b'hello', server.getsockname())
+        assert await loop.sock_recvfrom(server, 1024) == (b'hello', client.getsockname())
+        await loop.sock_sendto(client, b'world!', server.getsockname())
+        buffer = bytearray(8)
+        assert await loop.sock_recvfrom_into(server, buffer, 5) == (5, client.getsockname())
+        assert buffer[:5] == b'world'
+
+    a, b = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+    with a, b:
+        b.send(b'hi')
+        assert await loop.sock_recvfrom(a, 1024) == (b'hi', None)  # unnamed
+
+    # transport
+    transport, _ = await loop.create_datagram_endpoint(Echo, local_addr=('127.0.0.1', 0))
+    try:
+        client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        client.setblocking(False)
+        with client:
+            await loop.sock_sendto(client, b'echo', transport.get_extra_info('sockname'))
+            data, addr = await asyncio.wait_for(loop.sock_recvfrom(client, 1024), 1)
+            assert data == b'ECHO'
+            assert addr == transport.get_extra_info('sockname')
+    finally:
+        transport.close()
@@ -5,7 +5,7 @@ import pathlib
 import getpass
 import tempfile
 import liburing
-# import shakti
+import shakti
 
 
 @pytest.fixture
@@ -34,6 +34,20 @@ def tmp_dir():
     return pathlib.Path(tempfile.mkdtemp(dir=path))
 
 
+async def local_listener():
+    ''' Listening socket bound to random port of `127.0.0.1`
+
+        Example
+            >>> from conftest import local_listener
+            >>> server_fd, port = await local_listener()
+            >>> client_fd = await shakti.socket()
+            >>> await shakti.connect(client_fd, '127.0.0.1', port)
+    '''
+    server_fd = await shakti.listener('127.0.0.1', 0)
+    addr = liburing.sockaddr(shakti.AF_INET, b'127.0.0.1', 0)
+    return server_fd, (await shakti.getsockname(server_fd, addr))[1]
+
+
 # linux version start >>>
 LINUX_VERSION = f'{liburing.LINUX_VERSION_MAJOR}.{liburing.LINUX_VERSION_MINOR}'
 
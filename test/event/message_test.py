@@ -0,0 +1,46 @@
+import os
+import re
+import queue
+import threading
+import pytest
+import shakti
+
+
+@pytest.mark.skip_linux(5.18)
+def test_message():
+    ids = queue.Queue()
+    received = []
+    thread = threading.Thread(target=shakti.run, args=(receiver(ids, received),))
+    thread.start()
+    try:
+        shakti.run(sender(ids.get(timeout=5)))
+    finally:
+        thread.join(5)
+    assert received[0] == {'hello': 'world'}
+    assert received[1] is not None
+    assert received[2] == b'bye'
+
+
+async def receiver(ids, received):
+    ids.put(await shakti.ring_id())
+    async for message in shakti.receive():
+        if isinstance(message, int):  # fd
+            assert await shakti.read(message, 3) == b'hi!'
+            await shakti.close(message)
+        received.append(message)
+        if len(received) == 3:
+            break
+
+
+async def sender(ring_id):
+    assert ring_id != await shakti.ring_id()
+    await shakti.send_to(ring_id, {'hello': 'world'})
+    r, w = os.pipe()
+    os.write(w, b'hi!')
+    os.close(w)
+    await shakti.pass_fd(ring_id, r)
+    await shakti.send_to(ring_id, b'bye')
+
+    msg = '`send_to()` - ring -1 is not running'
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        await shakti.send_to(-1, None)
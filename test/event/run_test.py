@@ -1,5 +1,7 @@
 import re
+import time
 import pytest
+import liburing
 import shakti
 
 
@@ -21,10 +23,88 @@ def test_run():
         shakti.run(not_coro())
 
 
+@pytest.mark.parametrize('mode', [None, 'latency', 'throughput', 'sqpoll'])
+def test_run_mode(mode):
+    assert shakti.run(echo(1), sleep_echo(2), echo(3), mode=mode) == [1, 3, 2]
+    assert shakti.run(*[sleep_echo(i) for i in range(100)], mode=mode, batch=8) == [*range(100)]
+
+    msg = '`run()` - `mode` must be "latency", "throughput" or "sqpoll", received \'fast\''
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        shakti.run(echo(1), mode='fast')
+
+
+def test_loop_stats():
+    assert shakti.loop_stats() is None
+    stats = shakti.run(check_stats(), kernel_sleep(), kernel_sleep(), stats=True)[-1]
+    assert shakti.loop_stats() is None  # removed after `run()`
+    assert stats['ring_id'] > -1
+    assert stats['jobs'] == {'CORO': 3, 'ENTRY': 3}
+    assert stats['cqes'] == stats['submits'] == 6
+    assert stats['syscalls'] == stats['waits']
+    assert stats['inflight_max'] == 3
+    assert sum(stats['batch'].values()) == stats['waits']
+    assert sum(stats['latency']['IORING_OP_TIMEOUT'].values()) == 3
+
+
+async def check_stats():
+    stats = shakti.loop_stats()
+    assert stats.ring_id in shakti.loop_ids()
+    assert shakti.loop_stats(stats.ring_id) is stats
+    await shakti.sleep(0.002, liburing.IORING_TIMEOUT_BOOTTIME)
+    return stats.as_dict()
+
+
+async def kernel_sleep():
+    await shakti.sleep(0.001, liburing.IORING_TIMEOUT_BOOTTIME)  # own timeout entry
+
+
+def test_profile(tmp_path, caplog):
+    with pytest.raises(ValueError, match='`path` is not set'):
+        shakti.Profiler().dump()
+    path = str(tmp_path / 'shakti.folded')
+    profiler = shakti.Profiler(0.01, 1, path)
+    assert 'done' in shakti.run(profile_task(), kernel_sleep(), profile=profiler)
+    tasks = {name: task.as_dict() for name, task in profiler.tasks.items()}
+    assert tasks['profile_task']['steps'] == 3
+    assert tasks['profile_task']['done'] == tasks['kernel_sleep']['done'] == 1
+    assert tasks['profile_task']['sqes'] == 1
+    assert tasks['kernel_sleep']['sqes'] == 1
+    assert tasks['profile_task']['max'] >= 0.01
+    assert profiler.steps == 5
+    assert len(profiler.slow) == 1
+    name, stack, second = profiler.slow[0]
+    assert name == 'profile_task' and second >= 0.01
+    assert re.fullmatch(r'profile_task \(run_test\.py:\d+\)', stack)
+    assert 'step of task' in caplog.text
+    with open(path) as file:
+        lines = file.read().splitlines()
+    assert len(lines) == len(profiler.stacks)
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+
+    # failing dump is raised after event loop is cleaned up
+    profiler = shakti.Profiler(0, 1, str(tmp_path / 'missing' / 'shakti.folded'))
+    with pytest.raises(FileNotFoundError):
+        shakti.run(kernel_sleep(), stats=True, profile=profiler)
+    assert shakti.loop_stats() is None
+    assert shakti.run(sleep_echo(1)) == [1]
+
+
+async def profile_task():
+    await kernel_sleep()
+    time.sleep(0.01)  # blocks every other coroutine
+    await shakti.sleep(0.001)
+    return 'done'
+
+
 async def echo(arg):
     return arg
 
 
+async def sleep_echo(arg):
+    await shakti.sleep(0.001)
+    return arg
+
+
 async def coro():
     return 'lost of coro'
 
@@ -1,3 +1,4 @@
+import os
 import errno
 import liburing
 import pytest
@@ -47,3 +48,30 @@ async def with_statement():
     assert sqe.result == -errno.ENOENT
     await shakti.close(fd := sqe[1].result)  # fd
     assert fd > 0
+
+
+def test_free_list():
+    shakti.run(free_list())
+    assert shakti.free_list().hit == 0  # event loop free-list is gone
+
+
+async def free_list():
+    fl = shakti.free_list()
+    assert (fl.hit, fl.miss, len(fl)) == (0, 1, 1)  # `run()` entry is freed once started
+    for _ in range(10):
+        await shakti.sleep(0)
+    assert (fl.hit, fl.miss, len(fl)) == (10, 1, 1)  # same entry reused
+    await shakti.random_bytes(3)  # `SQE()` + `SQE(2)`
+    assert (fl.hit, fl.miss, len(fl)) == (11, 2, 2)
+
+
+def test_stale_errno():
+    shakti.run(stale_errno())
+
+
+async def stale_errno():
+    with pytest.raises(FileNotFoundError):
+        os.stat('/bad-link')  # leaves `errno` set to `ENOENT`
+    with pytest.raises(NotADirectoryError):  # raised from result, not stale `errno`
+        async with shakti.SQE() as sqe:
+            liburing.io_uring_prep_openat(sqe, b'/dev/zero', liburing.O_DIRECTORY)
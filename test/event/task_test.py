@@ -1,5 +1,7 @@
+import gc
 import pytest
 import shakti
+from conftest import local_listener
 
 
 def test_task():
@@ -30,6 +32,31 @@ async def task_multi():
     assert len(r) == 2 + 4 + 6
 
 
+def test_task_in_flight():
+    shakti.run(task_in_flight())
+
+
+async def task_in_flight():
+    # task that only awaits entry is referenced by ring & survives garbage collection.
+    r = []
+    server_fd, port = await local_listener()
+    client_fd = await shakti.socket()
+    try:
+        await shakti.connect(client_fd, '127.0.0.1', port)
+        sockfd = await shakti.accept(server_fd)
+        await shakti.task(receive(r, sockfd))
+        await shakti.sleep(.001)
+        gc.collect()
+        await shakti.sendall(client_fd, b'hello')
+        while not r:
+            await shakti.sleep(.001)
+        assert r == [b'hello']
+        await shakti.close(sockfd)
+    finally:
+        await shakti.close(client_fd)
+        await shakti.close(server_fd)
+
+
 # resource start >>>
 def bad():
     pass
@@ -40,4 +67,8 @@ async def echo(r, value):
         r.append(i)
         await shakti.sleep(.002)
         r.append(i+1)
+
+
+async def receive(r, sockfd):
+    r.append(await shakti.recv(sockfd, 5))
 # resource end <<<
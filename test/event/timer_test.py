@@ -0,0 +1,67 @@
+import re
+import pytest
+import shakti
+
+
+def test_timer_wheel():
+    with shakti.Timeit(False) as t:
+        t.start
+        r = shakti.run(*[sleep_echo(i % 3 / 100, i) for i in range(1000)], stats=True)
+        assert 0.02 < t.stop < 0.05
+    assert r == [*range(0, 1000, 3), *range(1, 1000, 3), *range(2, 1000, 3)]
+
+    # cascade from higher level
+    with shakti.Timeit(False) as t:
+        t.start
+        assert shakti.run(sleep_echo(0.07, 1), sleep_echo(0.3, 2)) == [1, 2]
+        assert 0.3 < t.stop < 0.35
+
+
+def test_timer_single_timeout():
+    stats = shakti.run(many_sleep(), stats=True)[0]
+    assert stats['jobs']['TIMER'] == 1001
+    assert stats['cqes'] - stats['jobs']['CORO'] < 10  # few kernel timeouts for all
+
+
+def test_call_later():
+    fired = []
+    with shakti.Timeit(False) as t:
+        t.start
+        shakti.run(call_later_test(fired))
+        assert t.stop < 0.1  # stopped timer does not keep event loop alive
+    assert fired == ['first', 'second', 'coro']
+
+    msg = '`call_later()` - event loop is not running'
+    with pytest.raises(RuntimeError, match=re.escape(msg)):
+        shakti.call_later(1, print)
+
+
+async def sleep_echo(second, arg):
+    await shakti.sleep(second)
+    return arg
+
+
+async def many_sleep():
+    await shakti.task(*[sleep_echo(0.005, i) for i in range(1000)])
+    await shakti.sleep(0.01)
+    return shakti.loop_stats().as_dict()
+
+
+async def call_later_test(fired):
+    async def coro():
+        fired.append('coro')
+
+    timer = shakti.call_later(0.002, fired.append, 'second')
+    shakti.call_later(0.001, fired.append, 'first')
+    shakti.call_later(0.003, coro)
+    idle = shakti.call_later(3600, fired.append, 'idle')
+    assert timer and idle
+    await shakti.sleep(0.005)
+    assert not timer
+    assert not timer.stop()
+    assert idle.stop()
+    assert not idle
+
+    msg = '`call_later(second)` can not be `< 0`'
+    with pytest.raises(ValueError, match=re.escape(msg)):
+        shakti.call_later(-1, print)
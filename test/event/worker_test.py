@@ -0,0 +1,54 @@
+import os
+import time
+import signal
+import threading
+import re
+import pytest
+import shakti
+
+
+@pytest.mark.skip_linux(6.1)
+def test_run_workers(tmp_dir):
+    async def worker(index):
+        async with shakti.File(str(tmp_dir / f'worker-{index}'), 'xw') as file:
+            await file.write(str(index))
+
+    shakti.run_workers(worker, 3)
+    assert sorted(i.read_text() for i in tmp_dir.iterdir()) == ['0', '1', '2']
+
+
+def test_run_workers_error():
+    async def worker(index):
+        raise RuntimeError('crash')
+
+    msg = '`run_workers()` - worker 0 exited with 1'
+    with pytest.raises(ChildProcessError, match=re.escape(msg)):
+        shakti.run_workers(worker, 1)
+
+    with pytest.raises(TypeError):
+        shakti.run_workers(None)
+
+
+@pytest.mark.skip_linux(6.1)
+def test_run_workers_terminate(tmp_dir):
+    async def worker(index):
+        (tmp_dir / f'start-{index}').touch()
+        try:
+            await shakti.sleep(10)
+        finally:
+            (tmp_dir / f'stop-{index}').touch()
+
+    def terminate():
+        while len(list(tmp_dir.glob('start-*'))) < 2:
+            time.sleep(.01)
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    thread = threading.Thread(target=terminate)
+    thread.start()
+    start = time.monotonic()
+    try:
+        shakti.run_workers(worker, 2)
+    finally:
+        thread.join()
+    assert time.monotonic() - start < 5  # stopped, not killed after `timeout`
+    assert sorted(i.name for i in tmp_dir.glob('stop-*')) == ['stop-0', 'stop-1']
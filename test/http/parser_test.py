@@ -0,0 +1,79 @@
+import re
+import pytest
+import shakti
+
+
+def test_parser():
+    with pytest.raises(ValueError, match=re.escape('can not be `0`')):
+        shakti.HTTPParser(max_header=0)
+
+    parser = shakti.HTTPParser(max_body=16)
+    # pipelined & split at any byte
+    data = b'\r\nGET /path?q=1 HTTP/1.1\r\nHost: localhost\r\nX-Test:  a b \r\n\r\n'
+    data += b'POST /form HTTP/1.0\r\nContent-Length: 5\r\nConnection: Keep-Alive\r\n\r\nhello'
+    data += b'PUT / HTTP/1.1\r\nTransfer-Encoding: chunked\r\nConnection: close\r\n\r\n'
+    data += b'5;ext=1\r\nhello\r\n6\r\n world\r\n0\r\nTrailer: dropped\r\n\r\n'
+    requests = []
+    for i in range(len(data)):
+        requests.extend(parser.feed(data[i:i+1]))
+    assert not len(parser)
+    get, post, put = requests
+    assert (get.method, get.target, get.path, get.query, get.version) == \
+        ('GET', '/path?q=1', '/path', 'q=1', 'HTTP/1.1')
+    assert get.headers == [('host', 'localhost'), ('x-test', 'a b')]
+    assert get.header('X-TEST') == 'a b'
+    assert get.header('missing', '') == ''
+    assert get.body == b'' and get.keep_alive
+    assert (post.method, post.body, post.keep_alive) == ('POST', b'hello', True)
+    assert (put.method, put.body, put.keep_alive) == ('PUT', b'hello world', False)
+
+    # all at once
+    assert [i.body for i in shakti.HTTPParser().feed(memoryview(data))] == \
+        [b'', b'hello', b'hello world']
+
+    # next request after body
+    parser = shakti.HTTPParser()
+    assert parser.feed(b'POST / HTTP/1.1\r\nContent-Length: 30\r\n\r\n' + b'x' * 30)
+    assert parser.feed(b'GET / HTTP/1.1\r\n\r\n')[0].method == 'GET'
+
+    # expect continue
+    parser = shakti.HTTPParser()
+    assert not parser.feed(b'POST / HTTP/1.1\r\nExpect: 100-continue\r\nContent-Length: 2\r\n\r\n')
+    assert parser.expect_continue
+    assert parser.feed(b'hi')[0].body == b'hi'
+    assert not parser.expect_continue
+
+    # constructed
+    request = shakti.HTTPRequest('GET', '/', [('Connection', 'close')], version='HTTP/1.1')
+    assert request.headers == [('connection', 'close')] and not request.keep_alive
+
+
+@pytest.mark.parametrize('data, status', [
+    (b'GET /\r\n\r\n', 400),
+    (b'GET / HTTP/2.0\r\n\r\n', 505),
+    (b'GET / HTTP/1.1\r\nHost : x\r\n\r\n', 400),
+    (b'GET / HTTP/1.1\r\nHost: x\r\n folded\r\n\r\n', 400),
+    (b'GET / HTTP/1.1\r\nContent-Length: 1\r\nContent-Length: 2\r\n\r\n', 400),
+    (b'GET / HTTP/1.1\r\nContent-Length: -1\r\n\r\n', 400),
+    (b'GET / HTTP/1.1\r\nContent-Length: 17\r\n\r\n', 413),
+    (b'GET / HTTP/1.1\r\nTransfer-Encoding: gzip\r\n\r\n', 501),
+    (b'GET / HTTP/1.1\r\nTransfer-Encoding: chunked\r\nContent-Length: 1\r\n\r\n', 400),
+    (b'GET / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n', 400),
+    (b'GET / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n0x1\r\n', 400),
+    (b'GET / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n2\r\nhi!!', 400),
+    (b'GET / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n11\r\n', 413),
+    (b'GET / HTTP/1.1\r\nX: ' + b'x' * 64, 431),
+])
+def test_parser_error(data, status):
+    with pytest.raises(shakti.HTTPError) as e:
+        shakti.HTTPParser(max_header=64, max_body=16).feed(data)
+    assert e.value.status == status
+
+
+def test_parser_error_pipelined():
+    parser = shakti.HTTPParser()
+    assert [i.path for i in parser.feed(b'GET /a HTTP/1.1\r\n\r\nBAD\r\n\r\n')] == ['/a']
+    assert parser.failed
+    with pytest.raises(shakti.HTTPError) as e:
+        parser.feed(b'')
+    assert e.value.status == 400
@@ -0,0 +1,161 @@
+import pytest
+import shakti
+
+
+def test_http_server():
+    shakti.run(http_server())
+
+
+async def handler(request):
+    if request.path == '/error':
+        raise shakti.HTTPError(403, 'forbidden')
+    elif request.path == '/crash':
+        1/0
+    elif request.path == '/stream':
+        async def body():
+            yield b'hello'
+            yield b''
+            yield ' world'
+        return shakti.HTTPResponse(body())
+    elif request.path == '/broken':
+        async def body():
+            yield b'hello'
+            raise ValueError('broken body')
+        return shakti.HTTPResponse(body())
+    elif request.path == '/none':
+        return None
+    elif request.path == '/header':
+        return shakti.HTTPResponse(b'x', headers={'X-Count': 5})  # not `str`
+    elif request.path == '/empty':
+        return shakti.HTTPResponse(status=204)
+    body = b'%s %s:%s' % (request.method.encode(), request.path.encode(), request.body)
+    return shakti.HTTPResponse(body, headers={'X-Test': 'yes'})
+
+
+async def read_response(sockfd, end):
+    data = b''
+    while not data.endswith(end):
+        if not (chunk := await shakti.recv(sockfd, 4096)):
+            break
+        data += chunk
+    return data
+
+
+async def http_server():
+    with pytest.raises(TypeError, match="must be `bytes`, `str` or iterable, got 'NoneType'"):
+        shakti.HTTPResponse(None)
+    server = shakti.HTTPServer(handler, timeout=1)
+
+    async def serve():
+        await server.serve('127.0.0.1', 0)
+
+    await shakti.task(serve())
+    while not server.port:
+        await shakti.sleep(.001)
+    with pytest.raises(shakti.UnsupportedOperation):
+        await server.serve()
+
+    sockfd = await shakti.socket()
+    await shakti.connect(sockfd, '127.0.0.1', server.port)
+
+    # pipelined requests are answered in order by single send
+    await shakti.sendall(sockfd, b'GET /a HTTP/1.1\r\nHost: x\r\n\r\n'
+                                 b'POST /b HTTP/1.1\r\nContent-Length: 4\r\n\r\nbody'
+                                 b'HEAD /c HTTP/1.1\r\n\r\n')
+    assert await read_response(sockfd, b'8\r\n\r\n') == (
+        b'HTTP/1.1 200 OK\r\nX-Test: yes\r\nContent-Length: 7\r\n\r\nGET /a:'
+        b'HTTP/1.1 200 OK\r\nX-Test: yes\r\nContent-Length: 12\r\n\r\nPOST /b:body'
+        b'HTTP/1.1 200 OK\r\nX-Test: yes\r\nContent-Length: 8\r\n\r\n'
+    )
+
+    # chunked request, `100 Continue`
+    await shakti.sendall(sockfd, b'PUT /d HTTP/1.1\r\nTransfer-Encoding: chunked\r\n'
+                                 b'Expect: 100-continue\r\n\r\n')
+    assert await read_response(sockfd, b'\r\n\r\n') == b'HTTP/1.1 100 Continue\r\n\r\n'
+    await shakti.sendall(sockfd, b'3\r\nabc\r\n0\r\n\r\n')
+    assert (await read_response(sockfd, b'PUT /d:abc')).startswith(b'HTTP/1.1 200 OK')
+
+    # handler errors
+    await shakti.sendall(sockfd, b'GET /error HTTP/1.1\r\n\r\nGET /empty HTTP/1.1\r\n\r\n')
+    assert await read_response(sockfd, b'No Content\r\n\r\n') == (
+        b'HTTP/1.1 403 Forbidden\r\nContent-Type: text/plain\r\nContent-Length: 9\r\n\r\n'
+        b'forbidden'
+        b'HTTP/1.1 204 No Content\r\n\r\n'
+    )
+
+    # streamed body
+    await shakti.sendall(sockfd, b'GET /stream HTTP/1.1\r\n\r\n')
+    assert await read_response(sockfd, b'0\r\n\r\n') == (
+        b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+        b'5\r\nhello\r\n6\r\n world\r\n0\r\n\r\n'
+    )
+
+    # connection close
+    await shakti.sendall(sockfd, b'GET /f HTTP/1.1\r\nConnection: close\r\n\r\n')
+    assert (await read_response(sockfd, b'GET /f:')).endswith(b'Connection: close\r\n\r\nGET /f:')
+    assert not await shakti.recv(sockfd, 1024)
+    await shakti.close(sockfd)
+
+    # malformed request & unexpected error close connection
+    for request, status in ((b'BAD\r\n\r\n', b'400 Bad Request'),
+                            (b'GET /crash HTTP/1.1\r\n\r\n', b'500 Internal Server Error'),
+                            (b'GET /none HTTP/1.1\r\n\r\n', b'500 Internal Server Error'),
+                            (b'GET /header HTTP/1.1\r\n\r\n', b'500 Internal Server Error')):
+        sockfd = await shakti.socket()
+        await shakti.connect(sockfd, '127.0.0.1', server.port)
+        await shakti.sendall(sockfd, request)
+        assert (await read_response(sockfd, b'error')).startswith(b'HTTP/1.1 ' + status)
+        assert not await shakti.recv(sockfd, 1024)
+        await shakti.close(sockfd)
+
+    # malformed request behind valid one, valid one is still answered
+    sockfd = await shakti.socket()
+    await shakti.connect(sockfd, '127.0.0.1', server.port)
+    await shakti.sendall(sockfd, b'GET /a HTTP/1.1\r\n\r\nBAD\r\n\r\n')
+    data = b''
+    while chunk := await shakti.recv(sockfd, 1024):
+        data += chunk
+    assert data.startswith(b'HTTP/1.1 200 OK\r\nX-Test: yes\r\nContent-Length: 7\r\n\r\nGET /a:'
+                           b'HTTP/1.1 400 Bad Request')
+    await shakti.close(sockfd)
+
+    # error while streaming closes only its connection, next one is still answered
+    sockfd = await shakti.socket()
+    await shakti.connect(sockfd, '127.0.0.1', server.port)
+    await shakti.sendall(sockfd, b'GET /broken HTTP/1.1\r\n\r\nGET /h HTTP/1.1\r\n\r\n')
+    data = b''
+    while chunk := await shakti.recv(sockfd, 1024):
+        data += chunk
+    assert data.startswith(b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n')
+    assert b'GET /h' not in data
+    await shakti.close(sockfd)
+    sockfd = await shakti.socket()
+    await shakti.connect(sockfd, '127.0.0.1', server.port)
+    await shakti.sendall(sockfd, b'GET /h HTTP/1.1\r\n\r\n')
+    assert (await read_response(sockfd, b'GET /h:')).startswith(b'HTTP/1.1 200 OK')
+    await shakti.close(sockfd)
+
+    # HTTP/1.0 keep-alive & streamed body
+    sockfd = await shakti.socket()
+    await shakti.connect(sockfd, '127.0.0.1', server.port)
+    await shakti.sendall(sockfd, b'GET /g HTTP/1.0\r\nConnection: keep-alive\r\n\r\n')
+    assert (await read_response(sockfd, b'GET /g:')).endswith(
+        b'Connection: keep-alive\r\n\r\nGET /g:'
+    )
+    await shakti.sendall(sockfd, b'GET /stream HTTP/1.0\r\nConnection: keep-alive\r\n\r\n')
+    assert await shakti.recv(sockfd, 1024) == b'HTTP/1.1 200 OK\r\nConnection: close\r\n\r\n'
+    data = b''
+    while chunk := await shakti.recv(sockfd, 1024):
+        data += chunk
+    assert data == b'hello world'
+    await shakti.close(sockfd)
+
+    # idle connection is closed by `close()`
+    sockfd = await shakti.socket()
+    await shakti.connect(sockfd, '127.0.0.1', server.port)
+    await shakti.sleep(.01)
+    await server.close()
+    assert not await shakti.recv(sockfd, 1024, timeout=.5)
+    await shakti.close(sockfd)
+    while server.fileno > -1:
+        await shakti.sleep(.001)
@@ -0,0 +1,136 @@
+import re
+import socket as _socket
+import pytest
+import shakti
+
+
+def test_buffer_ring():
+    with pytest.raises(ValueError, match=re.escape('must be power of 2')):
+        shakti.BufferRing(3)
+    with pytest.raises(ValueError, match=re.escape('can not be `0`')):
+        shakti.BufferRing(4, 0)
+    with pytest.raises(TypeError):
+        shakti.BufferLease()
+
+
+@pytest.mark.skip_linux(6.11)
+def test_recv_many():
+    random_port = []
+    shakti.run(
+        recv_many_server(random_port),
+        recv_many_client(random_port),
+    )
+
+
+async def recv_many_server(random_port):
+    server_fd = await shakti.socket()
+    try:
+        addr = await shakti.bind(server_fd, '127.0.0.1', 0)
+        await shakti.listen(server_fd, 1)
+        random_port.append((await shakti.getsockname(server_fd, addr))[1])
+        client_fd = await shakti.accept(server_fd)
+        received = bytearray()
+        async with shakti.BufferRing(4, 8) as br:
+            assert br.available == 4
+            async for lease in shakti.recv_many(client_fd, br):
+                assert 0 < len(lease) <= 8
+                view = memoryview(lease)
+                with pytest.raises(BufferError):
+                    lease.release()  # still in use by `memoryview`
+                received.extend(view)
+                view.release()
+                lease.release()
+                assert not lease
+            assert br.available == 4  # all buffers returned
+        assert not br
+        assert received == b'hello world, from recv_many!'
+        await shakti.close(client_fd)
+    finally:
+        await shakti.close(server_fd)
+
+
+async def recv_many_client(random_port):
+    await shakti.sleep(.001)  # wait for `recv_many_server` to start up.
+    client_fd = await shakti.socket()
+    await shakti.connect(client_fd, '127.0.0.1', random_port[0])
+    await shakti.sendall(client_fd, b'hello world, ')
+    await shakti.sleep(.001)
+    await shakti.sendall(client_fd, b'from recv_many!')
+    await shakti.close(client_fd)  # ends `recv_many` iteration
+
+
+@pytest.mark.skip_linux(6.11)
+def test_recv_many_unread():
+    shakti.run(recv_many_unread())
+
+
+async def recv_many_unread():
+    sock, peer = _socket.socketpair(_socket.AF_UNIX, _socket.SOCK_DGRAM)
+    try:
+        async with shakti.BufferRing(4, 8) as br:
+            for data in (b'one', b'two', b'three'):
+                peer.send(data)
+            receiving = shakti.recv_many(sock.fileno(), br)
+            with await receiving.__anext__() as lease:
+                assert bytes(lease) == b'one'
+            await receiving.aclose()  # rest is unread
+            assert br.available == 4
+            # note: received by still armed entry, before ring has seen its cancel.
+            peer.send(b'late')
+            await shakti.sleep(.01)
+            assert br.available == 4
+            peer.send(b'again')
+            receiving = shakti.recv_many(sock.fileno(), br)
+            with await receiving.__anext__() as lease:
+                assert bytes(lease) == b'again'
+            await receiving.aclose()
+            assert br.available == 4
+    finally:
+        sock.close()
+        peer.close()
+
+
+def test_buffer_pool(tmp_dir):
+    with pytest.raises(ValueError, match=re.escape('must be `> 0` and `<= 16384`')):
+        shakti.BufferPool(0)
+    with pytest.raises(ValueError, match=re.escape('must be `> 0` and `<= 1 GiB`')):
+        shakti.BufferPool(1, 0)
+    shakti.run(buffer_pool(tmp_dir))
+
+
+async def buffer_pool(tmp_dir):
+    path = str(tmp_dir / 'pool.txt')
+    async with shakti.BufferPool(2, 8) as pool:
+        assert pool.available == 2
+        lease = pool.acquire()
+        assert len(lease) == 8
+        memoryview(lease)[:5] = b'hello'
+        lease.resize(5)
+        with pytest.raises(ValueError, match=re.escape('can not be `> 8`')):
+            lease.resize(9)
+
+        fd = await shakti.open(path, shakti.O_CREAT | shakti.O_RDWR)
+        assert await shakti.write(fd, lease) == 5  # `WRITE_FIXED`
+        assert await shakti.write(fd, b' world', 5) == 6
+        lease.release()
+        assert pool.available == 2
+
+        with await shakti.read(fd, 100, pool=pool) as lease:  # `READ_FIXED`
+            assert bytes(lease) == b'hello wo'  # at most `pool.size`
+            assert pool.available == 1
+            second = await shakti.read(fd, 3, 8, pool=pool)
+            assert bytes(second) == b'rld'
+            with pytest.raises(OSError, match='all buffers are leased'):
+                await shakti.read(fd, 1, pool=pool)
+            second.release()
+        assert pool.available == 2
+        await shakti.close(fd)
+
+        async with shakti.File(path) as file:
+            with await file.read(pool=pool) as lease:
+                assert bytes(lease) == b'hello wo'
+            with await file.read(pool=pool) as lease:
+                assert bytes(lease) == b'rld'
+    assert not pool
+    with pytest.raises(ValueError, match='is not registered'):
+        pool.acquire()
@@ -14,6 +14,8 @@ def test_file(tmp_dir):
         temp_file(tmp_dir),
         resolve(tmp_dir),
         write_read(tmp_dir),
+        iter_chunks(tmp_dir),
+        readinto_vectored(tmp_dir),
         # File END <<<
     )
 
@@ -134,4 +136,73 @@ async def write_read(tmp_dir):
 
     # stats eheck
     assert (await shakti.Statx(path)).stx_size == 11
+
+
+async def iter_chunks(tmp_dir):
+    path = os.path.join(tmp_dir, 'test-iter-chunks.txt')
+    data = os.urandom(100_000)
+    async with shakti.File(path, 'xb+') as file:
+        assert await file.write(data) == 100_000
+        file_chunks = [chunk async for chunk in file.iter_chunks(4096, 3, 0)]
+        assert len(file_chunks) == 25
+        assert all(len(chunk) == 4096 for chunk in file_chunks[:-1])
+        assert b''.join(file_chunks) == data
+        assert await file.read() == b''  # seek position is at the end
+
+        # start from seek position & leave early
+        assert await file.read(10, 0) == data[:10]
+        async for chunk in file.iter_chunks(8, readahead=16):
+            assert chunk == data[10:18]
+            break
+        assert await file.read(2) == data[18:20]
+
+        with pytest.raises(ValueError, match='can not be `0`'):
+            async for chunk in file.iter_chunks(0):
+                pass
+
+        # truncated while reading, last chunk only has what is left
+        file_chunks = []
+        async for chunk in file.iter_chunks(65536, 1, 0):
+            if not file_chunks:
+                os.truncate(path, 80_000)
+            file_chunks.append(chunk)
+        assert [len(chunk) for chunk in file_chunks] == [65536, 14464]
+        assert b''.join(file_chunks) == data[:80_000]
+
+    # multi-byte character split between chunks
+    async with shakti.File(path, 'w') as file:
+        await file.write('ab€' * 1000)
+    async with shakti.File(path) as file:
+        assert ''.join([chunk async for chunk in file.iter_chunks(7)]) == 'ab€' * 1000
+
+
+async def readinto_vectored(tmp_dir):
+    path = os.path.join(tmp_dir, 'test-readinto.txt')
+    fd = await shakti.open(path, shakti.O_CREAT | shakti.O_RDWR)
+    assert await shakti.writev(fd, [b'hello', bytearray(b' '), memoryview(b'world')]) == 11
+    assert await shakti.writev(fd, []) == 0
+
+    buffer = bytearray(16)
+    assert await shakti.readinto(fd, buffer) == 11
+    assert buffer[:11] == b'hello world'
+    assert await shakti.readinto(fd, memoryview(buffer)[:5], 6) == 5
+    assert buffer[:5] == b'world'
+    with pytest.raises(BufferError):
+        await shakti.readinto(fd, b'read-only')
+    with pytest.raises(BufferError, match='contiguous'):
+        await shakti.readinto(fd, memoryview(buffer)[4:12:2])
+
+    head, tail = bytearray(6), bytearray(10)
+    assert await shakti.readv(fd, [head, tail]) == 11
+    assert head == b'hello ' and tail[:5] == b'world'
+    with pytest.raises(BufferError):
+        await shakti.readv(fd, [head, b'read-only'])
+    with pytest.raises(BufferError, match='contiguous'):
+        await shakti.readv(fd, [head, memoryview(tail)[::-1]])
+    await shakti.close(fd)
+
+    async with shakti.File(path, 'rb') as file:
+        assert await file.readinto(head) == 6
+        assert await file.readinto(head) == 5
+        assert head[:5] == b'world'
 # File END <<<
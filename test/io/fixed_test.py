@@ -0,0 +1,61 @@
+import re
+import pytest
+import shakti
+
+
+def test_file_table(tmp_dir):
+    with pytest.raises(ValueError, match=re.escape('can not be `0`')):
+        shakti.FileTable(0)
+    shakti.run(file_table_file(tmp_dir))
+
+
+async def file_table_file(tmp_dir):
+    path = str(tmp_dir / 'direct.txt')
+    with pytest.raises(OSError, match='register file not enabled'):
+        await shakti.open_direct(path, shakti.O_CREAT | shakti.O_WRONLY)
+
+    async with shakti.FileTable(4) as table:
+        assert table.count == 4
+        index = await shakti.open_direct(path, shakti.O_CREAT | shakti.O_WRONLY)
+        assert 0 <= index < 4
+        assert await shakti.write(index, b'hello world', direct=True) == 11
+        await shakti.close(index, True)
+
+        async with shakti.File(path, direct=True) as file:
+            assert 0 <= file.fileno < 4
+            assert await file.read(5) == 'hello'
+            assert await file.read() == ' world'
+
+        index = await shakti.open_direct(path)
+        assert await shakti.read(index, 5, 6, direct=True) == b'world'
+        await shakti.close(index, True)
+    assert not table
+
+
+@pytest.mark.skip_linux(6.11)
+def test_file_table_socket():
+    random_port = []
+    shakti.run(direct_server(random_port), direct_client(random_port))
+
+
+async def direct_server(random_port):
+    async with shakti.FileTable(8):
+        server_fd = await shakti.socket()  # normal listener
+        addr = await shakti.bind(server_fd, '127.0.0.1', 0)
+        await shakti.listen(server_fd, 1)
+        random_port.append((await shakti.getsockname(server_fd, addr))[1])
+        index = await shakti.accept_direct(server_fd)
+        assert await shakti.recv(index, 5, direct=True) == b'hello'
+        await shakti.sendall(index, b'world', direct=True)
+        await shakti.close(index, True)
+        await shakti.close(server_fd)
+
+
+async def direct_client(random_port):
+    await shakti.sleep(.001)  # wait for `direct_server` to start up.
+    index = await shakti.socket(direct=True)
+    await shakti.connect(index, '127.0.0.1', random_port[0], direct=True)
+    assert await shakti.send(index, b'hello', direct=True) == 5
+    assert await shakti.recv(index, 5, direct=True) == b'world'
+    await shakti.shutdown(index, direct=True)
+    await shakti.close(index, True)
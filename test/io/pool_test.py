@@ -0,0 +1,105 @@
+import re
+import pytest
+import shakti
+from conftest import local_listener
+
+
+def test_pool():
+    with pytest.raises(ValueError, match=re.escape('can not be `0`')):
+        shakti.ConnectionPool(0)
+    shakti.run(pool())
+
+
+async def pool():
+    server_fd, port = await local_listener()
+    pool = shakti.ConnectionPool(2, timeout=.05)
+    try:
+        # reuse
+        fd = await pool.acquire('127.0.0.1', port)
+        conn_fd = await shakti.accept(server_fd)
+        await pool.release(fd)
+        assert len(pool) == 1
+        assert await pool.acquire('127.0.0.1', port) == fd
+        assert not len(pool)
+        with pytest.raises(ValueError, match='was not acquired'):
+            await pool.release(fd + 100)
+
+        # exhausted, wait is bounded
+        fd2 = await pool.acquire('127.0.0.1', port)
+        assert fd2 != fd
+        with pytest.raises(TimeoutError):
+            await pool.acquire('127.0.0.1', port)
+
+        # waiter gets released socket
+        result = []
+
+        async def waiter():
+            result.append(await pool.acquire('127.0.0.1', port))
+
+        await shakti.task(waiter())
+        await shakti.sleep(.01)
+        await pool.release(fd2)
+        while not result:
+            await shakti.sleep(.001)
+        assert result == [fd2]
+
+        # waiter gets slot of closed connection
+        result.clear()
+        await shakti.task(waiter())
+        await shakti.sleep(.01)
+        await pool.release(fd2, False)
+        while not result:
+            await shakti.sleep(.001)
+        await pool.release(result[0])
+
+        # peer closed idle connection, health check drops it
+        await pool.release(fd)
+        await shakti.close(conn_fd)
+        await shakti.sleep(.01)
+        assert len(pool) == 2
+        assert await pool.check(fd) is False
+        new_fd = await pool.acquire('127.0.0.1', port)
+        assert await pool.check(new_fd)  # other idle socket
+        await pool.release(new_fd)
+        assert len(pool) == 1
+
+        # context manager, error closes connection
+        async with pool.connection('127.0.0.1', port) as sockfd:
+            assert sockfd == new_fd
+        assert len(pool) == 1
+        with pytest.raises(ZeroDivisionError):
+            async with pool.connection('127.0.0.1', port) as sockfd:
+                1/0
+        assert not len(pool)
+
+        await pool.close()
+        assert pool.closed
+        with pytest.raises(shakti.UnsupportedOperation, match='is closed'):
+            await pool.acquire('127.0.0.1', port)
+    finally:
+        await shakti.close(server_fd)
+
+
+def test_pool_idle_timeout():
+    shakti.run(pool_idle_timeout())
+
+
+async def pool_idle_timeout():
+    server_fd, port = await local_listener()
+    pool = shakti.ConnectionPool(idle_timeout=.01)
+    try:
+        fd = await pool.acquire('127.0.0.1', port)
+        await pool.release(fd)
+        await shakti.sleep(.02)
+        await pool.prune()
+        assert not len(pool)
+        fd = await pool.acquire('127.0.0.1', port)
+        await pool.release(fd)
+        await shakti.sleep(.02)
+        fd = await pool.acquire('127.0.0.1', port)  # expired one is closed first
+        assert not len(pool)
+        await pool.release(fd)
+        await pool.close()
+        assert not len(pool)
+    finally:
+        await shakti.close(server_fd)
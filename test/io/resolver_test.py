@@ -0,0 +1,139 @@
+import time
+import socket
+import struct
+import pytest
+import threading
+import shakti
+from conftest import local_listener
+
+
+class DNSServer:
+    ''' Loopback stand-in DNS server, answers `A` for `example.test` & `NXDOMAIN` for rest. '''
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.queries = []
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self):
+        while True:
+            try:
+                data, addr = self.sock.recvfrom(512)
+            except OSError:
+                return
+            i = 12
+            labels = []
+            while data[i]:
+                labels.append(data[i+1:i+1+data[i]].decode())
+                i += data[i] + 1
+            name = '.'.join(labels)
+            qtype = struct.unpack('!H', data[i+1:i+3])[0]
+            self.queries.append((name, qtype))
+            question = data[12:i+5]
+            soa = b'\xc0\x0c' + struct.pack('!HHIH', 6, 1, 600, 22) + b'\x00\x00'
+            soa += struct.pack('!IIIII', 1, 2, 3, 4, 5)  # minimum TTL `5`
+            if name == 'example.test':
+                if qtype == 1:
+                    answer = b'\xc0\x0c' + struct.pack('!HHIH', 1, 1, 60, 4) + bytes([10, 1, 2, 3])
+                    header = struct.pack('!HHHHHH', 0, 0x8180, 1, 1, 0, 0)
+                    body = question + answer
+                else:  # no AAAA record
+                    header = struct.pack('!HHHHHH', 0, 0x8180, 1, 0, 1, 0)
+                    body = question + soa
+            else:
+                header = struct.pack('!HHHHHH', 0, 0x8183, 1, 0, 1, 0)  # NXDOMAIN
+                body = question + soa
+            time.sleep(self.delay)
+            try:
+                self.sock.sendto(data[:2] + header[2:] + body, addr)
+            except OSError:  # closed while sleeping
+                return
+
+    def close(self):
+        self.sock.close()
+
+
+def test_resolver(tmp_dir):
+    hosts = tmp_dir / 'hosts'
+    hosts.write_text('# comment\n127.0.0.1 localhost local.test\n::1 localhost # v6\n')
+    server = DNSServer()
+    try:
+        shakti.run(resolver(server, str(hosts)))
+    finally:
+        server.close()
+
+
+async def resolver(server, hosts):
+    resolver = shakti.Resolver([('127.0.0.1', server.port)], hosts=hosts, timeout=1)
+    assert await resolver.resolve('localhost') == [(shakti.AF_INET, '127.0.0.1'),
+                                                   (shakti.AF_INET6, '::1')]
+    assert await resolver.resolve('Local.Test.', shakti.AF_INET) == [(shakti.AF_INET, '127.0.0.1')]
+    assert not server.queries  # hosts file
+
+    # concurrent lookups share single query
+    results = []
+
+    async def lookup():
+        results.append(await resolver.resolve('example.test', shakti.AF_INET))
+
+    await shakti.task(lookup(), lookup())
+    await lookup()
+    while len(results) < 3:
+        await shakti.sleep(.01)
+    assert results == [[(shakti.AF_INET, '10.1.2.3')]] * 3
+    assert server.queries == [('example.test', 1)]
+    assert 59 < resolver.cache[('example.test', shakti.AF_INET)][0] - time.monotonic() <= 60
+
+    # both families, no `AAAA` record
+    assert await resolver.resolve('example.test') == [(shakti.AF_INET, '10.1.2.3')]
+    assert sorted(server.queries[1:]) == [('example.test', 1), ('example.test', 28)]
+
+    # negative cache
+    with pytest.raises(socket.gaierror):
+        await resolver.resolve('missing.test')
+    with pytest.raises(socket.gaierror):
+        await resolver.resolve('missing.test')
+    assert len(server.queries) == 5  # `AAAA` & `A`, second lookup is cached
+    assert resolver.cache[('missing.test', 0)][0] - time.monotonic() <= 5
+
+    resolver.clear()
+    assert not resolver.cache
+
+    # `connect` uses default resolver
+    server_fd, port = await local_listener()
+    try:
+        sockfd = await shakti.socket()
+        await shakti.connect(sockfd, 'localhost', port)  # `/etc/hosts`
+        assert await shakti.resolve('localhost', shakti.AF_INET) == [(shakti.AF_INET, '127.0.0.1')]
+        await shakti.close(sockfd)
+    finally:
+        await shakti.close(server_fd)
+
+
+def test_resolver_timeout():
+    server = DNSServer(delay=0.2)
+    try:
+        shakti.run(resolver_timeout(server))
+    finally:
+        server.close()
+
+
+async def resolver_timeout(server):
+    resolver = shakti.Resolver([('127.0.0.1', server.port)], timeout=.05, attempts=2)
+    with pytest.raises(TimeoutError):
+        await resolver.resolve('example.test')
+    assert not resolver.cache
+
+
+def test_resolver_no_nameserver():
+    shakti.run(resolver_no_nameserver())
+
+
+async def resolver_no_nameserver():
+    resolver = shakti.Resolver([], hosts='/dev/null')
+    with pytest.raises(socket.gaierror):
+        await resolver.resolve('nothing.test')
@@ -1,5 +1,11 @@
+import re
+import time
+import errno
+import socket as _socket
 import pytest
+import liburing
 import shakti
+from conftest import local_listener
 
 
 @pytest.mark.skip_linux(6.11)
@@ -14,6 +20,20 @@ def test_socket():
     )
 
 
+@pytest.mark.skip_linux(6.11)
+def test_accept_many():
+    random_port = []
+    shakti.run(
+        accept_many_server(random_port, 3),
+        accept_many_clients(random_port, 3),
+    )
+
+
+@pytest.mark.skip_linux(6.11)
+def test_accept_many_late():
+    shakti.run(accept_many_late())
+
+
 @pytest.mark.skip_linux(6.7)
 def test_sockname():
     shakti.run(set_get_sockname())
@@ -96,6 +116,56 @@ async def echo_client(random_port):
         await shakti.close(client_fd)
 
 
+async def accept_many_server(random_port, count):
+    server_fd = await shakti.socket()
+    try:
+        addr = await shakti.bind(server_fd, '127.0.0.1', 0)
+        await shakti.listen(server_fd, count)
+        random_port.append((await shakti.getsockname(server_fd, addr))[1])
+        accepted = 0
+        async for client_fd in shakti.accept_many(server_fd):
+            assert client_fd > 0
+            assert await shakti.recv(client_fd, 1024) == b'hi'
+            await shakti.close(client_fd)
+            if (accepted := accepted + 1) == count:
+                break  # note: cancels armed multishot, else `run()` would never finish.
+    finally:
+        await shakti.close(server_fd)
+
+
+async def accept_many_clients(random_port, count):
+    await shakti.sleep(.001)  # wait for `accept_many_server` to start up.
+    clients = []
+    for _ in range(count):  # all connect before any is handled
+        client_fd = await shakti.socket()
+        await shakti.connect(client_fd, '127.0.0.1', random_port[0])
+        clients.append(client_fd)
+    for client_fd in clients:
+        assert await shakti.send(client_fd, b'hi') == 2
+        await shakti.close(client_fd)
+
+
+async def accept_many_late():
+    server_fd = await shakti.socket()
+    try:
+        addr = await shakti.bind(server_fd, '127.0.0.1', 0)
+        await shakti.listen(server_fd, 4)
+        port = (await shakti.getsockname(server_fd, addr))[1]
+        clients = [_socket.create_connection(('127.0.0.1', port))]
+        accepting = shakti.accept_many(server_fd)
+        await shakti.close(await accepting.__anext__())
+        await accepting.aclose()
+        # note: accepted by still armed entry, before ring has seen its cancel.
+        clients += [_socket.create_connection(('127.0.0.1', port)) for _ in range(2)]
+        await shakti.sleep(.01)
+        for client in clients:
+            client.settimeout(1)
+            assert client.recv(1) == b''  # closed by server
+            client.close()
+    finally:
+        await shakti.close(server_fd)
+
+
 async def set_get_sockname():
     assert (socket_fd := await shakti.socket()) > 0
     try:
@@ -106,3 +176,278 @@ async def set_get_sockname():
         assert await shakti.getsockopt(socket_fd, shakti.SOL_SOCKET, shakti.SO_REUSEADDR) == 0
     finally:
         await shakti.close(socket_fd)
+
+
+@pytest.mark.skip_linux(6.11)
+def test_listener():
+    shakti.run(listener())
+
+
+async def listener():
+    first_fd, port = await local_listener()
+    try:
+        second_fd = await shakti.listener('127.0.0.1', port)  # `SO_REUSEPORT`
+        await shakti.close(second_fd)
+        with pytest.raises(OSError):  # address already in use
+            await shakti.listener('127.0.0.1', port, reuse_port=False)
+    finally:
+        await shakti.close(first_fd)
+
+
+@pytest.mark.skip_linux(6.11)
+def test_timeout():
+    shakti.run(timeout())
+
+
+async def timeout():
+    server_fd, port = await local_listener()
+    try:
+        with pytest.raises(TimeoutError):
+            await shakti.accept(server_fd, timeout=0.001)  # no client
+        client_fd = await shakti.socket()
+        await shakti.connect(client_fd, '127.0.0.1', port, timeout=1)
+        conn_fd = await shakti.accept(server_fd, timeout=1)
+        with pytest.raises(TimeoutError):
+            await shakti.recv(conn_fd, 10, timeout=0.001)  # nothing sent
+        await shakti.send(client_fd, b'hi', timeout=1)
+        assert await shakti.recv(conn_fd, 10, timeout=1) == b'hi'
+
+        buffer = bytearray(10)
+        sqe = shakti.SQE(error=False)
+        liburing.io_uring_prep_recv(sqe, conn_fd, buffer, 10)
+        assert await shakti.with_deadline(sqe, 0.001) == -errno.ETIMEDOUT
+        await shakti.send(client_fd, b'bye')
+        assert await shakti.with_deadline(sqe, 1) == 3
+        assert buffer[:3] == b'bye'
+        await shakti.close(conn_fd)
+        await shakti.close(client_fd)
+    finally:
+        await shakti.close(server_fd)
+
+
+@pytest.mark.skip_linux(6.11)
+def test_recv_into_sendmsg():
+    shakti.run(recv_into_sendmsg())
+
+
+async def recv_into_sendmsg():
+    server_fd, port = await local_listener()
+    try:
+        client_fd = await shakti.socket()
+        await shakti.connect(client_fd, '127.0.0.1', port)
+        conn_fd = await shakti.accept(server_fd)
+        assert await shakti.sendmsg(client_fd, [b'header:', bytearray(b'body')]) == 11
+        assert await shakti.sendmsg(client_fd, []) == 0
+
+        buffer = bytearray(16)
+        assert await shakti.recv_into(conn_fd, buffer, 7) == 7
+        assert await shakti.recv_into(conn_fd, memoryview(buffer)[7:]) == 4
+        assert buffer[:11] == b'header:body'
+        with pytest.raises(BufferError):
+            await shakti.recv_into(conn_fd, b'read-only')
+        with pytest.raises(BufferError, match='contiguous'):
+            await shakti.recv_into(conn_fd, memoryview(buffer)[::2])
+        await shakti.close(conn_fd)
+        await shakti.close(client_fd)
+    finally:
+        await shakti.close(server_fd)
+
+
+@pytest.mark.skip_linux(6.11)
+def test_datagram():
+    shakti.run(datagram())
+
+
+async def datagram():
+    server_fd = await shakti.socket(shakti.AF_INET, shakti.SOCK_DGRAM)
+    client_fd = await shakti.socket(shakti.AF_INET, shakti.SOCK_DGRAM)
+    try:
+        addr = await shakti.bind(server_fd, '127.0.0.1', 0)
+        port = (await shakti.getsockname(server_fd, addr))[1]
+        client_addr = await shakti.bind(client_fd, '127.0.0.1', 0)
+        client_port = (await shakti.getsockname(client_fd, client_addr))[1]
+        addr = liburing.sockaddr(shakti.AF_INET, b'127.0.0.1', port)
+
+        assert await shakti.sendto(client_fd, b'hello', addr) == 5
+        assert await shakti.sendmsg(client_fd, [b'hello ', b'world'], addr=addr) == 11
+        assert await shakti.recvfrom(server_fd, 1024) == (b'hello', ('127.0.0.1', client_port))
+        assert await shakti.recvfrom(server_fd, 5) == (b'hello', ('127.0.0.1', client_port))
+
+        # batched
+        async with shakti.BufferRing(4, 44) as br:
+            with pytest.raises(ValueError, match=re.escape('size must be `> 44`')):
+                async for batch in shakti.recvmsg_many(server_fd, br):
+                    pass
+        async with shakti.BufferRing(4, 64) as br:
+            for i in range(10):
+                await shakti.sendto(client_fd, b'%d' % i, addr)
+            received = []
+            async for batch in shakti.recvmsg_many(server_fd, br):
+                assert all(i[1] == ('127.0.0.1', client_port) for i in batch)
+                received.extend(i[0] for i in batch)
+                if len(received) == 10:
+                    break
+            assert received == [b'%d' % i for i in range(10)]
+            assert br.available == 4  # all buffers returned
+    finally:
+        await shakti.close(client_fd)
+        await shakti.close(server_fd)
+
+
+@pytest.mark.skip_linux(6.11)
+def test_datagram_unnamed():
+    shakti.run(datagram_unnamed())
+
+
+async def datagram_unnamed():
+    sock, peer = _socket.socketpair(_socket.AF_UNIX, _socket.SOCK_DGRAM)
+    try:
+        peer.send(b'hello')
+        assert await shakti.recvfrom(sock.fileno(), 1024) == (b'hello', None)  # no address
+
+        async with shakti.BufferRing(2, 64) as br:
+            peer.send(b'one')
+            receiving = shakti.recvmsg_many(sock.fileno(), br)
+            assert await receiving.__anext__() == [(b'one', None)]
+            await receiving.aclose()
+            # note: received by still armed entry, before ring has seen its cancel.
+            peer.send(b'late')
+            await shakti.sleep(.01)
+            assert br.available == 2
+            peer.send(b'again')
+            receiving = shakti.recvmsg_many(sock.fileno(), br)
+            assert await receiving.__anext__() == [(b'again', None)]
+            await receiving.aclose()
+            assert br.available == 2
+    finally:
+        sock.close()
+        peer.close()
+
+
+@pytest.mark.skip_linux(6.11)
+def test_sendfile(tmp_dir):
+    shakti.run(sendfile(tmp_dir))
+
+
+async def sendfile(tmp_dir):
+    data = bytes(range(256)) * 384  # 96 KiB, bigger than pipe
+    path = tmp_dir / 'sendfile.bin'
+    path.write_bytes(data)
+
+    server_fd, port = await local_listener()
+    try:
+        client_fd = await shakti.socket()
+        await shakti.connect(client_fd, '127.0.0.1', port)
+        conn_fd = await shakti.accept(server_fd)
+
+        async with shakti.File(str(path), 'rb') as file:
+            assert await shakti.sendfile(conn_fd, file) == len(data)
+            assert await recv_exactly(client_fd, len(data)) == data
+            assert await file.read(3) == data[:3]  # position is not changed
+
+            # offset & count, past end of file
+            assert await shakti.sendfile(conn_fd, file.fileno, 100, 70000) == 70000
+            assert await recv_exactly(client_fd, 70000) == data[100:70100]
+            assert await shakti.sendfile(conn_fd, file, len(data) - 5, 10) == 5
+            assert await recv_exactly(client_fd, 5) == data[-5:]
+            assert await shakti.sendfile(conn_fd, file, len(data)) == 0
+        await shakti.close(conn_fd)
+        await shakti.close(client_fd)
+    finally:
+        await shakti.close(server_fd)
+
+
+async def recv_exactly(sockfd, length):
+    data = b''
+    while len(data) < length:
+        data += await shakti.recv(sockfd, length - len(data))
+    return data
+
+
+@pytest.mark.skip_linux(6.11)
+def test_send_zerocopy():
+    shakti.run(send_zerocopy())
+
+
+async def send_zerocopy():
+    server_fd, port = await local_listener()
+    try:
+        client_fd = await shakti.socket()
+        await shakti.connect(client_fd, '127.0.0.1', port)
+        conn_fd = await shakti.accept(server_fd)
+
+        data = bytearray(range(256)) * 256  # 64 KiB
+        assert await shakti.send(conn_fd, data, zerocopy=True) == len(data)
+        data[:4] = b'next'  # buffer is released once `send` returns
+        assert await recv_exactly(client_fd, len(data)) == bytes(range(256)) * 256
+
+        assert await shakti.send(conn_fd, b'small', zerocopy=True) == 5  # copying path
+        assert await recv_exactly(client_fd, 5) == b'small'
+
+        await shakti.sendall(conn_fd, memoryview(data)[:50000], zerocopy=True)
+        assert await recv_exactly(client_fd, 50000) == data[:50000]
+        await shakti.close(conn_fd)
+        await shakti.close(client_fd)
+    finally:
+        await shakti.close(server_fd)
+
+
+def test_create_connection(tmp_dir):
+    hosts = tmp_dir / 'hosts'
+    hosts.write_text('127.0.0.2 eyeballs.test\n127.0.0.1 eyeballs.test\n127.0.0.2 hole.test\n'
+                     '127.0.0.3 slow.test\n127.0.0.2 slow.test\n')
+    shakti.run(create_connection(str(hosts)))
+
+
+async def create_connection(hosts):
+    resolver = shakti.Resolver([], hosts=hosts)
+    server_fd, port = await local_listener()
+    # note: once backlog is full, `SYN` is dropped & connect hangs like blackholed address.
+    hole = _socket.socket()
+    hole.bind(('127.0.0.2', port))
+    hole.listen(0)
+    filler = _socket.create_connection(('127.0.0.2', port))
+    try:
+        # first address hangs, second one is tried after `delay`
+        start = time.monotonic()
+        sockfd = await shakti.create_connection('eyeballs.test', port, delay=.05,
+                                                resolver=resolver)
+        assert .05 <= time.monotonic() - start < 1
+        conn_fd = await shakti.accept(server_fd)
+        await shakti.sendall(sockfd, b'hi')
+        assert await shakti.recv(conn_fd, 2) == b'hi'
+        await shakti.close(conn_fd)
+        await shakti.close(sockfd)
+
+        sockfd = await shakti.create_connection('127.0.0.1', port)
+        await shakti.close(sockfd)
+
+        with pytest.raises(TimeoutError):
+            await shakti.create_connection('hole.test', port, timeout=.05, resolver=resolver)
+
+        # first address wins, while second one is still trying
+        slow = _socket.socket()
+        slow.bind(('127.0.0.3', port))
+        slow.listen(0)
+        slow_filler = _socket.create_connection(('127.0.0.3', port))
+        try:
+            await shakti.task(accept_later(slow, .1))  # note: retried `SYN` gets through.
+            sockfd = await shakti.create_connection('slow.test', port, delay=.05,
+                                                    resolver=resolver)
+            conn, _ = slow.accept()
+            await shakti.sendall(sockfd, b'hi')
+            assert conn.recv(2) == b'hi'
+            conn.close()
+            await shakti.close(sockfd)
+        finally:
+            slow_filler.close()
+            slow.close()
+    finally:
+        filler.close()
+        hole.close()
+        await shakti.close(server_fd)
+
+
+async def accept_later(sock, second):
+    await shakti.sleep(second)
+    sock.accept()[0].close()
@@ -0,0 +1,134 @@
+import os
+import re
+import struct
+import socket
+import pytest
+import shakti
+from conftest import local_listener
+
+
+@pytest.mark.skip_linux(6.11)
+def test_stream():
+    with pytest.raises(ValueError, match=re.escape('can not be `0`')):
+        shakti.Stream(0, 0)
+    shakti.run(stream())
+
+
+async def stream():
+    server_fd, port = await local_listener()
+    try:
+        client_fd = await shakti.socket()
+        await shakti.connect(client_fd, '127.0.0.1', port)
+        conn_fd = await shakti.accept(server_fd)
+        async with shakti.Stream(conn_fd, 8, limit=32) as stream:
+            await shakti.sendall(client_fd, b'GET / HTTP/1.1\r\nHost: localhost\r\n\r\nhello')
+            assert await stream.readline() == b'GET / HTTP/1.1\r\n'
+            assert await stream.readuntil(b'\r\n\r\n') == b'Host: localhost\r\n\r\n'
+            assert await stream.readexactly(3) == b'hel'
+            assert len(stream) == 2
+            assert await stream.read(10) == b'lo'  # buffered only
+
+            data = bytes(range(256)) * 4
+            await shakti.sendall(client_fd, data)
+            assert await stream.readexactly(1000) == data[:1000]  # bigger than buffer
+            assert await stream.read(100) == data[1000:]
+
+            await shakti.sendall(client_fd, b'x' * 40)
+            with pytest.raises(ValueError, match='32 bytes limit'):
+                await stream.readuntil(b'\n')
+            assert await stream.readexactly(40) == b'x' * 40
+
+            await shakti.sendall(client_fd, b'line\nlast')
+            await shakti.shutdown(client_fd, shakti.SHUT_WR)
+            assert await stream.readline() == b'line\n'
+            with pytest.raises(EOFError):
+                await stream.readexactly(10)
+            assert await stream.readline() == b'last'
+            assert await stream.readline() == b''
+            assert await stream.read() == b''
+            assert stream.eof
+        assert not stream
+        await shakti.close(client_fd)
+    finally:
+        await shakti.close(server_fd)
+
+
+@pytest.mark.skip_linux(6.11)
+def test_stream_write():
+    with pytest.raises(ValueError, match=re.escape('can not be `> high`')):
+        shakti.Stream(0, high=1, low=2)
+    with pytest.raises(shakti.UnsupportedOperation, match='must be awaited'):
+        shakti.Stream(0).write(b'hi')
+    shakti.run(stream_write())
+
+
+async def stream_write():
+    server_fd, port = await local_listener()
+    try:
+        client_fd = await shakti.socket()
+        await shakti.connect(client_fd, '127.0.0.1', port)
+        conn_fd = await shakti.accept(server_fd)
+        async with shakti.Stream(conn_fd, high=8, low=4) as stream:
+            for i in range(100):  # same iteration, sent together
+                stream.write(b'%d,' % i)
+            assert stream.pending == 290
+            await stream.drain()
+            assert stream.pending <= 4
+            await stream.flush()
+            assert stream.pending == 0
+            expect = b''.join(b'%d,' % i for i in range(100))
+            assert await shakti.recv(client_fd, 1024) == expect
+
+            stream.cork()
+            stream.writelines([b'a', bytearray(b'b'), memoryview(b'c')])
+            await shakti.sleep(.001)
+            assert stream.pending == 3  # held
+            stream.write(b'd')
+            stream.uncork()
+            await stream.flush()
+            assert await shakti.recv(client_fd, 1024) == b'abcd'
+
+            await shakti.task(write_later(stream))
+            await shakti.sleep(.001)
+            stream.write(b'bye')  # flushed on `close`
+        assert await shakti.recv(client_fd, 1024) == b'laterbye'
+        await shakti.close(client_fd)
+    finally:
+        await shakti.close(server_fd)
+
+
+async def write_later(stream):
+    stream.write(b'later')
+
+
+@pytest.mark.skip_linux(6.11)
+def test_stream_close_error():
+    shakti.run(stream_close_error())
+
+
+async def stream_close_error():
+    server_fd, port = await local_listener()
+    try:
+        for block in (False, True):
+            client = socket.create_connection(('127.0.0.1', port))
+            conn_fd = await shakti.accept(server_fd)
+            # peer resets connection
+            client.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+            client.close()
+            stream = await shakti.Stream(conn_fd)
+            if block:  # error inside block is raised, socket is still closed
+                with pytest.raises(ZeroDivisionError):
+                    async with stream:
+                        stream.write(b'hello')
+                        await shakti.sleep(.001)
+                        1/0
+            else:
+                stream.write(b'hello')
+                await shakti.sleep(.001)
+                with pytest.raises(OSError):
+                    await stream.close()
+            assert stream.fileno == -1
+            with pytest.raises(OSError):
+                os.fstat(conn_fd)
+    finally:
+        await shakti.close(server_fd)
@@ -15,3 +15,7 @@ async def error():
 
     with pytest.raises(shakti.ConnectionNotEstablishedError):
         raise shakti.ConnectionNotEstablishedError()
+
+    with pytest.raises(shakti.HTTPError) as e:
+        raise shakti.HTTPError(413, 'body too large')
+    assert (e.value.status, e.value.message) == (413, 'body too large')